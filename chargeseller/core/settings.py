@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'seller.middleware.QueryInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -80,6 +81,17 @@ DATABASES = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
          'ATOMIC_REQUESTS': True,
+        # WAL lets readers run alongside the single writer and busy_timeout
+        # waits for the write lock instead of failing at once. Transactions
+        # stay DEFERRED so atomic reads never take that lock; writers go
+        # through seller.db.atomic_with_retry, which begins IMMEDIATE.
+        'OPTIONS': {
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                'PRAGMA busy_timeout=5000;'
+            ),
+        },
     }
 }
 
@@ -128,8 +140,50 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'seller.User'
 
+# Number of balance stripes per seller. Values above 1 spread each seller's
+# balance over that many rows so concurrent charges do not serialize on
+# sellers.balance; 1 keeps the single-row balance.
+SELLER_BALANCE_STRIPES = 1
+
+# Write views replay their transaction on "database is locked" with
+# exponential backoff (seconds) capped at the max delay.
+SELLER_DB_RETRY_ATTEMPTS = 5
+SELLER_DB_RETRY_BASE_DELAY = 0.05
+SELLER_DB_RETRY_MAX_DELAY = 1.0
+
+# Seconds between checks of the phone number cache version, so changes made
+# by other processes show up within this delay.
+SELLER_PHONE_CACHE_CHECK_INTERVAL = 5
+
+# Larger phone number tables are not copied into each process; charge
+# validation then looks every number up with its own query.
+SELLER_PHONE_CACHE_MAX_ROWS = 50000
+
+# Settled ledger rows older than this many days are moved to the archive
+# tables by the archive_ledger command.
+SELLER_ARCHIVE_RETENTION_DAYS = 180
+
+# checkpoint_balances records a balance checkpoint for sellers with at least
+# this many transactions since their last one.
+SELLER_BALANCE_CHECKPOINT_EVERY = 1000
+
+# Token buckets per seller: "burst" requests at once, refilled at "rate" per
+# second. Views with a throttle_scope listed here get their own bucket, the
+# others share "default".
+SELLER_RATE_LIMITS = {
+    "default": {"burst": 1000, "rate": 100},
+}
+
 REST_FRAMEWORK = {
         'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+        # orjson Serves JSON, Bulk Consumers Can Ask For MessagePack Or Arrow
+        'DEFAULT_RENDERER_CLASSES': [
+            'seller.renderers.ORJSONRenderer',
+            'rest_framework.renderers.BrowsableAPIRenderer',
+            'seller.renderers.MessagePackRenderer',
+            'seller.renderers.ArrowStreamRenderer',
+        ],
+        'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'seller.renderers.AvailableRendererNegotiation',
     }
 
 SPECTACULAR_SETTINGS = {
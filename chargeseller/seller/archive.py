@@ -0,0 +1,103 @@
+import heapq
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .db import atomic_with_retry
+from .filters import parse_date_bound
+from .models import (
+    ArchivedChargeOrder,
+    ArchivedTransaction,
+    ArchiveWatermark,
+    ChargeJob,
+    ChargeOrder,
+    Seller,
+    Transaction,
+)
+
+# Pending Rows Still Change, Only Settled Ones Are Archived
+ARCHIVABLE_STATUSES = (
+    Transaction.COMPLETESTATUS,
+    Transaction.FAILDSTATUS,
+    Transaction.CANCELEDSTATUS,
+)
+
+
+def columns(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def archive_cutoff(retention_days=None):
+    if retention_days is None:
+        retention_days = settings.SELLER_ARCHIVE_RETENTION_DAYS
+    return timezone.now() - timedelta(days=retention_days)
+
+
+def move_rows(model, archive_model, ids):
+    rows = model.objects.filter(id__in=ids).values(*columns(archive_model))
+    archive_model.objects.bulk_create([archive_model(**row) for row in rows])
+    # Unfiltered Listings Lose These Rows, So Their ETags Must Change
+    Seller.bump_ledger_version(model.objects.filter(id__in=ids).values("seller"))
+    # The Rows Now Live In The Archive, So They Leave For Real
+    model.all_objects.filter(id__in=ids).delete()
+
+
+@atomic_with_retry
+def archive_transaction_batch(cutoff, batch_size):
+    ids = list(
+        Transaction.objects.filter(
+            created_at__lt=cutoff, status__in=ARCHIVABLE_STATUSES
+        )
+        .order_by("created_at", "id")
+        .values_list("id", flat=True)[:batch_size]
+    )
+    if ids:
+        move_rows(Transaction, ArchivedTransaction, ids)
+    return len(ids)
+
+
+@atomic_with_retry
+def archive_charge_order_batch(cutoff, batch_size):
+    # Orders Go Once Their Transaction Is Archived And No Job Is In Flight
+    ids = list(
+        ChargeOrder.objects.filter(created_at__lt=cutoff, transaction__isnull=True)
+        .exclude(job__status__in=[ChargeJob.PENDINGSTATUS, ChargeJob.PROCESSINGSTATUS])
+        .order_by("created_at", "id")
+        .values_list("id", flat=True)[:batch_size]
+    )
+    if ids:
+        move_rows(ChargeOrder, ArchivedChargeOrder, ids)
+    return len(ids)
+
+
+def needs_archive(params, name=ArchiveWatermark.TRANSACTIONS):
+    """Whether the date range in ``params`` reaches rows older than the watermark.
+
+    Listings without a date filter only show live rows.
+    """
+    if not has_date_range(params):
+        return False
+    return reaches_below(params, ArchiveWatermark.get(name))
+
+
+async def aneeds_archive(params, name=ArchiveWatermark.TRANSACTIONS):
+    if not has_date_range(params):
+        return False
+    return reaches_below(params, await ArchiveWatermark.aget(name))
+
+
+def has_date_range(params):
+    return bool(params.get("date_from", None) or params.get("date_to", None))
+
+
+def reaches_below(params, watermark):
+    if watermark is None:
+        return False
+    date_from = params.get("date_from", None)
+    return not date_from or parse_date_bound(date_from, "date_from") < watermark
+
+
+def merge_by_id(*rows, key=lambda row: row[0]):
+    """Merge iterators of tuples already ordered by id in the first column."""
+    return heapq.merge(*rows, key=key)
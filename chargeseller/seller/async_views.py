@@ -0,0 +1,209 @@
+import base64
+import binascii
+from functools import wraps
+
+from django.contrib.auth import aauthenticate
+from django.db import transaction
+from django.db.models import Sum
+from django.http import Http404, HttpResponse
+from rest_framework import exceptions
+from rest_framework.request import Request
+
+from .archive import aneeds_archive
+from .conditional import aledger_etag, not_modified, with_etag
+from .fast_serializers import charge_order_values, transaction_values
+from .filters import (
+    DAILY_SUMMARY_AGGREGATES,
+    LEDGER_AGGREGATES,
+    filter_daily_summaries,
+    filter_transactions,
+    merge_totals,
+)
+from .models import (
+    ArchivedTransaction,
+    ChargeOrder,
+    Seller,
+    Transaction,
+    TransactionDailySummary,
+    balance_stripe_count,
+)
+from .pagination import KeysetPagination
+from .renderers import ORJSONRenderer
+from .serializers import SellerSerializer
+
+renderer = ORJSONRenderer()
+
+
+def render(data, status_code=200, headers=None):
+    return HttpResponse(
+        renderer.render(data),
+        content_type="application/json",
+        status=status_code,
+        headers=headers,
+    )
+
+
+def is_seller(user):
+    return bool(getattr(user, "is_seller", False))
+
+
+def is_admin(user):
+    return bool(user.is_staff)
+
+
+async def authenticate(request):
+    """Session user, else HTTP Basic credentials, as DRF's default authenticators."""
+    user = await request.auser()
+    if user.is_authenticated:
+        return user
+
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "basic" or not credentials:
+        return user
+    try:
+        username, _, password = (
+            base64.b64decode(credentials).decode("utf-8").partition(":")
+        )
+    except (binascii.Error, UnicodeDecodeError):
+        raise exceptions.AuthenticationFailed(
+            "Invalid basic header. Credentials not correctly base64 encoded."
+        )
+    basic_user = await aauthenticate(request, username=username, password=password)
+    if basic_user is None or not basic_user.is_active:
+        raise exceptions.AuthenticationFailed("Invalid username/password.")
+    return basic_user
+
+
+def async_endpoint(permission=None):
+    """Turn ``view(request, user, ...)`` into an async GET view returning JSON.
+
+    Views return the data to render, or a ready response such as a 304.
+    Errors are rendered the way DRF's exception handler renders them, so
+    the async endpoints answer exactly like their sync counterparts.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method != "GET":
+                return render(
+                    {"detail": f'Method "{request.method}" not allowed.'}, 405
+                )
+            try:
+                user = await authenticate(request)
+                if permission is not None and not permission(user):
+                    if not user.is_authenticated:
+                        raise exceptions.NotAuthenticated()
+                    raise exceptions.PermissionDenied()
+                result = await view(Request(request), user, *args, **kwargs)
+                if isinstance(result, HttpResponse):
+                    return result
+                return render(result)
+            except Http404 as e:
+                return render({"detail": str(e)}, 404)
+            except exceptions.APIException as e:
+                headers = {}
+                if isinstance(
+                    e, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)
+                ):
+                    headers["WWW-Authenticate"] = 'Basic realm="api"'
+                detail = e.detail
+                if not isinstance(detail, (list, dict)):
+                    detail = {"detail": detail}
+                return render(detail, e.status_code, headers)
+
+        # ATOMIC_REQUESTS Cannot Wrap Async Views, These Only Read Anyway
+        return transaction.non_atomic_requests(wrapper)
+
+    return decorator
+
+
+async def transaction_querysets(params):
+    querysets = [filter_transactions(Transaction.objects.all(), params)]
+    if await aneeds_archive(params):
+        querysets.append(filter_transactions(ArchivedTransaction.objects.all(), params))
+    return querysets
+
+
+@async_endpoint()
+async def transaction_list(request, user):
+    # Only A Single Seller's Listing Has A Version To Key An ETag On
+    etag = None
+    seller = request.query_params.get("seller", "")
+    if seller.isdigit():
+        _, etag = await aledger_etag(renderer.media_type, id=seller)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+    querysets = await transaction_querysets(request.query_params)
+    paginator = KeysetPagination()
+    page = await paginator.apaginate_querysets(
+        [transaction_values.values(queryset) for queryset in querysets], request
+    )
+    data = paginator.get_paginated_response(transaction_values.render(page)).data
+    return with_etag(render(data), etag)
+
+
+@async_endpoint()
+async def transaction_detail(request, user, pk):
+    for model in (Transaction, ArchivedTransaction):
+        queryset = transaction_values.values(model.objects.filter(pk=pk))
+        rows = [row async for row in queryset.aiterator()]
+        if rows:
+            return transaction_values.render(rows)[0]
+    raise Http404("No Transaction matches the given query.")
+
+
+@async_endpoint()
+async def transaction_summary(request, user):
+    params = request.query_params
+    summaries = filter_daily_summaries(TransactionDailySummary.objects.all(), params)
+    if summaries is not None:
+        row = await summaries.order_by().aaggregate(**DAILY_SUMMARY_AGGREGATES)
+        return merge_totals([row])
+
+    # Phone Number And Status Filters Need The Ledger Itself
+    rows = []
+    for queryset in await transaction_querysets(params):
+        rows.append(await queryset.order_by().aaggregate(**LEDGER_AGGREGATES))
+    return merge_totals(rows)
+
+
+@async_endpoint(permission=is_seller)
+async def charge_order_list(request, user):
+    seller_id, etag = await aledger_etag(renderer.media_type, user=user)
+    if seller_id is None:
+        raise exceptions.PermissionDenied()
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
+
+    paginator = KeysetPagination()
+    page = await paginator.apaginate_querysets(
+        [
+            charge_order_values.values(
+                ChargeOrder.objects.filter(seller_id=seller_id), "created_at"
+            )
+        ],
+        request,
+    )
+    data = paginator.get_paginated_response(charge_order_values.render(page)).data
+    return with_etag(render(data), etag)
+
+
+@async_endpoint(permission=is_admin)
+async def seller_detail(request, user, pk):
+    _, etag = await aledger_etag(renderer.media_type, id=pk)
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
+
+    queryset = Seller.objects.all()
+    if balance_stripe_count() > 1:
+        queryset = queryset.annotate(striped_balance=Sum("balance_stripes__balance"))
+    try:
+        seller = await queryset.aget(pk=pk)
+    except Seller.DoesNotExist:
+        raise Http404("No Seller matches the given query.")
+    return with_etag(render(SellerSerializer(seller).data), etag)
@@ -0,0 +1,51 @@
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, connections
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextmanager
+def throwaway_database():
+    """Run the block against a migrated scratch database, dropped afterwards.
+
+    The database is a file so that every thread can open its own connection.
+    """
+    setup_test_environment()
+    with tempfile.TemporaryDirectory() as directory:
+        connection.settings_dict["TEST"]["NAME"] = str(
+            Path(directory) / "bench.sqlite3"
+        )
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            yield
+        finally:
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
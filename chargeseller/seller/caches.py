@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from django.conf import settings
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire after a time-to-live.
+
+    Values live only in the current process, so callers must treat a miss
+    as "unknown" and fall back to the database.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Charge idempotency keys of committed charge orders: (seller_id, key) -> order id
+idempotency_keys = TTLCache(maxsize=10000, ttl=600)
+
+
+class PhoneNumberEntry(NamedTuple):
+    id: int
+    phone_number: str
+    is_active: bool
+
+    def instance(self):
+        from .models import PhoneNumber
+
+        return PhoneNumber.from_db(
+            "default", ["id", "phone_number", "is_active"], tuple(self)
+        )
+
+
+class PhoneNumberCache:
+    """Process-local copy of the phone_numbers table, by id.
+
+    The table is loaded on first use. Saves and deletes in this process
+    clear it through signals; changes made by other processes are noticed
+    by comparing the table's CacheVersion, checked at most once every
+    SELLER_PHONE_CACHE_CHECK_INTERVAL seconds. Tables above
+    SELLER_PHONE_CACHE_MAX_ROWS are not copied, each lookup is one query.
+    """
+
+    def __init__(self):
+        self._by_id = None
+        self._loaded = False
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, pk):
+        by_id = self._table()
+        if by_id is None:
+            return self._lookup(pk)
+        return by_id.get(pk)
+
+    def warm(self):
+        """Load or revalidate the table now, ahead of a write transaction."""
+        self._table()
+
+    def invalidate(self):
+        with self._lock:
+            self._by_id = None
+            self._loaded = False
+
+    @staticmethod
+    def _lookup(pk):
+        from .models import PhoneNumber
+
+        row = (
+            PhoneNumber.objects.filter(id=pk)
+            .values_list("id", "phone_number", "is_active")
+            .first()
+        )
+        return None if row is None else PhoneNumberEntry(*row)
+
+    def _table(self):
+        from .models import CacheVersion, PhoneNumber
+
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded:
+                if now - self._checked_at < settings.SELLER_PHONE_CACHE_CHECK_INTERVAL:
+                    return self._by_id
+                self._checked_at = now
+                if CacheVersion.current(CacheVersion.PHONE_NUMBERS) == self._version:
+                    return self._by_id
+
+            # Read The Version First So A Concurrent Change Triggers Another Load
+            self._version = CacheVersion.current(CacheVersion.PHONE_NUMBERS)
+            self._checked_at = now
+            self._loaded = True
+            limit = settings.SELLER_PHONE_CACHE_MAX_ROWS
+            entries = [
+                PhoneNumberEntry(*row)
+                for row in PhoneNumber.objects.values_list(
+                    "id", "phone_number", "is_active"
+                )[: limit + 1]
+            ]
+            if len(entries) > limit:
+                self._by_id = None
+                return None
+
+            self._by_id = {entry.id: entry for entry in entries}
+            return self._by_id
+
+
+phone_numbers = PhoneNumberCache()
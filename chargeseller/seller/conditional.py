@@ -0,0 +1,48 @@
+from django.utils.cache import get_conditional_response, patch_vary_headers
+
+from .models import Seller
+
+
+def ledger_etag(media_type, **lookup):
+    """``(seller_id, etag)`` of the seller matching ``lookup``, in one indexed read.
+
+    The etag is per representation, ``media_type`` is the rendered one.
+    Returns ``(None, None)`` when no seller matches.
+    """
+    row = Seller.ledger_versions().filter(**lookup).values_list("id", "version").first()
+    return etag_of(row, media_type)
+
+
+async def aledger_etag(media_type, **lookup):
+    row = (
+        await Seller.ledger_versions()
+        .filter(**lookup)
+        .values_list("id", "version")
+        .afirst()
+    )
+    return etag_of(row, media_type)
+
+
+def etag_of(row, media_type):
+    if row is None:
+        return None, None
+    seller_id, version = row
+    return seller_id, f'"{seller_id}.{version}.{media_type}"'
+
+
+def not_modified(request, etag):
+    """A 304 when ``If-None-Match`` already holds ``etag``, else ``None``."""
+    if etag is None:
+        return None
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept"])
+    return response
+
+
+def with_etag(response, etag):
+    if etag is not None and response.status_code == 200:
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept"])
+    return response
@@ -0,0 +1,80 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+def is_lock_error(error):
+    return "database is locked" in str(error) or "database table is locked" in str(
+        error
+    )
+
+
+@contextmanager
+def immediate_atomic(using=DEFAULT_DB_ALIAS):
+    """``transaction.atomic()`` whose outermost BEGIN takes the write lock at once.
+
+    Only writers use it: a transaction that reads first and upgrades later
+    can fail mid-way when another writer committed in between, while plain
+    reads keep the DEFERRED default and never queue for the write lock.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        with transaction.atomic(using=using):
+            yield
+        return
+
+    # The Mode Is Read From OPTIONS On Connect, So Connect Before Overriding It
+    connection.ensure_connection()
+    default_mode = connection.transaction_mode
+    connection.transaction_mode = "IMMEDIATE"
+    try:
+        with transaction.atomic(using=using):
+            yield
+    finally:
+        connection.transaction_mode = default_mode
+
+
+def atomic_with_retry(func=None, *, using=DEFAULT_DB_ALIAS):
+    """Run ``func`` in its own transaction, retrying when SQLite is locked.
+
+    The whole transaction is replayed, so the wrapped callable must not have
+    side effects outside the database. When already inside a transaction the
+    call is only wrapped in a savepoint and lock errors are re-raised, since
+    the outer transaction cannot be retried from here.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            attempts = settings.SELLER_DB_RETRY_ATTEMPTS
+            for attempt in range(1, attempts + 1):
+                outermost = not connections[using].in_atomic_block
+                try:
+                    with immediate_atomic(using=using):
+                        return func(*args, **kwargs)
+                except OperationalError as e:
+                    if not outermost or not is_lock_error(e) or attempt == attempts:
+                        raise
+                    delay = min(
+                        settings.SELLER_DB_RETRY_MAX_DELAY,
+                        settings.SELLER_DB_RETRY_BASE_DELAY * 2 ** (attempt - 1),
+                    )
+                    logger.info(
+                        f"Retrying {func.__qualname__} after lock contention "
+                        f"(attempt {attempt} of {attempts})"
+                    )
+                    # Jitter Keeps Contending Writers From Retrying In Lockstep
+                    time.sleep(delay * random.uniform(0.5, 1))
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -0,0 +1,155 @@
+import csv
+import io
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+
+from .renderers import msgpack, pyarrow, to_minor_units
+
+TRANSACTION_EXPORT_FIELDS = [
+    "id",
+    "reference_id",
+    "seller_id",
+    "transaction_type",
+    "status",
+    "amount",
+    "balance_before",
+    "balance_after",
+    "balance_stripe",
+    "credit_request_id",
+    "charge_order_id",
+    "phone_number_id",
+    "processed_by_id",
+    "processed_at",
+    "created_at",
+]
+
+MONEY_COLUMNS = [
+    TRANSACTION_EXPORT_FIELDS.index(name)
+    for name in ("amount", "balance_before", "balance_after")
+]
+
+# Rows are joined into one chunk before being handed to the response/file
+ROWS_PER_CHUNK = 500
+
+
+def export_rows(queryset, chunk_size=2000):
+    """Stream ledger rows as tuples without building model instances."""
+    return (
+        queryset.order_by("id")
+        .values_list(*TRANSACTION_EXPORT_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def encode_value(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_ndjson(rows):
+    lines = []
+    for row in rows:
+        record = dict(zip(TRANSACTION_EXPORT_FIELDS, map(encode_value, row)))
+        lines.append(orjson.dumps(record))
+        if len(lines) == ROWS_PER_CHUNK:
+            yield b"\n".join(lines).decode() + "\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines).decode() + "\n"
+
+
+def iter_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(TRANSACTION_EXPORT_FIELDS)
+
+    pending = 0
+    for row in rows:
+        writer.writerow(map(encode_value, row))
+        pending += 1
+        if pending == ROWS_PER_CHUNK:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+def minor_unit_rows(rows):
+    for row in rows:
+        row = list(row)
+        for index in MONEY_COLUMNS:
+            row[index] = to_minor_units(row[index])
+        yield row
+
+
+def chunked(rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == ROWS_PER_CHUNK:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_msgpack(rows):
+    """One MessagePack map per row, back to back, amounts in minor units."""
+    packer = msgpack.Packer(use_bin_type=True, datetime=True)
+    for chunk in chunked(minor_unit_rows(rows)):
+        yield b"".join(
+            packer.pack(dict(zip(TRANSACTION_EXPORT_FIELDS, row))) for row in chunk
+        )
+
+
+def arrow_schema():
+    timestamp = pyarrow.timestamp("us", tz="UTC")
+    types = {"reference_id": pyarrow.string()}
+    types.update(processed_at=timestamp, created_at=timestamp)
+    return pyarrow.schema(
+        [(name, types.get(name, pyarrow.int64())) for name in TRANSACTION_EXPORT_FIELDS]
+    )
+
+
+def iter_arrow(rows):
+    """An Arrow IPC stream with one record batch per chunk of rows."""
+    schema = arrow_schema()
+    buffer = io.BytesIO()
+    with pyarrow.ipc.new_stream(buffer, schema) as writer:
+        for chunk in chunked(minor_unit_rows(rows)):
+            writer.write_batch(
+                pyarrow.RecordBatch.from_arrays(
+                    [
+                        pyarrow.array(column, type=field.type)
+                        for column, field in zip(zip(*chunk), schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield drain(buffer)
+    yield drain(buffer)
+
+
+def drain(buffer):
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+EXPORT_FORMATS = {
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+    "csv": (iter_csv, "text/csv"),
+}
+# Binary Formats Are Offered When Their Library Is Installed
+if msgpack is not None:
+    EXPORT_FORMATS["msgpack"] = (iter_msgpack, "application/msgpack")
+if pyarrow is not None:
+    EXPORT_FORMATS["arrow"] = (iter_arrow, "application/vnd.apache.arrow.stream")
+BINARY_EXPORT_FORMATS = {"msgpack", "arrow"}
@@ -0,0 +1,206 @@
+from datetime import timedelta, timezone as dt_timezone
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .serializers import (
+    ChargeOrderSerializer,
+    CreditRequestSerializer,
+    LedgerEventSerializer,
+    TransactionSerializer,
+)
+
+# Fields Whose DRF Representation Of A values() Column Is The Value Itself
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.IntegerField,
+)
+
+
+def passthrough(value):
+    return value
+
+
+def decimal_converter(field):
+    coerce_to_string = getattr(
+        field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING
+    )
+    if (
+        not coerce_to_string
+        or field.localize
+        or field.normalize_output
+        or field.decimal_places is None
+    ):
+        return field.to_representation
+    exponent = -field.decimal_places
+
+    def convert(value):
+        # The Model Field Already Quantized The Column On Read
+        if value.as_tuple().exponent == exponent:
+            return f"{value:f}"
+        return field.to_representation(value)
+
+    return convert
+
+
+def datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = field.default_timezone()
+    if output_format != ISO_8601 or (
+        field_timezone is not None and field_timezone.utcoffset(None) != timedelta(0)
+    ):
+        return field.to_representation
+
+    def convert(value):
+        # Columns Come Back In UTC, Which Is Already The Output Time Zone
+        if value.tzinfo is not dt_timezone.utc:
+            return field.to_representation(value)
+        return value.isoformat()[:-6] + "Z"
+
+    return convert
+
+
+def field_converter(field):
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        if field.pk_field is not None:
+            return field.pk_field.to_representation
+        return passthrough
+    if isinstance(field, serializers.DecimalField):
+        return decimal_converter(field)
+    if isinstance(field, serializers.DateTimeField):
+        return datetime_converter(field)
+    if isinstance(field, serializers.ChoiceField):
+        # Integer Choice Keys Map Back To The Stored Integer
+        if all(type(key) is int for key in field.choices):
+            return passthrough
+        return field.to_representation
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return passthrough
+    if isinstance(field, serializers.RelatedField):
+        raise ImproperlyConfigured(
+            f"{type(field).__name__} {field.field_name!r} needs a model instance"
+        )
+    return field.to_representation
+
+
+class ValuesSerializer:
+    """Read-only rendering of ``values()`` rows, matching a ModelSerializer.
+
+    Field converters are worked out once from the serializer's own fields,
+    so the output is what ``serializer_class(instances, many=True).data``
+    would produce without building model instances. ``overrides`` replaces
+    the converter of a field, for serializers that rewrite values in
+    ``to_representation``.
+    """
+
+    def __init__(self, serializer_class, overrides=None, prefix=""):
+        serializer = serializer_class()
+        self.model = serializer.Meta.model
+        self.prefix = prefix
+        self.plan = []
+        self.nested_many = []
+        self.overrides = overrides or {}
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.ListSerializer):
+                self.plan.append((name, None, None))
+                self.nested_many.append((name, self.related_many(field)))
+            elif isinstance(field, serializers.BaseSerializer):
+                nested = ValuesSerializer(
+                    type(field), prefix=f"{prefix}{field.source}__"
+                )
+                self.plan.append((name, nested, None))
+            else:
+                column = prefix + field.source.replace(".", "__")
+                self.plan.append((name, column, field))
+
+    def related_many(self, field):
+        relation = self.model._meta.get_field(field.source)
+        child = ValuesSerializer(type(field.child))
+        return child, relation.field.name
+
+    @property
+    def columns(self):
+        columns = []
+        for _, column, _ in self.plan:
+            if isinstance(column, ValuesSerializer):
+                columns.extend(column.columns)
+            elif column is not None:
+                columns.append(column)
+        return columns
+
+    def values(self, queryset, *extra):
+        return queryset.prefetch_related(None).values(*self.columns, *extra)
+
+    def bind(self):
+        """Resolve converters for the active time zone and settings."""
+        plan = []
+        for name, column, field in self.plan:
+            if isinstance(column, ValuesSerializer):
+                plan.append((name, column.bind(), None))
+            elif column is None:
+                plan.append((name, None, None))
+            else:
+                converter = self.overrides.get(name) or field_converter(field)
+                plan.append((name, column, converter))
+        return BoundValuesSerializer(self.prefix, plan)
+
+    def render(self, rows):
+        """Return the listing for ``rows``, fetching nested lists in one query each."""
+        rows = list(rows)
+        ids = [row[f"{self.prefix}id"] for row in rows]
+        for name, (child, fk_name) in self.nested_many:
+            bound_child = child.bind()
+            related = {pk: [] for pk in ids}
+            queryset = child.model._default_manager.filter(**{f"{fk_name}__in": ids})
+            # Leading With The Foreign Key Lets (fk, ordering) Indexes Skip The Sort
+            ordering = list(child.model._meta.ordering or ["pk"])
+            direction = "-" if ordering[0].startswith("-") else ""
+            queryset = queryset.order_by(f"{direction}{fk_name}", *ordering)
+            for child_row in queryset.values(*child.columns, fk_name):
+                related[child_row[fk_name]].append(
+                    bound_child.to_representation(child_row)
+                )
+            for row in rows:
+                row[name] = related[row[f"{self.prefix}id"]]
+
+        bound = self.bind()
+        return [bound.to_representation(row) for row in rows]
+
+
+class BoundValuesSerializer:
+    def __init__(self, prefix, plan):
+        self.prefix = prefix
+        self.plan = plan
+
+    def to_representation(self, row):
+        representation = {}
+        for name, column, converter in self.plan:
+            if isinstance(column, BoundValuesSerializer):
+                # A Missing Related Row Renders As null
+                if row[f"{column.prefix}id"] is None:
+                    representation[name] = None
+                else:
+                    representation[name] = column.to_representation(row)
+            elif column is None:
+                representation[name] = row[name]
+            else:
+                value = row[column]
+                representation[name] = None if value is None else converter(value)
+        return representation
+
+
+def credit_request_status(value):
+    return CreditRequestSerializer.STATUS_MAP.get(str(value), str(value))
+
+
+transaction_values = ValuesSerializer(TransactionSerializer)
+charge_order_values = ValuesSerializer(ChargeOrderSerializer)
+credit_request_values = ValuesSerializer(
+    CreditRequestSerializer, overrides={"status": credit_request_status}
+)
+ledger_event_values = ValuesSerializer(LedgerEventSerializer)
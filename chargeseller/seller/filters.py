@@ -0,0 +1,192 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from .models import Transaction
+
+
+def parse_day(value, name):
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ValidationError({name: "Enter a date in YYYY-MM-DD format."})
+    return day
+
+
+def parse_date_bound(value, name, end=False):
+    """Turn a ``YYYY-MM-DD`` parameter into an aware datetime bound.
+
+    ``date_from`` maps to the start of the day; ``date_to`` (``end=True``)
+    maps to the start of the next day so the range is inclusive.
+    """
+    day = parse_day(value, name)
+    bound = timezone.make_aware(datetime.combine(day, time.min))
+    if end:
+        bound += timedelta(days=1)
+    return bound
+
+
+def parse_moment(value, name):
+    """Turn an ISO 8601 datetime, or a date meaning its start, into an aware datetime."""
+    try:
+        moment = parse_datetime(value or "")
+    except ValueError:
+        moment = None
+    if moment is None:
+        try:
+            return parse_date_bound(value or "", name)
+        except ValidationError:
+            raise ValidationError(
+                {
+                    name: "Enter an ISO 8601 datetime "
+                    "(YYYY-MM-DDTHH:MM[:SS][+HH:MM]) or a date in YYYY-MM-DD format."
+                }
+            ) from None
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def parse_choice(value, choices, name):
+    """Turn a parameter into one of the integer ``choices`` values."""
+    try:
+        choice = int(value)
+    except (TypeError, ValueError):
+        choice = None
+    if choice not in dict(choices):
+        raise ValidationError(
+            {name: f"Choose one of: {', '.join(str(key) for key, _ in choices)}."}
+        )
+    return choice
+
+
+def parse_id(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({name: "Enter a whole number."})
+
+
+def filter_transactions(queryset, params):
+    """Apply the ledger filters shared by the API and management commands."""
+    transaction_type = params.get("type", None)
+    seller = params.get("seller", None)
+    phone_number = params.get("phone_number", None)
+    status = params.get("status", None)
+    date_from = params.get("date_from", None)
+    date_to = params.get("date_to", None)
+
+    if transaction_type:
+        queryset = queryset.filter(
+            transaction_type=parse_choice(
+                transaction_type, Transaction.TRANSACTION_TYPE_CHOICES, "type"
+            )
+        )
+
+    if seller:
+        queryset = queryset.filter(seller=parse_id(seller, "seller"))
+
+    if phone_number:
+        queryset = queryset.filter(phone_number=parse_id(phone_number, "phone_number"))
+
+    if status:
+        queryset = queryset.filter(
+            status=parse_choice(status, Transaction.STATUS_CHOICES, "status")
+        )
+
+    if date_from:
+        queryset = queryset.filter(
+            created_at__gte=parse_date_bound(date_from, "date_from")
+        )
+
+    if date_to:
+        queryset = queryset.filter(
+            created_at__lt=parse_date_bound(date_to, "date_to", end=True)
+        )
+
+    return queryset
+
+
+def filter_daily_summaries(queryset, params):
+    """Apply the ledger filters a daily summary row can answer.
+
+    Returns ``None`` when a filter needs individual ledger rows.
+    """
+    if params.get("phone_number", None) or params.get("status", None):
+        return None
+
+    transaction_type = params.get("type", None)
+    seller = params.get("seller", None)
+    date_from = params.get("date_from", None)
+    date_to = params.get("date_to", None)
+
+    if transaction_type:
+        queryset = queryset.filter(
+            transaction_type=parse_choice(
+                transaction_type, Transaction.TRANSACTION_TYPE_CHOICES, "type"
+            )
+        )
+
+    if seller:
+        queryset = queryset.filter(seller=parse_id(seller, "seller"))
+
+    if date_from:
+        queryset = queryset.filter(day__gte=parse_day(date_from, "date_from"))
+
+    if date_to:
+        queryset = queryset.filter(day__lte=parse_day(date_to, "date_to"))
+
+    return queryset
+
+
+def type_aggregates(count, total_amount):
+    """One filtered count and amount aggregate per transaction type.
+
+    Filtered aggregates read the matching rows once, where a GROUP BY on
+    the type would sort them in a temp B-tree first. ``count`` and
+    ``total_amount`` build the aggregate for a type filter.
+    """
+    aggregates = {}
+    for transaction_type, _ in TRANSACTION_TYPES:
+        only = Q(transaction_type=transaction_type)
+        aggregates[f"count_{transaction_type}"] = count(only)
+        aggregates[f"total_amount_{transaction_type}"] = total_amount(only)
+    return aggregates
+
+
+def merge_totals(rows):
+    """Add up ``type_aggregates`` results into per type totals, in type order."""
+    totals = {}
+    for row in rows:
+        for transaction_type, _ in TRANSACTION_TYPES:
+            count = row[f"count_{transaction_type}"]
+            if not count:
+                continue
+            total = totals.setdefault(
+                transaction_type,
+                {
+                    "transaction_type": transaction_type,
+                    "count": 0,
+                    "total_amount": Decimal("0"),
+                },
+            )
+            total["count"] += count
+            total["total_amount"] += row[f"total_amount_{transaction_type}"]
+    return [totals[key] for key in sorted(totals)]
+
+
+TRANSACTION_TYPES = sorted(Transaction.TRANSACTION_TYPE_CHOICES)
+LEDGER_AGGREGATES = type_aggregates(
+    lambda only: Count("id", filter=only),
+    lambda only: Sum("amount", filter=only),
+)
+DAILY_SUMMARY_AGGREGATES = type_aggregates(
+    lambda only: Sum("count", filter=only),
+    lambda only: Sum("total_amount", filter=only),
+)
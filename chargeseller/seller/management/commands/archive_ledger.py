@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand
+from seller.archive import (
+    archive_charge_order_batch,
+    archive_cutoff,
+    archive_transaction_batch,
+)
+from seller.models import ArchiveWatermark
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves settled transactions and charge orders older than the retention "
+        "window into the archive tables, one bounded batch per transaction"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            help="Defaults to SELLER_ARCHIVE_RETENTION_DAYS",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=0,
+            help="Stop after this many batches per table; 0 runs until done",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches to leave room for writers",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options["retention_days"])
+
+        # Readers Consult The Archive From Here On, Before Any Row Moves
+        ArchiveWatermark.advance(ArchiveWatermark.TRANSACTIONS, cutoff)
+        ArchiveWatermark.advance(ArchiveWatermark.CHARGE_ORDERS, cutoff)
+
+        transactions = self.drain(archive_transaction_batch, cutoff, options)
+        charge_orders = self.drain(archive_charge_order_batch, cutoff, options)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {transactions} transactions and {charge_orders} "
+                f"charge orders created before {cutoff:%Y-%m-%d %H:%M}"
+            )
+        )
+
+    def drain(self, archive_batch, cutoff, options):
+        moved = 0
+        batches = 0
+        while not options["max_batches"] or batches < options["max_batches"]:
+            count = archive_batch(cutoff, options["batch_size"])
+            if not count:
+                break
+            moved += count
+            batches += 1
+            if options["pause"]:
+                time.sleep(options["pause"])
+        return moved
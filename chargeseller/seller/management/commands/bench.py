@@ -0,0 +1,316 @@
+import base64
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from decimal import Decimal
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import F, Sum
+
+from seller.benchmarks import current_commit, percentile, throwaway_database
+from seller.models import CreditRequest, PhoneNumber, Seller, Transaction, User
+
+PASSWORD = "bench-password"
+DEFAULT_MIX = "charge=70,credit=10,approve=5,list=15"
+OPERATIONS = ("charge", "credit", "approve", "list")
+
+
+def zipf_weights(count, exponent):
+    return [1 / (rank**exponent) for rank in range(1, count + 1)]
+
+
+class InProcessClient:
+    """Drives the app through Django's test client, one client per user."""
+
+    def __init__(self):
+        from rest_framework.test import APIClient
+
+        self.client_class = APIClient
+        self.local = threading.local()
+
+    def request(self, user, method, path, data=None):
+        clients = getattr(self.local, "clients", None)
+        if clients is None:
+            clients = self.local.clients = {}
+        client = clients.get(user.pk)
+        if client is None:
+            client = clients[user.pk] = self.client_class(raise_request_exception=False)
+            client.force_authenticate(user=user)
+
+        response = getattr(client, method)(path, data, format="json")
+        body = getattr(response, "data", None)
+        return response.status_code, body
+
+
+class LiveClient:
+    """Drives a running server over HTTP with basic authentication."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+
+    def request(self, user, method, path, data=None):
+        credentials = base64.b64encode(f"{user.username}:{PASSWORD}".encode())
+        headers = {"Authorization": f"Basic {credentials.decode()}"}
+        url = f"{self.base_url}{path}"
+        payload = None
+        if method == "get" and data:
+            url += "?" + "&".join(f"{key}={value}" for key, value in data.items())
+        elif data is not None:
+            payload = json.dumps(data).encode()
+            headers["Content-Type"] = "application/json"
+
+        request = urllib.request.Request(
+            url, data=payload, headers=headers, method=method.upper()
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.status, json.loads(response.read() or b"null")
+        except urllib.error.HTTPError as error:
+            try:
+                body = json.loads(error.read() or b"null")
+            except ValueError:
+                body = None
+            return error.code, body
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-tests the seller API with a weighted mix of operations and prints "
+        "a JSON report. Without --url the app runs in-process against a "
+        "throwaway database; with --url the data is seeded into the configured "
+        "database, which the server must share."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", help="Base URL of a running server")
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--sellers", type=int, default=20)
+        parser.add_argument("--phones", type=int, default=50)
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of seller popularity, 0 for uniform",
+        )
+        parser.add_argument("--mix", default=DEFAULT_MIX)
+        parser.add_argument("--initial-balance", default="100000.00")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="Write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        mix = self.parse_mix(options["mix"])
+        self.random = random.Random(options["seed"])
+
+        if options["url"]:
+            client = LiveClient(options["url"])
+            database = nullcontext()
+        else:
+            client = InProcessClient()
+            database = throwaway_database()
+
+        with database:
+            self.seed(options)
+            report = self.run(client, mix, options)
+            report["invariants"] = self.check_invariants()
+
+        report["mode"] = "live" if options["url"] else "in-process"
+        report["commit"] = current_commit()
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            Path(options["output"]).write_text(output + "\n")
+        self.stdout.write(output)
+
+    def parse_mix(self, value):
+        mix = {}
+        for part in value.split(","):
+            name, _, weight = part.partition("=")
+            name = name.strip()
+            if name not in OPERATIONS:
+                raise CommandError(f"Unknown operation {name!r} in --mix")
+            try:
+                mix[name] = float(weight)
+            except ValueError:
+                raise CommandError(f"Invalid weight for {name!r} in --mix")
+        return mix
+
+    def seed(self, options):
+        run_id = f"bench{self.random.randrange(10**8)}"
+        balance = Decimal(options["initial_balance"])
+
+        self.admin = User.objects.create_user(
+            f"{run_id}-admin", password=PASSWORD, is_staff=True, is_seller=False
+        )
+        self.sellers = []
+        for index in range(options["sellers"]):
+            user = User.objects.create_user(f"{run_id}-{index}", password=PASSWORD)
+            self.sellers.append(Seller.objects.create(user=user, balance=balance))
+        self.initial_balances = {seller.id: balance for seller in self.sellers}
+
+        PhoneNumber.objects.bulk_create(
+            [
+                PhoneNumber(phone_number=f"09{self.random.randrange(10**9):09d}")
+                for _ in range(options["phones"])
+            ],
+            ignore_conflicts=True,
+        )
+        self.phone_ids = list(PhoneNumber.objects.values_list("id", flat=True))
+        self.seller_weights = zipf_weights(len(self.sellers), options["skew"])
+        self.pending_credit_requests = []
+        self.pending_lock = threading.Lock()
+
+    def plan(self, mix, count):
+        names = list(mix)
+        weights = [mix[name] for name in names]
+        plan = []
+        for operation in self.random.choices(names, weights, k=count):
+            seller = self.random.choices(self.sellers, self.seller_weights)[0]
+            plan.append(
+                (
+                    operation,
+                    seller,
+                    self.random.choice(self.phone_ids),
+                    # A narrow amount range makes retries of the same order likely
+                    Decimal(self.random.randint(1, 20)),
+                )
+            )
+        return plan
+
+    def run(self, client, mix, options):
+        plan = self.plan(mix, options["requests"])
+        latencies = defaultdict(list)
+        status_codes = defaultdict(lambda: defaultdict(int))
+        errors = defaultdict(int)
+        duplicates = 0
+        lock = threading.Lock()
+
+        def execute(step):
+            nonlocal duplicates
+            operation = step[0]
+            started = time.perf_counter()
+            try:
+                code, body = self.perform(client, *step)
+            except Exception:
+                code, body = "exception", None
+            elapsed = (time.perf_counter() - started) * 1000
+
+            with lock:
+                latencies[operation].append(elapsed)
+                status_codes[operation][str(code)] += 1
+                if code == "exception" or code >= 500:
+                    errors[operation] += 1
+                if isinstance(body, dict) and "recent_order_id" in body:
+                    duplicates += 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            list(executor.map(execute, plan))
+        duration = time.perf_counter() - started
+
+        charges = len(latencies.get("charge", []))
+        total_errors = sum(errors.values())
+        return {
+            "requests": len(plan),
+            "concurrency": options["concurrency"],
+            "duration_s": round(duration, 3),
+            "throughput_rps": round(len(plan) / duration, 1) if duration else None,
+            "error_rate": round(total_errors / len(plan), 4) if plan else 0,
+            "duplicate_rate": round(duplicates / charges, 4) if charges else 0,
+            "operations": {
+                operation: {
+                    "count": len(values),
+                    "errors": errors[operation],
+                    "p50_ms": percentile(values, 50),
+                    "p95_ms": percentile(values, 95),
+                    "p99_ms": percentile(values, 99),
+                    "status_codes": dict(status_codes[operation]),
+                }
+                for operation, values in sorted(latencies.items())
+            },
+        }
+
+    def perform(self, client, operation, seller, phone_id, amount):
+        if operation == "charge":
+            return client.request(
+                seller.user,
+                "post",
+                "/charge-orders/",
+                {"seller": seller.id, "phone_number": phone_id, "amount": str(amount)},
+            )
+
+        if operation == "credit":
+            code, body = client.request(
+                seller.user,
+                "post",
+                "/credit-requests/",
+                {"seller": seller.id, "amount": str(amount * 100)},
+            )
+            if code == 201:
+                with self.pending_lock:
+                    self.pending_credit_requests.append(body["id"])
+            return code, body
+
+        if operation == "approve":
+            with self.pending_lock:
+                if not self.pending_credit_requests:
+                    return 204, None
+                credit_request_id = self.pending_credit_requests.pop(0)
+            return client.request(
+                self.admin,
+                "patch",
+                f"/credit-requests/{credit_request_id}/update-status/",
+                {"status": CreditRequest.APPROVEDSTATUS},
+            )
+
+        return client.request(
+            seller.user, "get", "/transactions/", {"seller": seller.id}
+        )
+
+    def check_invariants(self):
+        """Every seller balance must equal its opening balance plus the ledger."""
+        ledger = dict(
+            Transaction.objects.filter(seller__in=self.sellers)
+            .values("seller")
+            .annotate(delta=Sum(F("balance_after") - F("balance_before")))
+            .values_list("seller", "delta")
+        )
+        striped = dict(
+            Seller.objects.filter(id__in=self.initial_balances)
+            .annotate(stripes=Sum("balance_stripes__balance"))
+            .values_list("id", "stripes")
+        )
+        balances = dict(
+            Seller.objects.filter(id__in=self.initial_balances).values_list(
+                "id", "balance"
+            )
+        )
+
+        mismatches = []
+        for seller_id, opening in self.initial_balances.items():
+            balance = striped.get(seller_id)
+            if balance is None:
+                balance = balances[seller_id]
+            expected = opening + Decimal(str(ledger.get(seller_id) or 0))
+            if balance.quantize(Decimal("0.01")) != expected.quantize(Decimal("0.01")):
+                mismatches.append(
+                    {
+                        "seller": seller_id,
+                        "balance": str(balance),
+                        "ledger": str(expected),
+                    }
+                )
+
+        negative = sum(1 for balance in balances.values() if balance < 0)
+        return {
+            "sellers_checked": len(self.initial_balances),
+            "balance_mismatches": mismatches,
+            "negative_balances": negative,
+            "ok": not mismatches and not negative,
+        }
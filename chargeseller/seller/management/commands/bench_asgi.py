@@ -0,0 +1,132 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient, Client
+
+from seller.benchmarks import current_commit, percentile, throwaway_database
+from seller.query_plans import seed
+
+# Sync Path, Async Path And The Sample User Polling Them
+ENDPOINTS = {
+    "transactions": ("/transactions/?seller={seller_id}", "admin"),
+    "transaction": ("/transactions/{transaction_id}/", "admin"),
+    "summary": ("/transactions/summary/?seller={seller_id}", "admin"),
+    "charge-orders": ("/charge-orders-list/", "seller_user"),
+    "seller": ("/sellers/{seller_id}/", "admin"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Polls a read endpoint with many concurrent clients, once through the "
+        "sync views behind a fixed pool of WSGI threads and once through the "
+        "async views on a single event loop, and prints a JSON report"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--endpoint", choices=sorted(ENDPOINTS), default="transactions"
+        )
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument(
+            "--concurrency", type=int, default=100, help="Clients polling at once"
+        )
+        parser.add_argument(
+            "--wsgi-threads",
+            type=int,
+            default=4,
+            help="Requests the WSGI deployment serves at once",
+        )
+        parser.add_argument(
+            "--transactions", type=int, default=5000, help="Ledger rows to seed"
+        )
+        parser.add_argument("--output", help="Also write the report to this file")
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            sample = seed(transactions=options["transactions"])
+            template, user_key = ENDPOINTS[options["endpoint"]]
+            path = template.format(**sample)
+            user = sample[user_key]
+
+            report = {
+                "commit": current_commit(),
+                "endpoint": path,
+                "requests": options["requests"],
+                "concurrency": options["concurrency"],
+                "wsgi_threads": options["wsgi_threads"],
+                "wsgi": self.run_wsgi(path, user, options),
+                "asgi": asyncio.run(self.run_asgi(f"/async{path}", user, options)),
+            }
+
+        output = json.dumps(report, indent=2)
+        self.stdout.write(output)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+
+    def run_wsgi(self, path, user, options):
+        workers = threading.BoundedSemaphore(options["wsgi_threads"])
+        remaining = iter(range(options["requests"]))
+        lock = threading.Lock()
+        latencies = []
+        statuses = {}
+
+        def poll():
+            client = Client()
+            client.force_login(user)
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+                started = time.perf_counter()
+                # A Request Waits For A Free Worker Thread, As In The Deployment
+                with workers:
+                    response = client.get(path)
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+                    statuses[response.status_code] = (
+                        statuses.get(response.status_code, 0) + 1
+                    )
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            for _ in range(options["concurrency"]):
+                executor.submit(poll)
+        return self.summarize(latencies, statuses, time.perf_counter() - started)
+
+    async def run_asgi(self, path, user, options):
+        remaining = iter(range(options["requests"]))
+        latencies = []
+        statuses = {}
+        client = AsyncClient()
+        await client.aforce_login(user)
+
+        async def poll():
+            while next(remaining, None) is not None:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = (
+                    statuses.get(response.status_code, 0) + 1
+                )
+
+        started = time.perf_counter()
+        await asyncio.gather(*(poll() for _ in range(options["concurrency"])))
+        return self.summarize(latencies, statuses, time.perf_counter() - started)
+
+    @staticmethod
+    def summarize(latencies, statuses, elapsed):
+        latencies_ms = [latency * 1000 for latency in latencies]
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+            "p50_ms": percentile(latencies_ms, 50),
+            "p95_ms": percentile(latencies_ms, 95),
+            "p99_ms": percentile(latencies_ms, 99),
+            "status_codes": {str(code): count for code, count in statuses.items()},
+        }
@@ -0,0 +1,108 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from seller.benchmarks import current_commit, throwaway_database
+from seller.exports import EXPORT_FORMATS, export_rows
+from seller.fast_serializers import transaction_values
+from seller.models import Transaction
+from seller.query_plans import seed
+from seller.renderers import (
+    ArrowStreamRenderer,
+    MessagePackRenderer,
+    ORJSONRenderer,
+)
+
+RENDERERS = {
+    "json": JSONRenderer,
+    "orjson": ORJSONRenderer,
+    "msgpack": MessagePackRenderer,
+    "arrow": ArrowStreamRenderer,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares payload size and encode time of the response renderers and "
+        "the streaming export formats against DRF's JSONRenderer on a scratch "
+        "database, and prints a JSON report"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--transactions", type=int, default=20000, help="Ledger rows to seed"
+        )
+        parser.add_argument(
+            "--page-size", type=int, default=1000, help="Rows in the listing page"
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--output", help="Also write the report to this file")
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            seed(transactions=options["transactions"])
+            queryset = Transaction.objects.order_by("-created_at", "-id")
+            page = transaction_values.render(
+                transaction_values.values(queryset)[: options["page_size"]]
+            )
+            listing = {
+                "next": "http://testserver/transactions/?cursor=x",
+                "results": page,
+            }
+            # Rows Are Read Once, Only Encoding Is Timed
+            rows = list(export_rows(Transaction.objects.all()))
+
+        report = {
+            "commit": current_commit(),
+            "listing_rows": len(page),
+            "export_rows": len(rows),
+            "listing": self.compare_renderers(listing, options["repeat"]),
+            "export": self.compare_exports(rows, options["repeat"]),
+        }
+        output = json.dumps(report, indent=2)
+        self.stdout.write(output)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+
+    def compare_renderers(self, listing, repeat):
+        results = {}
+        for name, renderer_class in RENDERERS.items():
+            if not getattr(renderer_class, "available", True):
+                results[name] = None
+                continue
+            renderer = renderer_class()
+            results[name] = self.measure(lambda: renderer.render(listing), repeat)
+        return self.relative_to(results, "json")
+
+    def compare_exports(self, rows, repeat):
+        results = {}
+        for name, (encode, _) in EXPORT_FORMATS.items():
+            results[name] = self.measure(
+                lambda: b"".join(
+                    chunk if isinstance(chunk, bytes) else chunk.encode()
+                    for chunk in encode(iter(rows))
+                ),
+                repeat,
+            )
+        return self.relative_to(results, "ndjson")
+
+    @staticmethod
+    def measure(render, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            payload = render()
+            timings.append(time.perf_counter() - started)
+        return {"bytes": len(payload), "encode_ms": round(min(timings) * 1000, 3)}
+
+    @staticmethod
+    def relative_to(results, baseline):
+        base = results[baseline]
+        for result in results.values():
+            if result is not None:
+                result["size_ratio"] = round(result["bytes"] / base["bytes"], 3)
+                result["speedup"] = round(base["encode_ms"] / result["encode_ms"], 2)
+        return results
@@ -0,0 +1,149 @@
+import json
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from seller.benchmarks import current_commit, throwaway_database
+from seller.fast_serializers import (
+    charge_order_values,
+    credit_request_values,
+    transaction_values,
+)
+from seller.models import (
+    ChargeOrder,
+    CreditRequest,
+    PhoneNumber,
+    Seller,
+    Transaction,
+    User,
+)
+from seller.serializers import (
+    ChargeOrderSerializer,
+    CreditRequestSerializer,
+    TransactionSerializer,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares rows per second of the ModelSerializer listings with the "
+        "values() fast path on a scratch database, and checks that both "
+        "render the same JSON bytes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            self.seed(options["rows"])
+            listings = {
+                "transactions": (
+                    TransactionSerializer,
+                    transaction_values,
+                    Transaction.objects.order_by("-created_at", "-id"),
+                ),
+                "charge_orders": (
+                    ChargeOrderSerializer,
+                    charge_order_values,
+                    ChargeOrder.objects.select_related("transaction").order_by(
+                        "-created_at", "-id"
+                    ),
+                ),
+                "credit_requests": (
+                    CreditRequestSerializer,
+                    credit_request_values,
+                    CreditRequest.objects.prefetch_related("transactions").order_by(
+                        "-created_at", "-id"
+                    ),
+                ),
+            }
+            report = {
+                name: self.compare(*listing, options["repeat"])
+                for name, listing in listings.items()
+            }
+
+        report["commit"] = current_commit()
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def seed(self, rows):
+        user = User.objects.create_user("bench-serializers")
+        seller = Seller.objects.create(user=user, balance=Decimal("1000000.00"))
+        phone_number = PhoneNumber.objects.create(phone_number="09120000000")
+        now = timezone.now()
+
+        charge_orders = ChargeOrder.objects.bulk_create(
+            ChargeOrder(
+                seller=seller, phone_number=phone_number, amount=Decimal("5.00")
+            )
+            for _ in range(rows)
+        )
+        credit_requests = CreditRequest.objects.bulk_create(
+            CreditRequest(seller=seller, amount=Decimal(index + 1), is_processed=True)
+            for index in range(rows)
+        )
+        transactions = [
+            Transaction(
+                seller=seller,
+                transaction_type=2,
+                amount=Decimal("5.00"),
+                status=Transaction.COMPLETESTATUS,
+                reference_id=str(uuid.uuid4()),
+                phone_number=phone_number,
+                charge_amount=Decimal("5.00"),
+                charge_order=charge_order,
+                balance_before=Decimal("100.00"),
+                balance_after=Decimal("95.00"),
+                processed_at=now,
+            )
+            for charge_order in charge_orders
+        ]
+        transactions += [
+            Transaction(
+                seller=seller,
+                transaction_type=1,
+                amount=credit_request.amount,
+                status=Transaction.COMPLETESTATUS,
+                reference_id=str(uuid.uuid4()),
+                credit_request=credit_request,
+                balance_before=Decimal("100.00"),
+                balance_after=Decimal("100.00") + credit_request.amount,
+                processed_at=now,
+            )
+            for credit_request in credit_requests
+        ]
+        Transaction.objects.bulk_create(transactions, batch_size=1000)
+
+    def compare(self, serializer_class, values_serializer, queryset, repeat):
+        renderer = JSONRenderer()
+
+        def model_serializer():
+            return renderer.render(serializer_class(queryset.all(), many=True).data)
+
+        def fast_path():
+            rows = values_serializer.values(queryset.all())
+            return renderer.render(values_serializer.render(rows))
+
+        results = {}
+        outputs = {}
+        for name, render in (("serializer", model_serializer), ("values", fast_path)):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                outputs[name] = render()
+                timings.append(time.perf_counter() - started)
+            results[name] = min(timings)
+
+        rows = queryset.count()
+        return {
+            "rows": rows,
+            "serializer_rows_per_s": round(rows / results["serializer"]),
+            "values_rows_per_s": round(rows / results["values"]),
+            "speedup": round(results["serializer"] / results["values"], 2),
+            "identical": outputs["serializer"] == outputs["values"],
+        }
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from seller.benchmarks import throwaway_database
+from seller.query_plans import HOT_QUERIES, check_hot_queries, seed
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs EXPLAIN QUERY PLAN on the hot ORM queries against a scratch "
+        "database of synthetic data and fails on full table scans or temp "
+        "B-tree sorts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sellers", type=int, default=20)
+        parser.add_argument("--phones", type=int, default=500)
+        parser.add_argument("--transactions", type=int, default=20000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--query",
+            action="append",
+            choices=sorted(HOT_QUERIES),
+            help="Only check these hot queries",
+        )
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            sample = seed(
+                sellers=options["sellers"],
+                phone_numbers=options["phones"],
+                transactions=options["transactions"],
+                seed=options["seed"],
+            )
+            results = check_hot_queries(sample, names=options["query"])
+
+        failures = 0
+        for name, statements in results.items():
+            self.stdout.write(name)
+            for sql, plan, problems in statements:
+                if options["verbosity"] > 1 or problems:
+                    self.stdout.write(f"  {sql}")
+                for detail in plan:
+                    if detail in problems:
+                        self.stdout.write(self.style.ERROR(f"    {detail}"))
+                    elif options["verbosity"] > 1:
+                        self.stdout.write(f"    {detail}")
+                failures += bool(problems)
+
+        if failures:
+            raise CommandError(f"{failures} statements scan a table or sort")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(results)} hot queries use their indexes")
+        )
@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from seller.db import atomic_with_retry
+from seller.models import BalanceCheckpoint, Transaction
+
+
+@atomic_with_retry
+def take_checkpoint(seller_id):
+    return BalanceCheckpoint.take(seller_id)
+
+
+class Command(BaseCommand):
+    help = (
+        "Records balance checkpoints for sellers with a long ledger since their "
+        "last checkpoint, bounding point-in-time balance lookups"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-transactions",
+            type=int,
+            help="Defaults to SELLER_BALANCE_CHECKPOINT_EVERY",
+        )
+        parser.add_argument(
+            "--seller", type=int, action="append", help="Only checkpoint these sellers"
+        )
+
+    def handle(self, *args, **options):
+        min_transactions = options["min_transactions"]
+        if min_transactions is None:
+            min_transactions = settings.SELLER_BALANCE_CHECKPOINT_EVERY
+
+        # 1-Count Ledger Rows Since Each Seller's Last Checkpoint
+        checkpoints = BalanceCheckpoint.objects.filter(seller=OuterRef("seller"))
+        last_as_of = checkpoints.order_by("-as_of").values("as_of")[:1]
+        rows = Transaction.objects.filter(
+            Q(created_at__gt=Subquery(last_as_of)) | ~Exists(checkpoints)
+        )
+        if options["seller"]:
+            rows = rows.filter(seller__in=options["seller"])
+        seller_ids = list(
+            rows.values("seller")
+            .annotate(rows=Count("id"))
+            .filter(rows__gte=max(min_transactions, 1))
+            .order_by("seller")
+            .values_list("seller", flat=True)
+        )
+
+        # 2-One Short Write Transaction Per Seller
+        for seller_id in seller_ids:
+            take_checkpoint(seller_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Recorded {len(seller_ids)} balance checkpoints")
+        )
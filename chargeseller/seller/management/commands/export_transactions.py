@@ -0,0 +1,82 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+from seller.archive import merge_by_id, needs_archive
+from seller.exports import BINARY_EXPORT_FORMATS, EXPORT_FORMATS, export_rows
+from seller.filters import filter_transactions
+from seller.models import ArchivedTransaction, Transaction
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams the transaction ledger to a file as NDJSON or CSV, or as "
+        "MessagePack or Arrow when installed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seller", help="Seller id")
+        parser.add_argument("--type", help="Transaction type (1 credit, 2 charge)")
+        parser.add_argument("--status", help="Transaction status")
+        parser.add_argument("--date-from", help="First day included, YYYY-MM-DD")
+        parser.add_argument("--date-to", help="Last day included, YYYY-MM-DD")
+        parser.add_argument(
+            "--output-format", choices=sorted(EXPORT_FORMATS), default="ndjson"
+        )
+        parser.add_argument("--file", help="Output path, stdout when omitted")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        params = {
+            "seller": options["seller"],
+            "type": options["type"],
+            "status": options["status"],
+            "date_from": options["date_from"],
+            "date_to": options["date_to"],
+        }
+        try:
+            queryset = filter_transactions(Transaction.objects.all(), params)
+            archive_queryset = None
+            if needs_archive(params):
+                archive_queryset = filter_transactions(
+                    ArchivedTransaction.objects.all(), params
+                )
+        except ValidationError as error:
+            raise CommandError(
+                "; ".join(
+                    f"{field}: {message}" for field, message in error.detail.items()
+                )
+            )
+
+        encode, _ = EXPORT_FORMATS[options["output_format"]]
+        self.exported = 0
+        rows = export_rows(queryset, chunk_size=options["chunk_size"])
+        if archive_queryset is not None:
+            rows = merge_by_id(
+                export_rows(archive_queryset, chunk_size=options["chunk_size"]), rows
+            )
+        rows = self.count_rows(rows)
+
+        binary = options["output_format"] in BINARY_EXPORT_FORMATS
+        started = time.monotonic()
+        if options["file"]:
+            mode, newline = ("wb", None) if binary else ("w", "")
+            with open(options["file"], mode, newline=newline) as output:
+                output.writelines(encode(rows))
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Exported {self.exported} transactions to {options['file']} "
+                    f"in {elapsed:.1f}s"
+                )
+            )
+        elif binary:
+            sys.stdout.buffer.writelines(encode(rows))
+        else:
+            sys.stdout.writelines(encode(rows))
+
+    def count_rows(self, rows):
+        for row in rows:
+            self.exported += 1
+            yield row
@@ -0,0 +1,169 @@
+import csv
+import multiprocessing
+import re
+import sys
+import time
+from functools import partial
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from seller.caches import phone_numbers
+from seller.db import atomic_with_retry
+from seller.models import CacheVersion, PhoneNumber
+
+PHONE_NUMBER_RE = re.compile(r"\d{11}")
+
+
+def parse_chunk(lines, csv_column=None):
+    """Return ``(valid_numbers, invalid_count)`` for a chunk of raw lines.
+
+    Blank lines are skipped, anything else that is not 11 digits is invalid.
+    """
+    if csv_column is None:
+        values = (line.strip() for line in lines)
+    else:
+        values = (
+            row[csv_column].strip() if len(row) > csv_column else ""
+            for row in csv.reader(lines)
+        )
+
+    valid = []
+    invalid = 0
+    for value in values:
+        if not value:
+            continue
+        if PHONE_NUMBER_RE.fullmatch(value):
+            valid.append(value)
+        else:
+            invalid += 1
+    return valid, invalid
+
+
+def read_chunks(stream, size):
+    while True:
+        chunk = list(islice(stream, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams phone numbers from a text file (one per line) or a CSV file "
+        "and inserts the valid 11-digit ones in batches, skipping numbers "
+        "that already exist"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for stdin")
+        parser.add_argument(
+            "--format",
+            choices=["text", "csv"],
+            help="Defaults to csv for .csv files and text otherwise",
+        )
+        parser.add_argument(
+            "--column", type=int, default=0, help="CSV column holding the number"
+        )
+        parser.add_argument(
+            "--skip-header", action="store_true", help="Ignore the first line"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Numbers inserted per transaction",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help="Processes parsing the file in parallel; 0 parses in this process",
+        )
+        parser.add_argument(
+            "--inactive", action="store_true", help="Import numbers as inactive"
+        )
+        parser.add_argument(
+            "--progress-every",
+            type=float,
+            default=5,
+            help="Seconds between progress lines",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or ("csv" if path.endswith(".csv") else "text")
+        csv_column = options["column"] if file_format == "csv" else None
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive")
+
+        try:
+            stream = (
+                sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+            )
+        except OSError as e:
+            raise CommandError(f"Cannot open {path}: {e}")
+
+        existing = PhoneNumber.objects.count()
+        self.started = self.last_report = time.monotonic()
+        self.read = self.invalid = 0
+        self.progress_every = options["progress_every"]
+
+        with stream:
+            if options["skip_header"]:
+                next(stream, None)
+            chunks = read_chunks(stream, batch_size)
+
+            if options["workers"] > 0:
+                context = multiprocessing.get_context("fork")
+                with context.Pool(options["workers"]) as pool:
+                    parsed = pool.imap_unordered(
+                        partial(parse_chunk, csv_column=csv_column), chunks, chunksize=1
+                    )
+                    self.insert(parsed, options["inactive"])
+            else:
+                parsed = map(partial(parse_chunk, csv_column=csv_column), chunks)
+                self.insert(parsed, options["inactive"])
+
+        # Let Every Process Reload Its Phone Number Cache
+        CacheVersion.bump(CacheVersion.PHONE_NUMBERS)
+        phone_numbers.invalidate()
+
+        inserted = PhoneNumber.objects.count() - existing
+        elapsed = time.monotonic() - self.started
+        valid = self.read - self.invalid
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {inserted} phone numbers from {self.read} numbers in "
+                f"{elapsed:.1f}s ({self.read / elapsed if elapsed else 0:.0f} numbers/s): "
+                f"{valid - inserted} duplicate or existing, {self.invalid} invalid"
+            )
+        )
+
+    def insert(self, parsed, inactive):
+        for valid, invalid in parsed:
+            # Each Chunk Is Inserted In Its Own Transaction
+            if valid:
+                self.insert_batch(valid, not inactive)
+            self.read += len(valid) + invalid
+            self.invalid += invalid
+
+            now = time.monotonic()
+            if now - self.last_report >= self.progress_every:
+                self.last_report = now
+                elapsed = now - self.started
+                self.stdout.write(
+                    f"{self.read} numbers read, {self.invalid} invalid, "
+                    f"{self.read / elapsed:.0f} numbers/s"
+                )
+
+    @staticmethod
+    @atomic_with_retry
+    def insert_batch(numbers, is_active):
+        PhoneNumber.objects.bulk_create(
+            [
+                PhoneNumber(phone_number=number, is_active=is_active)
+                for number in numbers
+            ],
+            ignore_conflicts=True,
+        )
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from seller.models import ChargeIdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "Deletes charge idempotency keys older than the duplicate window"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of keys deleted per statement",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - ChargeIdempotencyKey.WINDOW
+        expired = ChargeIdempotencyKey.objects.filter(created_at__lt=cutoff)
+
+        deleted = 0
+        while True:
+            batch = list(
+                expired.order_by("created_at").values_list("id", flat=True)[
+                    : options["batch_size"]
+                ]
+            )
+            if not batch:
+                break
+            ChargeIdempotencyKey.objects.filter(id__in=batch).delete()
+            deleted += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} expired idempotency keys")
+        )
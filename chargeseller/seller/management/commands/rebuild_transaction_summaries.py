@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from seller.db import immediate_atomic
+from seller.models import (
+    ArchivedTransaction,
+    Transaction,
+    TransactionDailySummary,
+)
+
+
+class Command(BaseCommand):
+    help = "Regenerates the per seller daily transaction summaries from the ledger"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seller", type=int, help="Only rebuild this seller")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        ledgers = [Transaction.objects.all(), ArchivedTransaction.objects.all()]
+        summaries = TransactionDailySummary.objects.all()
+        if options["seller"]:
+            ledgers = [ledger.filter(seller_id=options["seller"]) for ledger in ledgers]
+            summaries = summaries.filter(seller_id=options["seller"])
+
+        # Reads And Rewrite Share One Write Lock, No Ledger Row Lands In Between
+        with immediate_atomic():
+            rebuilt = self.rebuild(ledgers, summaries, options["batch_size"])
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} summary rows"))
+
+    def rebuild(self, ledgers, summaries, batch_size):
+        # Archived Rows Still Count, A Day Can Span Both Tables
+        groups = {}
+        for ledger in ledgers:
+            rows = (
+                ledger.annotate(day=TruncDate("created_at"))
+                .values("seller_id", "day", "transaction_type")
+                .annotate(count=Count("id"), total_amount=Sum("amount"))
+                .order_by()
+            )
+            for row in rows.iterator(chunk_size=batch_size):
+                key = (row["seller_id"], row["day"], row["transaction_type"])
+                group = groups.get(key)
+                if group is None:
+                    groups[key] = row
+                else:
+                    group["count"] += row["count"]
+                    group["total_amount"] += row["total_amount"]
+
+        summaries.delete()
+        rebuilt = 0
+        batch = []
+        for group in groups.values():
+            batch.append(TransactionDailySummary(**group))
+            if len(batch) == batch_size:
+                TransactionDailySummary.objects.bulk_create(batch)
+                rebuilt += len(batch)
+                batch = []
+        TransactionDailySummary.objects.bulk_create(batch)
+        rebuilt += len(batch)
+        return rebuilt
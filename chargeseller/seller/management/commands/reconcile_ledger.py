@@ -0,0 +1,95 @@
+import multiprocessing
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from seller.models import ReconciliationCheckpoint, Seller
+from seller.reconciliation import MINOR_UNITS, reconcile_sellers
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks every seller balance against its ledger and the "
+        "balance_before/balance_after chain row by row, resuming from the "
+        "last checkpoint"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help="Worker processes; 0 checks in this process",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=50000,
+            help="Transactions loaded into each array",
+        )
+        parser.add_argument(
+            "--seller", type=int, action="append", help="Only check these sellers"
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Drop checkpoints and check every ledger from the start",
+        )
+
+    def handle(self, *args, **options):
+        sellers = Seller.objects.order_by("id")
+        if options["seller"]:
+            sellers = sellers.filter(id__in=options["seller"])
+        seller_ids = list(sellers.values_list("id", flat=True))
+
+        if options["reset"]:
+            ReconciliationCheckpoint.objects.filter(seller_id__in=seller_ids).delete()
+
+        results = self.run(seller_ids, options["processes"], options["chunk_size"])
+
+        issues = 0
+        for result in results:
+            if result["balance_mismatch"]:
+                issues += 1
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"Seller {result['seller']}: balance "
+                        f"{result['balance'] / MINOR_UNITS:.2f}, ledger says "
+                        f"{result['expected'] / MINOR_UNITS:.2f}"
+                    )
+                )
+            if result["chain_breaks"]:
+                issues += 1
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"Seller {result['seller']}: balance chain breaks at "
+                        f"transactions {result['chain_breaks']}"
+                    )
+                )
+            if result["amount_mismatches"]:
+                issues += 1
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"Seller {result['seller']}: balance change differs from "
+                        f"amount in transactions {result['amount_mismatches']}"
+                    )
+                )
+
+        rows = sum(result["rows"] for result in results)
+        summary = f"Reconciled {len(results)} sellers, {rows} new transactions"
+        if issues:
+            raise CommandError(f"{summary}: {issues} issues found")
+        self.stdout.write(self.style.SUCCESS(f"{summary}: no issues"))
+
+    def run(self, seller_ids, processes, chunk_size):
+        if processes == 0 or len(seller_ids) < 2:
+            return reconcile_sellers(seller_ids, chunk_size)
+
+        # Children must open their own connections
+        connections.close_all()
+        slices = [seller_ids[index::processes] for index in range(processes)]
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes) as pool:
+            results = pool.starmap(
+                reconcile_sellers, [(ids, chunk_size) for ids in slices if ids]
+            )
+        return [result for chunk in results for result in chunk]
@@ -0,0 +1,53 @@
+import multiprocessing
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from seller.workers import run_charge_worker
+
+
+class Command(BaseCommand):
+    help = "Runs a pool of processes that settle asynchronously accepted charge orders"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help="Worker processes; 0 settles in this process",
+        )
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=0.5,
+            help="Seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when the queue is drained instead of polling forever",
+        )
+
+    def handle(self, *args, **options):
+        worker_args = (options["batch_size"], options["poll_interval"], options["once"])
+
+        if options["processes"] == 0:
+            settled = run_charge_worker(0, *worker_args)
+            self.stdout.write(self.style.SUCCESS(f"Settled {settled} charge jobs"))
+            return
+
+        # Children must open their own connections
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        with context.Pool(options["processes"]) as pool:
+            results = [
+                pool.apply_async(run_charge_worker, (index, *worker_args))
+                for index in range(options["processes"])
+            ]
+            try:
+                settled = sum(result.get() for result in results)
+            except KeyboardInterrupt:
+                pool.terminate()
+                raise
+
+        self.stdout.write(self.style.SUCCESS(f"Settled {settled} charge jobs"))
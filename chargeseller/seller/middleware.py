@@ -0,0 +1,103 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    """Collects count, total time and the slowest statement of executed SQL."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_duration = 0.0
+        self.slowest_sql = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            if elapsed >= self.slowest_duration:
+                self.slowest_duration = elapsed
+                self.slowest_sql = sql
+
+    def server_timing(self):
+        return (
+            f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_duration * 1000:.2f}"
+        )
+
+    def log_fields(self):
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.duration * 1000, 2),
+            "db_slowest_ms": round(self.slowest_duration * 1000, 2),
+            "db_slowest_sql": self.slowest_sql,
+        }
+
+
+def instrument(stats):
+    """Wrap this thread's connections with ``stats`` until the stack is closed."""
+    stack = ExitStack()
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(stats))
+    return stack
+
+
+class QueryInstrumentationMiddleware:
+    """Reports the SQL cost of each request in a Server-Timing header and the log.
+
+    Queries issued while a streaming response is being consumed happen after
+    the header is sent and are not counted.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Async Views Under ASGI Must Not Be Pushed Into A Thread By Us
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats = QueryStats()
+        with instrument(stats):
+            response = self.get_response(request)
+        return self.report(request, response, stats)
+
+    async def __acall__(self, request):
+        # Connections Are Per Thread, The ORM Runs On The Thread-Sensitive Executor
+        stats = QueryStats()
+        stack = await sync_to_async(instrument)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.report(request, response, stats)
+
+    def report(self, request, response, stats):
+        response["Server-Timing"] = stats.server_timing()
+        fields = stats.log_fields()
+        logger.info(
+            f"{request.method} {request.path} {response.status_code} "
+            f"queries={fields['db_queries']} db_time_ms={fields['db_time_ms']}",
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+                **fields,
+            },
+        )
+        return response
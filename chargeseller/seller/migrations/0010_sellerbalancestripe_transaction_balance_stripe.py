@@ -0,0 +1,39 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:05
+
+import django.core.validators
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seller', '0009_alter_chargeorder_amount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='balance_stripe',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='SellerBalanceStripe',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True, null=True)),
+                ('deleted_at', models.DateTimeField(null=True)),
+                ('stripe', models.PositiveSmallIntegerField()),
+                ('balance', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=15, validators=[django.core.validators.MinValueValidator(Decimal('0.00'))])),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL)),
+                ('seller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_stripes', to='seller.seller')),
+            ],
+            options={
+                'db_table': 'seller_balance_stripes',
+                'constraints': [models.UniqueConstraint(fields=('seller', 'stripe'), name='unique_seller_balance_stripe')],
+            },
+        ),
+    ]
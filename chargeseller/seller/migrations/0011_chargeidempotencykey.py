@@ -0,0 +1,74 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0010_sellerbalancestripe_transaction_balance_stripe"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChargeIdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, db_index=True, null=True),
+                ),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("key", models.CharField(max_length=255)),
+                (
+                    "charge_order",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="idempotency_keys",
+                        to="seller.chargeorder",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="idempotency_keys",
+                        to="seller.seller",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "charge_idempotency_keys",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("seller", "key"), name="unique_charge_idempotency_key"
+                    )
+                ],
+            },
+        ),
+    ]
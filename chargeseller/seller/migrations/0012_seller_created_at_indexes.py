@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0011_chargeidempotencykey"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="chargeorder",
+            name="charge_orde_seller__4bbf74_idx",
+        ),
+        migrations.AddIndex(
+            model_name="chargeorder",
+            index=models.Index(
+                fields=["seller", "created_at"], name="charge_orde_seller__942a3a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["seller", "created_at"], name="transaction_seller__380387_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:14
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0012_seller_created_at_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransactionDailySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, db_index=True, null=True),
+                ),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("day", models.DateField()),
+                (
+                    "transaction_type",
+                    models.IntegerField(
+                        choices=[(1, "Credit_Increase"), (2, "Charge_Sale")]
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "total_amount",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0.00"), max_digits=18
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_summaries",
+                        to="seller.seller",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "transaction_daily_summaries",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("seller", "day", "transaction_type"),
+                        name="unique_transaction_daily_summary",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0013_transactiondailysummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChargeJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, db_index=True, null=True),
+                ),
+                ("deleted_at", models.DateTimeField(null=True)),
+                (
+                    "status",
+                    models.IntegerField(
+                        choices=[
+                            (1, "Pending"),
+                            (2, "Processing"),
+                            (3, "Completed"),
+                            (4, "Failed"),
+                        ],
+                        default=1,
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                ("locked_by", models.CharField(blank=True, max_length=100)),
+                ("locked_at", models.DateTimeField(blank=True, null=True)),
+                ("error_message", models.TextField(blank=True)),
+                (
+                    "charge_order",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job",
+                        to="seller.chargeorder",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "charge_jobs",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "locked_at"],
+                        name="charge_jobs_status_035948_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0014_chargejob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CacheVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, db_index=True, null=True),
+                ),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "cache_versions",
+            },
+        ),
+    ]
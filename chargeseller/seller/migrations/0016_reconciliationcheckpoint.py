@@ -0,0 +1,61 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0015_cacheversion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReconciliationCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, db_index=True, null=True),
+                ),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("last_transaction_id", models.BigIntegerField(default=0)),
+                ("state", models.JSONField(default=dict)),
+                ("checked_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "seller",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reconciliation_checkpoint",
+                        to="seller.seller",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "reconciliation_checkpoints",
+            },
+        ),
+    ]
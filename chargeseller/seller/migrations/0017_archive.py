@@ -0,0 +1,215 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0016_reconciliationcheckpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchiveWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, db_index=True, null=True),
+                ),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("archived_before", models.DateTimeField()),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "archive_watermarks",
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedChargeOrder",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(db_index=True, null=True)),
+                ("updated_at", models.DateTimeField(null=True)),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=10)),
+                ("error_message", models.TextField(blank=True)),
+                ("retry_count", models.IntegerField(default=0)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "phone_number",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.phonenumber",
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.seller",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "archived_charge_orders",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["seller", "created_at"],
+                        name="archived_ch_seller__853a37_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedTransaction",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(db_index=True, null=True)),
+                ("updated_at", models.DateTimeField(null=True)),
+                ("deleted_at", models.DateTimeField(null=True)),
+                (
+                    "transaction_type",
+                    models.IntegerField(
+                        choices=[(1, "Credit_Increase"), (2, "Charge_Sale")]
+                    ),
+                ),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=15)),
+                (
+                    "status",
+                    models.IntegerField(
+                        choices=[
+                            (1, "Pending"),
+                            (2, "Completed"),
+                            (3, "Failed"),
+                            (4, "Canceled"),
+                        ]
+                    ),
+                ),
+                ("reference_id", models.CharField(max_length=100, unique=True)),
+                (
+                    "charge_amount",
+                    models.DecimalField(
+                        blank=True, decimal_places=0, max_digits=10, null=True
+                    ),
+                ),
+                (
+                    "balance_before",
+                    models.DecimalField(decimal_places=2, max_digits=15),
+                ),
+                ("balance_after", models.DecimalField(decimal_places=2, max_digits=15)),
+                (
+                    "balance_stripe",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "charge_order",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.chargeorder",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "credit_request",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.creditrequest",
+                    ),
+                ),
+                (
+                    "phone_number",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.phonenumber",
+                    ),
+                ),
+                (
+                    "processed_by",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.seller",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "archived_transactions",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["seller", "created_at"],
+                        name="archived_tr_seller__6c09a0_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0017_archive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BalanceCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, db_index=True, null=True),
+                ),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("as_of", models.DateTimeField()),
+                ("balance", models.DecimalField(decimal_places=2, max_digits=15)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_created_by",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="balance_checkpoints",
+                        to="seller.seller",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "balance_checkpoints",
+                "ordering": ["-as_of"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("seller", "as_of"),
+                        name="unique_seller_balance_checkpoint",
+                    )
+                ],
+            },
+        ),
+    ]
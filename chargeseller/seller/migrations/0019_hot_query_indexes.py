@@ -0,0 +1,40 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0018_balancecheckpoint"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="creditrequest",
+            index=models.Index(
+                fields=["status", "created_at"], name="credit_requ_status_1f47bd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["transaction_type", "created_at"],
+                name="transaction_transac_6dc4cd_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["phone_number", "created_at"],
+                name="transaction_phone_n_93eb63_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["credit_request", "created_at"],
+                name="transaction_credit__03fd62_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.2 on 2026-10-17 00:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0019_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RateLimitBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=100, unique=True)),
+                ("tokens", models.FloatField()),
+                ("refilled_at", models.FloatField()),
+            ],
+            options={
+                "db_table": "rate_limit_buckets",
+            },
+        ),
+    ]
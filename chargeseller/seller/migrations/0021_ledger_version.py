@@ -0,0 +1,23 @@
+# Generated by Django 5.2.2 on 2026-10-17 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0020_ratelimitbucket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="seller",
+            name="ledger_version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sellerbalancestripe",
+            name="ledger_version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,279 @@
+# Generated by Django 5.2.2 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0021_ledger_version"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="creditrequest",
+            name="unique_pending_credit_request_per_seller_amount",
+        ),
+        migrations.RemoveIndex(
+            model_name="chargeorder",
+            name="charge_orde_created_d43ec1_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="chargeorder",
+            name="charge_orde_seller__942a3a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="creditrequest",
+            name="credit_requ_seller__cb6a16_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="creditrequest",
+            name="credit_requ_status_87f65a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="creditrequest",
+            name="credit_requ_created_6a69a4_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="creditrequest",
+            name="credit_requ_status_1f47bd_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="phonenumber",
+            name="phone_numbe_is_acti_eb40ae_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="seller",
+            name="sellers_balance_fc2a21_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_seller__ca7b7b_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_seller__0112f2_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_status_94cf9d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_seller__380387_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_transac_6dc4cd_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_phone_n_93eb63_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_credit__03fd62_idx",
+        ),
+        migrations.AlterField(
+            model_name="creditrequest",
+            name="is_processed",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="creditrequest",
+            name="status",
+            field=models.IntegerField(
+                choices=[(1, "Pending"), (2, "Approved"), (3, "Rejected")], default=1
+            ),
+        ),
+        migrations.AlterField(
+            model_name="phonenumber",
+            name="is_active",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name="phonenumber",
+            name="phone_number",
+            field=models.CharField(max_length=11),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="status",
+            field=models.IntegerField(
+                choices=[
+                    (1, "Pending"),
+                    (2, "Completed"),
+                    (3, "Failed"),
+                    (4, "Canceled"),
+                ],
+                default=1,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="transaction_type",
+            field=models.IntegerField(
+                choices=[(1, "Credit_Increase"), (2, "Charge_Sale")]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chargeorder",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["seller", "created_at"],
+                name="orders_seller_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chargeorder",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["created_at"],
+                name="orders_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creditrequest",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["seller", "status"],
+                name="credit_seller_status_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creditrequest",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["status", "is_processed"],
+                name="credit_status_processed_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creditrequest",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["created_at"],
+                name="credit_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creditrequest",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["status", "created_at"],
+                name="credit_status_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="phonenumber",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["is_active"],
+                name="phones_active_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="phonenumber",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["created_at"],
+                name="phones_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="seller",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["balance"],
+                name="sellers_balance_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="seller",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["created_at"],
+                name="sellers_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["seller", "transaction_type"],
+                name="tx_seller_type_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["seller", "status"],
+                name="tx_seller_status_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["seller", "created_at"],
+                name="tx_seller_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["status", "created_at"],
+                name="tx_status_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["transaction_type", "created_at"],
+                name="tx_type_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["phone_number", "created_at"],
+                name="tx_phone_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["credit_request", "created_at"],
+                name="tx_credit_created_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["created_at"],
+                name="tx_created_live",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="creditrequest",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", 1), ("deleted_at__isnull", True)),
+                fields=("seller", "amount"),
+                name="unique_pending_credit_request_per_seller_amount",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="phonenumber",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("phone_number",),
+                name="unique_live_phone_number",
+            ),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.2 on 2026-10-17 01:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seller", "0022_soft_delete"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LedgerEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("transaction.created", "Transaction Created"),
+                            (
+                                "transaction.status_changed",
+                                "Transaction Status Changed",
+                            ),
+                            (
+                                "credit_request.status_changed",
+                                "Credit Request Status Changed",
+                            ),
+                        ],
+                        max_length=40,
+                    ),
+                ),
+                ("status", models.IntegerField()),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=15)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "credit_request",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.creditrequest",
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.seller",
+                    ),
+                ),
+                (
+                    "transaction",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="seller.transaction",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "ledger_events",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["seller", "id"], name="ledger_even_seller__e47256_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,8 +1,17 @@
-from django.db import models
+from django.db import models, connection, transaction, IntegrityError
+from django.db.models import Case, F, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, TruncDate
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator
+from django.dispatch import Signal
 from decimal import Decimal
+from operator import itemgetter
+from typing import NamedTuple, Optional
+import random
 import uuid
+from .caches import idempotency_keys
+from .db import immediate_atomic
 from datetime import datetime
 from django.utils import timezone
 from datetime import timedelta
@@ -33,7 +42,117 @@ class AbstractModel(models.Model):
         abstract = True
 
 
-class Seller(AbstractModel):
+# Rows A Soft Delete Has Not Hidden, The Condition Of Every Partial Index
+LIVE = models.Q(deleted_at__isnull=True)
+
+
+def live_index(*fields, name):
+    """An index over the rows that are not soft deleted."""
+    return models.Index(fields=list(fields), condition=LIVE, name=name)
+
+
+# Soft Deletes Fire No pre_delete, Receivers Get The Still Live Rows As A Queryset
+pre_soft_delete = Signal()
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def delete(self):
+        """Mark the rows deleted with one UPDATE, related rows are left alone."""
+        now = timezone.now()
+        with immediate_atomic(using=self.db):
+            pre_soft_delete.send(sender=self.model, queryset=self)
+            count = self.update(deleted_at=now, updated_at=now)
+        return count, {self.model._meta.label: count}
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().filter(LIVE)
+
+
+class SoftDeleteModel(AbstractModel):
+    """AbstractModel whose deletes only stamp ``deleted_at``.
+
+    ``objects`` hides deleted rows, so its queries can use the partial
+    ``live_index`` indexes; ``all_objects`` sees every row and deletes for
+    real.
+    """
+
+    objects = SoftDeleteManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        abstract = True
+
+    def delete(self, using=None, keep_parents=False):
+        self.deleted_at = timezone.now()
+        with transaction.atomic(using=using):
+            pre_soft_delete.send(
+                sender=type(self), queryset=type(self).objects.filter(pk=self.pk)
+            )
+            self.save(using=using, update_fields=["deleted_at", "updated_at"])
+        return 1, {self._meta.label: 1}
+
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
+
+
+class BalanceChange(NamedTuple):
+    balance_before: Decimal
+    balance_after: Decimal
+    stripe: Optional[int] = None
+
+
+def balance_stripe_count():
+    return max(getattr(settings, "SELLER_BALANCE_STRIPES", 1), 1)
+
+
+def stripes_total():
+    """Subquery summing the balance stripes of the outer ``Seller`` row."""
+    return (
+        SellerBalanceStripe.objects.filter(seller=OuterRef("pk"))
+        .values("seller")
+        .annotate(total=Sum("balance"))
+        .values("total")
+    )
+
+
+def _fetch_balance(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    return Decimal(str(row[0])).quantize(Decimal("0.01"))
+
+
+def _ledger_moves(ledgers, **filters):
+    """Net balance change of the matching ledger rows, as one expression.
+
+    Rows with equal before and after balances (rejected credits, failed
+    reservations) did not move the balance.
+    """
+    total = Value(Decimal("0.00"))
+    for model in ledgers:
+        moves = (
+            model.objects.filter(seller=OuterRef("pk"), **filters)
+            .exclude(balance_before=F("balance_after"))
+            .values("seller")
+            .annotate(
+                total=Sum(
+                    Case(
+                        When(transaction_type=1, then=F("amount")),
+                        default=-F("amount"),
+                    )
+                )
+            )
+            .values("total")
+        )
+        total = total + Coalesce(Subquery(moves), Value(Decimal("0.00")))
+    return total
+
+
+class Seller(SoftDeleteModel):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="seller")
     balance = models.DecimalField(
         max_digits=15,
@@ -41,18 +160,317 @@ class Seller(AbstractModel):
         default=Decimal("0.00"),
         validators=[MinValueValidator(Decimal("0.00"))],
     )
+    # Bumped With Every Change To The Seller's Ledger, Keys Listing ETags
+    ledger_version = models.PositiveBigIntegerField(default=0)
 
     class Meta:
         db_table = "sellers"
         indexes = [
-            models.Index(fields=["balance"]),
+            live_index("balance", name="sellers_balance_live"),
+            live_index("created_at", name="sellers_created_live"),
         ]
 
     def __str__(self):
         return f"{self.user.username} - Balance: {self.balance}"
 
+    @classmethod
+    def debit(cls, seller_id, amount):
+        """Subtract ``amount`` only if the balance covers it.
+
+        The check and the write are one guarded UPDATE, so no row lock is
+        taken up front. Returns a ``BalanceChange`` or ``None`` when the
+        seller does not exist or the funds are insufficient.
+        """
+        if balance_stripe_count() > 1:
+            return SellerBalanceStripe.debit(seller_id, amount)
+
+        balance_after = cls._apply_balance_delta(seller_id, -amount, minimum=amount)
+        if balance_after is None:
+            return None
+        return BalanceChange(balance_after + amount, balance_after)
+
+    @classmethod
+    def credit(cls, seller_id, amount):
+        if balance_stripe_count() > 1:
+            return SellerBalanceStripe.credit(seller_id, amount)
+
+        balance_after = cls._apply_balance_delta(seller_id, amount)
+        if balance_after is None:
+            return None
+        return BalanceChange(balance_after - amount, balance_after)
+
+    @classmethod
+    def _apply_balance_delta(cls, seller_id, delta, minimum=None):
+        table = connection.ops.quote_name(cls._meta.db_table)
+        sql = (
+            f"UPDATE {table} SET balance = balance + %s, updated_at = %s, "
+            f"ledger_version = ledger_version + 1 WHERE id = %s"
+        )
+        params = [delta, timezone.now(), seller_id]
+        if minimum is not None:
+            sql += " AND balance >= %s"
+            params.append(minimum)
+        sql += " RETURNING balance"
+        return _fetch_balance(sql, params)
+
+    @classmethod
+    def bump_ledger_version(cls, seller_ids):
+        """Mark the ledgers of ``seller_ids`` changed without a balance move."""
+        cls.objects.filter(id__in=seller_ids).update(
+            ledger_version=F("ledger_version") + 1
+        )
+
+    @classmethod
+    def ledger_versions(cls):
+        """Sellers annotated with ``version``, which grows with every ledger change."""
+        stripe_versions = (
+            SellerBalanceStripe.objects.filter(seller=OuterRef("pk"))
+            .values("seller")
+            .annotate(total=Sum("ledger_version"))
+            .values("total")
+        )
+        return cls.objects.annotate(
+            version=F("ledger_version") + Coalesce(Subquery(stripe_versions), 0)
+        )
+
+    @classmethod
+    def sync_striped_balance(cls, seller_id):
+        cls.objects.filter(id=seller_id).update(
+            balance=Subquery(stripes_total()), updated_at=timezone.now()
+        )
+
+    @classmethod
+    def current_balances(cls):
+        """Sellers annotated with ``current_balance``.
+
+        With striping on the stripes are summed, which matches ``balance``
+        outside a write; sellers without stripes yet keep theirs.
+        """
+        current_balance = F("balance")
+        if balance_stripe_count() > 1:
+            current_balance = Coalesce(Subquery(stripes_total()), F("balance"))
+        return cls.objects.annotate(current_balance=current_balance)
+
+    @classmethod
+    def current_balance(cls, seller_id):
+        balance = (
+            cls.current_balances()
+            .filter(id=seller_id)
+            .values_list("current_balance", flat=True)
+            .get()
+        )
+        return Decimal(balance).quantize(Decimal("0.01"))
+
+    @classmethod
+    def balance_at(cls, seller_id, moment):
+        """The balance right after everything ledgered up to ``moment``.
+
+        Returns ``None`` when the seller did not exist yet.
+        """
+        # 1-Newest Ledger Row Up To The Moment, One Index Seek Per Table
+        ledgers = [Transaction]
+        watermark = ArchiveWatermark.get(ArchiveWatermark.TRANSACTIONS)
+        if watermark is not None and moment < watermark:
+            ledgers.append(ArchivedTransaction)
+        rows = [
+            model.objects.filter(seller_id=seller_id, created_at__lte=moment)
+            .order_by("-created_at", "-id")
+            .values("id", "created_at", "balance_after", "balance_stripe")
+            .first()
+            for model in ledgers
+        ]
+        last = max(filter(None, rows), key=itemgetter("created_at", "id"), default=None)
+        checkpoint = (
+            BalanceCheckpoint.objects.filter(seller_id=seller_id, as_of__lte=moment)
+            .order_by("-as_of")
+            .values("as_of", "balance")
+            .first()
+        )
+
+        # 2-Unstriped Rows Carry The Seller Balance Itself
+        if last is not None and last["balance_stripe"] is None:
+            if checkpoint is None or last["created_at"] >= checkpoint["as_of"]:
+                return last["balance_after"]
+
+        # 3-Striped Rows Only Know Their Stripe, Add Up From The Checkpoint
+        sellers = cls.objects.filter(id=seller_id)
+        if checkpoint is not None:
+            delta = sellers.annotate(
+                delta=_ledger_moves(
+                    ledgers,
+                    created_at__gt=checkpoint["as_of"],
+                    created_at__lte=moment,
+                )
+            ).values_list("delta", flat=True)
+            return (checkpoint["balance"] + delta.get()).quantize(Decimal("0.01"))
+
+        # 4-No Checkpoint Yet, Walk Back From The Current Balance
+        seller = (
+            cls.current_balances()
+            .filter(id=seller_id)
+            .annotate(
+                balance_then=F("current_balance")
+                - _ledger_moves(ledgers, created_at__gt=moment)
+            )
+            .values("created_at", "balance_then")
+            .first()
+        )
+        if seller is None or (last is None and seller["created_at"] > moment):
+            return None
+        return Decimal(seller["balance_then"]).quantize(Decimal("0.01"))
+
+
+class SellerBalanceStripe(AbstractModel):
+    """One slice of a seller's balance when striping is enabled.
+
+    Debits are taken from a single stripe row, and ``Seller.balance`` is
+    re-derived from the stripes in the same transaction after every credit
+    and debit, so it always equals their total.
+    """
+
+    seller = models.ForeignKey(
+        Seller, on_delete=models.CASCADE, related_name="balance_stripes"
+    )
+    stripe = models.PositiveSmallIntegerField()
+    balance = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        validators=[MinValueValidator(Decimal("0.00"))],
+    )
+    # Striped Debits Bump Their Stripe Instead Of The Seller Row
+    ledger_version = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "seller_balance_stripes"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["seller", "stripe"], name="unique_seller_balance_stripe"
+            )
+        ]
+
+    def __str__(self):
+        return f"Stripe {self.stripe} of seller {self.seller_id}: {self.balance}"
+
+    @classmethod
+    def debit(cls, seller_id, amount):
+        change = cls._debit(seller_id, amount)
+        if change is not None:
+            Seller.sync_striped_balance(seller_id)
+        return change
+
+    @classmethod
+    def _debit(cls, seller_id, amount):
+        count = balance_stripe_count()
+        start = random.randrange(count)
+
+        # 1-Try Each Stripe Once, Starting From A Random One
+        for offset in range(count):
+            stripe = (start + offset) % count
+            change = cls._debit_stripe(seller_id, stripe, amount)
+            if change is not None:
+                return change
+
+        # 2-No Stripe Covers The Amount, Materialize Or Consolidate
+        if cls._ensure_stripes(seller_id, count):
+            return cls._debit(seller_id, amount)
+        if cls._consolidate(seller_id, start, amount):
+            return cls._debit_stripe(seller_id, start, amount)
+        return None
+
+    @classmethod
+    def credit(cls, seller_id, amount):
+        cls._ensure_stripes(seller_id, balance_stripe_count())
+
+        # Refill The Emptiest Stripe So Funds Stay Spread Out
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET balance = balance + %s, updated_at = %s, "
+                f"ledger_version = ledger_version + 1 "
+                f"WHERE id = (SELECT id FROM {table} WHERE seller_id = %s "
+                f"ORDER BY balance, stripe LIMIT 1) RETURNING stripe, balance",
+                [amount, timezone.now(), seller_id],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        stripe = row[0]
+        balance_after = Decimal(str(row[1])).quantize(Decimal("0.01"))
+
+        Seller.sync_striped_balance(seller_id)
+        return BalanceChange(balance_after - amount, balance_after, stripe)
+
+    @classmethod
+    def _debit_stripe(cls, seller_id, stripe, amount):
+        table = connection.ops.quote_name(cls._meta.db_table)
+        balance_after = _fetch_balance(
+            f"UPDATE {table} SET balance = balance - %s, updated_at = %s, "
+            f"ledger_version = ledger_version + 1 "
+            f"WHERE seller_id = %s AND stripe = %s AND balance >= %s "
+            f"RETURNING balance",
+            [amount, timezone.now(), seller_id, stripe, amount],
+        )
+        if balance_after is None:
+            return None
+        return BalanceChange(balance_after + amount, balance_after, stripe)
 
-class CreditRequest(AbstractModel):
+    @classmethod
+    def _ensure_stripes(cls, seller_id, count):
+        """Create missing stripes, splitting the seller balance on first use.
+
+        Returns ``True`` when any stripe was created.
+        """
+        seller = Seller.objects.select_for_update().filter(id=seller_id).first()
+        if seller is None:
+            return False
+
+        existing = set(
+            cls.objects.filter(seller_id=seller_id).values_list("stripe", flat=True)
+        )
+        missing = [stripe for stripe in range(count) if stripe not in existing]
+        if not missing:
+            return False
+
+        share = Decimal("0.00")
+        remainder = Decimal("0.00")
+        if not existing:
+            share = (seller.balance / count).quantize(Decimal("0.01"), "ROUND_DOWN")
+            remainder = seller.balance - share * count
+
+        cls.objects.bulk_create(
+            [
+                cls(
+                    seller_id=seller_id,
+                    stripe=stripe,
+                    balance=share + (remainder if stripe == 0 else 0),
+                )
+                for stripe in missing
+            ]
+        )
+        return True
+
+    @classmethod
+    def _consolidate(cls, seller_id, target, amount):
+        """Move every stripe's funds into ``target`` if the total covers ``amount``."""
+        stripes = list(
+            cls.objects.select_for_update()
+            .filter(seller_id=seller_id)
+            .order_by("stripe")
+        )
+        total = sum((stripe.balance for stripe in stripes), Decimal("0.00"))
+        if total < amount:
+            return False
+
+        now = timezone.now()
+        for stripe in stripes:
+            stripe.balance = total if stripe.stripe == target else Decimal("0.00")
+            stripe.updated_at = now
+        cls.objects.bulk_update(stripes, ["balance", "updated_at"])
+        return True
+
+
+class CreditRequest(SoftDeleteModel):
     STATUS_CHOICES = [
         (1, "Pending"),
         (2, "Approved"),
@@ -69,8 +487,8 @@ class CreditRequest(AbstractModel):
     amount = models.DecimalField(
         max_digits=15, decimal_places=2, validators=[MinValueValidator(Decimal("0.01"))]
     )
-    status = models.IntegerField(choices=STATUS_CHOICES, default=1, db_index=True)
-    is_processed = models.BooleanField(default=False, db_index=True)
+    status = models.IntegerField(choices=STATUS_CHOICES, default=1)
+    is_processed = models.BooleanField(default=False)
 
     class Meta:
         db_table = "credit_requests"
@@ -79,35 +497,77 @@ class CreditRequest(AbstractModel):
         constraints = [
             models.UniqueConstraint(
                 fields=["seller", "amount"],
-                condition=models.Q(status=1),
+                condition=models.Q(status=1) & LIVE,
                 name="unique_pending_credit_request_per_seller_amount",
             )
         ]
         indexes = [
-            models.Index(fields=["seller", "status"]),
-            models.Index(fields=["status", "is_processed"]),
-            models.Index(fields=["created_at"]),
+            live_index("seller", "status", name="credit_seller_status_live"),
+            live_index("status", "is_processed", name="credit_status_processed_live"),
+            live_index("created_at", name="credit_created_live"),
+            live_index("status", "created_at", name="credit_status_created_live"),
         ]
 
     def __str__(self):
         return f"Credit Request - {self.seller.user.username}: {self.amount} ({self.status})"
 
 
-class PhoneNumber(AbstractModel):
-    phone_number = models.CharField(max_length=11, unique=True, db_index=True)
-    is_active = models.BooleanField(default=True, db_index=True)
+class PhoneNumber(SoftDeleteModel):
+    phone_number = models.CharField(max_length=11)
+    is_active = models.BooleanField(default=True)
 
     class Meta:
         db_table = "phone_numbers"
+        # A Deleted Number Can Be Added Again
+        constraints = [
+            models.UniqueConstraint(
+                fields=["phone_number"], condition=LIVE, name="unique_live_phone_number"
+            )
+        ]
         indexes = [
-            models.Index(fields=["is_active"]),
+            live_index("is_active", name="phones_active_live"),
+            live_index("created_at", name="phones_created_live"),
         ]
 
     def __str__(self):
         return f"{self.phone_number}"
 
 
-class ChargeOrder(AbstractModel):
+class CacheVersion(AbstractModel):
+    """Version stamp per cached table, bumped on every change.
+
+    Process-local caches compare it with the version they loaded to notice
+    changes made by other processes.
+    """
+
+    PHONE_NUMBERS = "phone_numbers"
+
+    name = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "cache_versions"
+
+    @classmethod
+    def current(cls, name):
+        return (
+            cls.objects.filter(name=name).values_list("version", flat=True).first() or 0
+        )
+
+    @classmethod
+    def bump(cls, name):
+        updated = cls.objects.filter(name=name).update(
+            version=models.F("version") + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            try:
+                with transaction.atomic():
+                    cls.objects.create(name=name, version=1)
+            except IntegrityError:
+                cls.objects.filter(name=name).update(version=models.F("version") + 1)
+
+
+class ChargeOrder(SoftDeleteModel):
 
     seller = models.ForeignKey(
         Seller, on_delete=models.CASCADE, related_name="charge_orders"
@@ -126,8 +586,8 @@ class ChargeOrder(AbstractModel):
         db_table = "charge_orders"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["seller"]),
-            models.Index(fields=["created_at"]),
+            live_index("seller", "created_at", name="orders_seller_created_live"),
+            live_index("created_at", name="orders_created_live"),
         ]
 
     def __str__(self):
@@ -136,17 +596,153 @@ class ChargeOrder(AbstractModel):
     @classmethod
     def get_recent_order(cls, seller_id, phone_number, amount):
 
-        ten_minutes_ago = timezone.now() - timedelta(minutes=10)
+        order_id = ChargeIdempotencyKey.find_recent(
+            seller_id, ChargeIdempotencyKey.keys_for(phone_number, amount)
+        )
+        if order_id is None:
+            return None
+        return cls.objects.filter(id=order_id).first()
+
+
+class ChargeIdempotencyKey(AbstractModel):
+    """Duplicate guard for charge orders, one row per (seller, key).
+
+    Keys are either the client's ``Idempotency-Key`` header or derived from
+    phone number, amount and a ten minute time bucket. A duplicate is found
+    by one unique-index probe or by the conflicting insert itself.
+    """
+
+    WINDOW = timedelta(minutes=10)
+
+    seller = models.ForeignKey(
+        Seller, on_delete=models.CASCADE, related_name="idempotency_keys"
+    )
+    key = models.CharField(max_length=255)
+    charge_order = models.ForeignKey(
+        ChargeOrder,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="idempotency_keys",
+    )
+
+    class Meta:
+        db_table = "charge_idempotency_keys"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["seller", "key"], name="unique_charge_idempotency_key"
+            )
+        ]
+
+    def __str__(self):
+        return f"Idempotency key {self.key} of seller {self.seller_id}"
+
+    @classmethod
+    def keys_for(cls, phone_number, amount, client_key=None, now=None):
+        """Return ``(current_key, previous_key)`` for a charge request.
+
+        Derived keys also name the previous bucket, so a retry just after a
+        bucket boundary still matches an order from the last ten minutes.
+        """
+        if client_key:
+            return f"client:{client_key}", None
+
+        phone_number_id = getattr(phone_number, "pk", phone_number)
+        amount = Decimal(amount).quantize(Decimal("0.01"))
+        bucket = int((now or timezone.now()).timestamp() // cls.WINDOW.total_seconds())
+        return (
+            f"{phone_number_id}:{amount}:{bucket}",
+            f"{phone_number_id}:{amount}:{bucket - 1}",
+        )
 
-        return cls.objects.filter(
+    @classmethod
+    def find_recent(cls, seller_id, keys):
+        """Order id recorded under ``keys`` within the window, if any."""
+        for key in keys:
+            if key is None:
+                continue
+            order_id = idempotency_keys.get((seller_id, key))
+            if order_id is not None:
+                return order_id
+
+        # Keys Are Unique Per Seller, No Ordering Needed To Pick One
+        window_start = timezone.now() - cls.WINDOW
+        order_ids = cls.objects.filter(
             seller_id=seller_id,
-            phone_number=phone_number,
-            amount=amount,
-            created_at__gte=ten_minutes_ago,
-        ).first()
+            key__in=[key for key in keys if key is not None],
+            created_at__gte=window_start,
+        ).values_list("charge_order_id", flat=True)[:1]
+        return order_ids[0] if order_ids else None
+
+    @classmethod
+    def find_recent_many(cls, seller_id, keys):
+        """Map each of ``keys`` recorded within the window to its order id."""
+        window_start = timezone.now() - cls.WINDOW
+        return dict(
+            cls.objects.filter(
+                seller_id=seller_id,
+                key__in=keys,
+                created_at__gte=window_start,
+                charge_order__isnull=False,
+            ).values_list("key", "charge_order_id")
+        )
+
+    @classmethod
+    def claim(cls, seller_id, key):
+        """Insert ``key`` for a new charge order.
+
+        Returns the new row, or ``None`` when a live row already holds the
+        key. A row older than the window (client keys only) is reused.
+        """
+        try:
+            with transaction.atomic():
+                return cls.objects.create(seller_id=seller_id, key=key)
+        except IntegrityError:
+            pass
 
+        existing = cls.objects.select_for_update().get(seller_id=seller_id, key=key)
+        if existing.created_at >= timezone.now() - cls.WINDOW:
+            return None
+        existing.created_at = timezone.now()
+        existing.charge_order = None
+        existing.save(update_fields=["created_at", "charge_order", "updated_at"])
+        return existing
 
-class Transaction(AbstractModel):
+    def bind(self, charge_order):
+        self.charge_order = charge_order
+        self.save(update_fields=["charge_order", "updated_at"])
+
+        # Cache Only Once The Order Is Committed
+        cache_key = (self.seller_id, self.key)
+        ttl = (self.created_at + self.WINDOW - timezone.now()).total_seconds()
+        transaction.on_commit(
+            lambda: idempotency_keys.set(cache_key, charge_order.id, ttl=ttl)
+        )
+
+    @classmethod
+    def bind_many(cls, seller_id, orders_by_key):
+        """Record freshly created orders under their keys in one insert."""
+        cls.objects.bulk_create(
+            [
+                cls(seller_id=seller_id, key=key, charge_order=charge_order)
+                for key, charge_order in orders_by_key.items()
+            ]
+        )
+
+        ttl = cls.WINDOW.total_seconds()
+        entries = {
+            (seller_id, key): charge_order.id
+            for key, charge_order in orders_by_key.items()
+        }
+        transaction.on_commit(
+            lambda: [
+                idempotency_keys.set(cache_key, order_id, ttl=ttl)
+                for cache_key, order_id in entries.items()
+            ]
+        )
+
+
+class Transaction(SoftDeleteModel):
     TRANSACTION_TYPE_CHOICES = [
         (1, "Credit_Increase"),
         (2, "Charge_Sale"),
@@ -161,13 +757,11 @@ class Transaction(AbstractModel):
     seller = models.ForeignKey(
         Seller, on_delete=models.CASCADE, related_name="transactions"
     )
-    transaction_type = models.IntegerField(
-        choices=TRANSACTION_TYPE_CHOICES, db_index=True
-    )
+    transaction_type = models.IntegerField(choices=TRANSACTION_TYPE_CHOICES)
     amount = models.DecimalField(
         max_digits=15, decimal_places=2, validators=[MinValueValidator(Decimal("0.01"))]
     )
-    status = models.IntegerField(choices=STATUS_CHOICES, default=1, db_index=True)
+    status = models.IntegerField(choices=STATUS_CHOICES, default=1)
     reference_id = models.CharField(max_length=100, unique=True, db_index=True)
     credit_request = models.ForeignKey(
         CreditRequest,
@@ -204,6 +798,7 @@ class Transaction(AbstractModel):
         max_digits=15,
         decimal_places=2,
     )
+    balance_stripe = models.PositiveSmallIntegerField(null=True, blank=True)
     processed_at = models.DateTimeField(null=True, blank=True)
     processed_by = models.ForeignKey(
         User,
@@ -217,9 +812,14 @@ class Transaction(AbstractModel):
         db_table = "transactions"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["seller", "transaction_type"]),
-            models.Index(fields=["seller", "status"]),
-            models.Index(fields=["status", "created_at"]),
+            live_index("seller", "transaction_type", name="tx_seller_type_live"),
+            live_index("seller", "status", name="tx_seller_status_live"),
+            live_index("seller", "created_at", name="tx_seller_created_live"),
+            live_index("status", "created_at", name="tx_status_created_live"),
+            live_index("transaction_type", "created_at", name="tx_type_created_live"),
+            live_index("phone_number", "created_at", name="tx_phone_created_live"),
+            live_index("credit_request", "created_at", name="tx_credit_created_live"),
+            live_index("created_at", name="tx_created_live"),
         ]
 
     def __str__(self):
@@ -229,19 +829,22 @@ class Transaction(AbstractModel):
         return dict(choices).get(value)
 
     @staticmethod
-    def submit_transaction_for_credit_increase(
-        credit_request, user, balance_after, balance_before
-    ):
+    def submit_transaction_for_credit_increase(credit_request, user):
         seller = credit_request.seller
 
-        # 1-Submit Transaction type and status
+        # 1-Submit Transaction type and status, Apply Balance Change
         transaction_type = 1
         if credit_request.status == CreditRequest.APPROVEDSTATUS:
             status = Transaction.COMPLETESTATUS
-        elif credit_request.status == CreditRequest.REJECCTEDSTATUS:
-            status = Transaction.CANCELEDSTATUS
+            change = Seller.credit(seller.id, credit_request.amount)
         else:
-            status = Transaction.FAILDSTATUS
+            if credit_request.status == CreditRequest.REJECCTEDSTATUS:
+                status = Transaction.CANCELEDSTATUS
+            else:
+                status = Transaction.FAILDSTATUS
+            balance = Seller.current_balance(seller.id)
+            change = BalanceChange(balance, balance)
+            Seller.bump_ledger_version([seller.id])
 
         # 2-Set reference_id and amount
         reference_id = uuid.uuid4()
@@ -252,8 +855,9 @@ class Transaction(AbstractModel):
 
         # 3-Create Transaction
         new_transaction = Transaction.objects.create(
-            balance_before=balance_before,
-            balance_after=balance_after,
+            balance_before=change.balance_before,
+            balance_after=change.balance_after,
+            balance_stripe=change.stripe,
             transaction_type=transaction_type,
             status=status,
             reference_id=reference_id,
@@ -263,28 +867,38 @@ class Transaction(AbstractModel):
             processed_by=processed_by,
             processed_at=processed_at,
         )
+
+        # Keep Daily Summary And Change Feed In The Same DB Transaction
+        TransactionDailySummary.record([new_transaction])
+        LedgerEvent.record_credit_requests([credit_request])
+        LedgerEvent.record_transactions([new_transaction])
         return new_transaction
 
     @staticmethod
     def submit_transaction_for_charge_order(
-        charge_order, seller, user, balance_after, balance_before
+        charge_order, seller, user, status=COMPLETESTATUS
     ):
 
-        # 1-Submit Transaction type and status
+        # 1-Debit Seller Balance, None Means Insufficient Balance
+        change = Seller.debit(seller.id, charge_order.amount)
+        if change is None:
+            return None
+
+        # 2-Submit Transaction type and status, Pending Rows Only Reserve Funds
         transaction_type = 2
-        status = Transaction.COMPLETESTATUS
 
-        # 2-Set reference_id and amount
+        # 3-Set reference_id and amount
         reference_id = uuid.uuid4()
         amount = charge_order.amount
 
         processed_by = user
-        processed_at = datetime.now()
+        processed_at = datetime.now() if status == Transaction.COMPLETESTATUS else None
 
-        # 3-Create Transaction
+        # 4-Create Transaction
         new_transaction = Transaction.objects.create(
-            balance_before=balance_before,
-            balance_after=balance_after,
+            balance_before=change.balance_before,
+            balance_after=change.balance_after,
+            balance_stripe=change.stripe,
             transaction_type=transaction_type,
             status=status,
             reference_id=reference_id,
@@ -294,4 +908,706 @@ class Transaction(AbstractModel):
             processed_by=processed_by,
             processed_at=processed_at,
         )
+
+        # Keep Daily Summary And Change Feed In The Same DB Transaction
+        TransactionDailySummary.record([new_transaction])
+        LedgerEvent.record_transactions([new_transaction])
         return new_transaction
+
+    @staticmethod
+    def submit_transactions_for_credit_requests(credit_requests, user):
+        """Ledger many processed credit requests with one credit per seller.
+
+        Sellers are credited in id order so concurrent bulk calls lock them
+        in the same order. Approved rows of a seller form a running balance
+        chain; rejected rows record the seller balance after the credits.
+        """
+        by_seller = {}
+        for credit_request in sorted(credit_requests, key=lambda cr: cr.id):
+            by_seller.setdefault(credit_request.seller_id, []).append(credit_request)
+
+        # 1-Apply One Grouped Credit Per Seller
+        changes = {}
+        for seller_id in sorted(by_seller):
+            total = sum(
+                (
+                    cr.amount
+                    for cr in by_seller[seller_id]
+                    if cr.status == CreditRequest.APPROVEDSTATUS
+                ),
+                Decimal("0.00"),
+            )
+            if total:
+                changes[seller_id] = Seller.credit(seller_id, total)
+        Seller.bump_ledger_version(set(by_seller) - set(changes))
+        balances = {
+            seller_id: Decimal(balance).quantize(Decimal("0.01"))
+            for seller_id, balance in Seller.current_balances()
+            .filter(id__in=by_seller)
+            .values_list("id", "current_balance")
+        }
+
+        # 2-Build One Ledger Row Per Request
+        processed_at = timezone.now()
+        new_transactions = []
+        for seller_id, seller_requests in by_seller.items():
+            change = changes.get(seller_id)
+            balance_before = change.balance_before if change else None
+            for credit_request in seller_requests:
+                ledger_row = Transaction(
+                    transaction_type=1,
+                    reference_id=uuid.uuid4(),
+                    amount=credit_request.amount,
+                    seller_id=seller_id,
+                    credit_request=credit_request,
+                    processed_by=user,
+                    processed_at=processed_at,
+                )
+                if credit_request.status == CreditRequest.APPROVEDSTATUS:
+                    ledger_row.status = Transaction.COMPLETESTATUS
+                    ledger_row.balance_before = balance_before
+                    ledger_row.balance_after = balance_before + credit_request.amount
+                    ledger_row.balance_stripe = change.stripe
+                    balance_before = ledger_row.balance_after
+                else:
+                    ledger_row.status = Transaction.CANCELEDSTATUS
+                    ledger_row.balance_before = balances[seller_id]
+                    ledger_row.balance_after = balances[seller_id]
+                new_transactions.append(ledger_row)
+
+        # 3-Create Transactions, Update The Daily Summary And Change Feed
+        new_transactions = Transaction.objects.bulk_create(new_transactions)
+        TransactionDailySummary.record(new_transactions)
+        LedgerEvent.record_credit_requests(
+            credit_request
+            for seller_requests in by_seller.values()
+            for credit_request in seller_requests
+        )
+        LedgerEvent.record_transactions(new_transactions)
+        return new_transactions
+
+    @staticmethod
+    def submit_transactions_for_charge_orders(charge_orders, seller, user):
+        """Debit the batch total once and ledger each order as its own row.
+
+        ``charge_orders`` must already be saved. Returns the created
+        transactions, or ``None`` when the balance does not cover the total.
+        """
+        total = sum((order.amount for order in charge_orders), Decimal("0.00"))
+
+        # 1-Debit The Whole Batch In One Guarded Statement
+        change = Seller.debit(seller.id, total)
+        if change is None:
+            return None
+
+        # 2-Split The Debit Into A Running Balance Chain, One Row Per Order
+        processed_at = timezone.now()
+        balance_before = change.balance_before
+        new_transactions = []
+        for charge_order in charge_orders:
+            balance_after = balance_before - charge_order.amount
+            new_transactions.append(
+                Transaction(
+                    balance_before=balance_before,
+                    balance_after=balance_after,
+                    balance_stripe=change.stripe,
+                    transaction_type=2,
+                    status=Transaction.COMPLETESTATUS,
+                    reference_id=uuid.uuid4(),
+                    amount=charge_order.amount,
+                    seller=seller,
+                    charge_order=charge_order,
+                    processed_by=user,
+                    processed_at=processed_at,
+                )
+            )
+            balance_before = balance_after
+
+        # 3-Create Transactions, Update The Daily Summary And Change Feed
+        new_transactions = Transaction.objects.bulk_create(new_transactions)
+        TransactionDailySummary.record(new_transactions)
+        LedgerEvent.record_transactions(new_transactions)
+        return new_transactions
+
+
+class TransactionDailySummary(AbstractModel):
+    """Per seller, day and type running totals of the ledger.
+
+    Rows are bumped in the same DB transaction as the ledger insert, so
+    /transactions/summary/ reads a handful of rows instead of grouping the
+    whole transactions table. ``rebuild_transaction_summaries`` regenerates
+    them from the ledger.
+    """
+
+    seller = models.ForeignKey(
+        Seller, on_delete=models.CASCADE, related_name="daily_summaries"
+    )
+    day = models.DateField()
+    transaction_type = models.IntegerField(choices=Transaction.TRANSACTION_TYPE_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+    total_amount = models.DecimalField(
+        max_digits=18, decimal_places=2, default=Decimal("0.00")
+    )
+
+    class Meta:
+        db_table = "transaction_daily_summaries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["seller", "day", "transaction_type"],
+                name="unique_transaction_daily_summary",
+            )
+        ]
+
+    def __str__(self):
+        return f"Summary {self.seller_id} {self.day} ({self.transaction_type})"
+
+    @classmethod
+    def record(cls, transactions):
+        totals = {}
+        for ledger_row in transactions:
+            key = (
+                ledger_row.seller_id,
+                timezone.localdate(ledger_row.created_at),
+                ledger_row.transaction_type,
+            )
+            count, amount = totals.get(key, (0, Decimal("0.00")))
+            totals[key] = (count + 1, amount + ledger_row.amount)
+
+        for (seller_id, day, transaction_type), (count, amount) in totals.items():
+            cls._add(seller_id, day, transaction_type, count, amount)
+
+    @classmethod
+    def discard(cls, queryset):
+        """Take the ledger rows of ``queryset`` back out of their days."""
+        groups = (
+            queryset.annotate(day=TruncDate("created_at"))
+            .values("seller_id", "day", "transaction_type")
+            .annotate(count=models.Count("id"), total_amount=Sum("amount"))
+            .order_by()
+        )
+        for group in groups:
+            cls.objects.filter(
+                seller_id=group["seller_id"],
+                day=group["day"],
+                transaction_type=group["transaction_type"],
+            ).update(
+                count=models.F("count") - group["count"],
+                total_amount=models.F("total_amount") - group["total_amount"],
+                updated_at=timezone.now(),
+            )
+
+    @classmethod
+    def _add(cls, seller_id, day, transaction_type, count, amount):
+        rows = cls.objects.filter(
+            seller_id=seller_id, day=day, transaction_type=transaction_type
+        )
+        if rows.update(
+            count=models.F("count") + count,
+            total_amount=models.F("total_amount") + amount,
+            updated_at=timezone.now(),
+        ):
+            return
+
+        # First Row Of The Day, A Concurrent Insert Falls Back To The Update
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    seller_id=seller_id,
+                    day=day,
+                    transaction_type=transaction_type,
+                    count=count,
+                    total_amount=amount,
+                )
+        except IntegrityError:
+            rows.update(
+                count=models.F("count") + count,
+                total_amount=models.F("total_amount") + amount,
+                updated_at=timezone.now(),
+            )
+
+
+class ChargeJob(AbstractModel):
+    """Settlement work for a charge order accepted asynchronously.
+
+    The order's funds are already reserved by a pending charge transaction;
+    ``run_charge_workers`` processes claim jobs in batches and settle them.
+    """
+
+    STATUS_CHOICES = [
+        (1, "Pending"),
+        (2, "Processing"),
+        (3, "Completed"),
+        (4, "Failed"),
+    ]
+    PENDINGSTATUS = 1
+    PROCESSINGSTATUS = 2
+    COMPLETESTATUS = 3
+    FAILDSTATUS = 4
+
+    MAX_ATTEMPTS = 5
+
+    charge_order = models.OneToOneField(
+        ChargeOrder, on_delete=models.CASCADE, related_name="job"
+    )
+    status = models.IntegerField(choices=STATUS_CHOICES, default=1)
+    attempts = models.IntegerField(default=0)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    error_message = models.TextField(blank=True)
+
+    class Meta:
+        db_table = "charge_jobs"
+        indexes = [
+            models.Index(fields=["status", "locked_at"]),
+        ]
+
+    def __str__(self):
+        return f"Job {self.id} for order {self.charge_order_id} ({self.status})"
+
+    @classmethod
+    def claim_batch(cls, worker, size, stale_after=timedelta(minutes=5)):
+        """Mark up to ``size`` jobs as processing for ``worker``.
+
+        Jobs left processing by a crashed worker are reclaimed after
+        ``stale_after``. The claim is a single UPDATE re-checking the job
+        status, tagged with a per-claim token, so two workers never take the
+        same job and no read lock has to be upgraded to a write lock.
+        """
+        now = timezone.now()
+        token = f"{worker}:{uuid.uuid4().hex[:12]}"
+        claimable = models.Q(status=cls.PENDINGSTATUS) | models.Q(
+            status=cls.PROCESSINGSTATUS, locked_at__lt=now - stale_after
+        )
+
+        next_jobs = cls.objects.filter(claimable).order_by("id").values("id")[:size]
+        claimed = cls.objects.filter(claimable, id__in=Subquery(next_jobs)).update(
+            status=cls.PROCESSINGSTATUS,
+            locked_by=token,
+            locked_at=now,
+            attempts=models.F("attempts") + 1,
+            updated_at=now,
+        )
+        if not claimed:
+            return []
+        return list(
+            cls.objects.filter(locked_by=token, status=cls.PROCESSINGSTATUS)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    @classmethod
+    def settle_batch(cls, job_ids):
+        """Complete the reserved charge transactions of ``job_ids``."""
+        now = timezone.now()
+        with immediate_atomic():
+            reserved = list(
+                Transaction.objects.filter(
+                    charge_order__job__id__in=job_ids,
+                    status=Transaction.PENDINGSTATUS,
+                ).order_by("id")
+            )
+            Transaction.objects.filter(id__in=[row.id for row in reserved]).update(
+                status=Transaction.COMPLETESTATUS, processed_at=now, updated_at=now
+            )
+            for row in reserved:
+                row.status = Transaction.COMPLETESTATUS
+            LedgerEvent.record_transactions(
+                reserved, LedgerEvent.TRANSACTION_STATUS_CHANGED
+            )
+            cls.objects.filter(id__in=job_ids).update(
+                status=cls.COMPLETESTATUS, error_message="", updated_at=now
+            )
+            Seller.bump_ledger_version(
+                ChargeOrder.objects.filter(job__id__in=job_ids).values("seller")
+            )
+
+    @classmethod
+    def release_batch(cls, job_ids, error):
+        """Put failed jobs back in the queue, refunding those out of attempts."""
+        now = timezone.now()
+        with immediate_atomic():
+            cls.objects.filter(id__in=job_ids, attempts__lt=cls.MAX_ATTEMPTS).update(
+                status=cls.PENDINGSTATUS, error_message=error, updated_at=now
+            )
+            exhausted = cls.objects.select_related("charge_order").filter(
+                id__in=job_ids, attempts__gte=cls.MAX_ATTEMPTS
+            )
+            for job in exhausted:
+                job.fail(error)
+
+    def fail(self, error):
+        """Mark the job failed and give the reserved funds back."""
+        charge_order = self.charge_order
+        now = timezone.now()
+
+        reserved = list(
+            Transaction.objects.filter(
+                charge_order=charge_order, status=Transaction.PENDINGSTATUS
+            )
+        )
+        Transaction.objects.filter(id__in=[row.id for row in reserved]).update(
+            status=Transaction.FAILDSTATUS, processed_at=now, updated_at=now
+        )
+        for row in reserved:
+            row.status = Transaction.FAILDSTATUS
+        LedgerEvent.record_transactions(
+            reserved, LedgerEvent.TRANSACTION_STATUS_CHANGED
+        )
+        if reserved:
+            change = Seller.credit(charge_order.seller_id, charge_order.amount)
+            refund = Transaction.objects.create(
+                balance_before=change.balance_before,
+                balance_after=change.balance_after,
+                balance_stripe=change.stripe,
+                transaction_type=1,
+                status=Transaction.COMPLETESTATUS,
+                reference_id=uuid.uuid4(),
+                amount=charge_order.amount,
+                seller_id=charge_order.seller_id,
+                phone_number_id=charge_order.phone_number_id,
+                processed_at=now,
+            )
+            TransactionDailySummary.record([refund])
+            LedgerEvent.record_transactions([refund])
+
+        charge_order.error_message = error
+        charge_order.save(update_fields=["error_message", "updated_at"])
+        Seller.bump_ledger_version([charge_order.seller_id])
+        self.status = self.FAILDSTATUS
+        self.error_message = error
+        self.save(update_fields=["status", "error_message", "updated_at"])
+
+
+class ReconciliationCheckpoint(AbstractModel):
+    """How far the ledger reconciliation got for a seller.
+
+    ``state`` holds the running chain totals in minor units, so the next run
+    only reads transactions after ``last_transaction_id``. Both stop before
+    the first chunk with issues, which are reported again until fixed.
+    """
+
+    seller = models.OneToOneField(
+        Seller, on_delete=models.CASCADE, related_name="reconciliation_checkpoint"
+    )
+    last_transaction_id = models.BigIntegerField(default=0)
+    state = models.JSONField(default=dict)
+    checked_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "reconciliation_checkpoints"
+
+    def __str__(self):
+        return f"Reconciled seller {self.seller_id} up to {self.last_transaction_id}"
+
+
+class BalanceCheckpoint(AbstractModel):
+    """A seller balance as of a point in time.
+
+    Point-in-time lookups add up ledger rows from the nearest checkpoint
+    when the rows themselves cannot tell the seller balance.
+    """
+
+    seller = models.ForeignKey(
+        Seller, on_delete=models.CASCADE, related_name="balance_checkpoints"
+    )
+    as_of = models.DateTimeField()
+    balance = models.DecimalField(max_digits=15, decimal_places=2)
+
+    class Meta:
+        db_table = "balance_checkpoints"
+        ordering = ["-as_of"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["seller", "as_of"], name="unique_seller_balance_checkpoint"
+            )
+        ]
+
+    def __str__(self):
+        return f"Seller {self.seller_id} balance {self.balance} as of {self.as_of}"
+
+    @classmethod
+    def take(cls, seller_id):
+        """Record the current balance; call inside a write transaction.
+
+        The write lock keeps ledger rows from landing between reading the
+        balance and stamping ``as_of``.
+        """
+        return cls.objects.create(
+            seller_id=seller_id,
+            as_of=timezone.now(),
+            balance=Seller.current_balance(seller_id),
+        )
+
+
+class ArchiveWatermark(AbstractModel):
+    """Upper bound on ``created_at`` of the rows moved into an archive table.
+
+    Queries whose date range starts at or after it never need the archive.
+    """
+
+    TRANSACTIONS = "transactions"
+    CHARGE_ORDERS = "charge_orders"
+
+    name = models.CharField(max_length=50, unique=True)
+    archived_before = models.DateTimeField()
+
+    class Meta:
+        db_table = "archive_watermarks"
+
+    @classmethod
+    def get(cls, name):
+        return (
+            cls.objects.filter(name=name)
+            .values_list("archived_before", flat=True)
+            .first()
+        )
+
+    @classmethod
+    async def aget(cls, name):
+        return (
+            await cls.objects.filter(name=name)
+            .values_list("archived_before", flat=True)
+            .afirst()
+        )
+
+    @classmethod
+    def advance(cls, name, archived_before):
+        updated = cls.objects.filter(
+            name=name, archived_before__lt=archived_before
+        ).update(archived_before=archived_before, updated_at=timezone.now())
+        if not updated:
+            try:
+                with transaction.atomic():
+                    cls.objects.create(name=name, archived_before=archived_before)
+            except IntegrityError:
+                pass
+
+
+class AbstractArchiveModel(models.Model):
+    """Columns of AbstractModel for rows copied out of a live table.
+
+    Ids and timestamps are copied as they are, so there is no auto
+    increment or auto_now here, and foreign keys carry no constraint
+    because the rows they point at may be archived or deleted later.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    created_at = models.DateTimeField(db_index=True, null=True)
+    updated_at = models.DateTimeField(null=True)
+    deleted_at = models.DateTimeField(null=True)
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+
+    class Meta:
+        abstract = True
+
+
+class ArchivedChargeOrder(AbstractArchiveModel):
+    seller = models.ForeignKey(
+        Seller, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    phone_number = models.ForeignKey(
+        PhoneNumber, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    error_message = models.TextField(blank=True)
+    retry_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "archived_charge_orders"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["seller", "created_at"]),
+        ]
+
+
+class ArchivedTransaction(AbstractArchiveModel):
+    seller = models.ForeignKey(
+        Seller, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    transaction_type = models.IntegerField(choices=Transaction.TRANSACTION_TYPE_CHOICES)
+    amount = models.DecimalField(max_digits=15, decimal_places=2)
+    status = models.IntegerField(choices=Transaction.STATUS_CHOICES)
+    reference_id = models.CharField(max_length=100, unique=True)
+    credit_request = models.ForeignKey(
+        CreditRequest,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    phone_number = models.ForeignKey(
+        PhoneNumber,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    charge_amount = models.DecimalField(
+        max_digits=10, decimal_places=0, null=True, blank=True
+    )
+    charge_order = models.ForeignKey(
+        ChargeOrder,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    balance_before = models.DecimalField(max_digits=15, decimal_places=2)
+    balance_after = models.DecimalField(max_digits=15, decimal_places=2)
+    balance_stripe = models.PositiveSmallIntegerField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    processed_by = models.ForeignKey(
+        User,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+
+    class Meta:
+        db_table = "archived_transactions"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["seller", "created_at"]),
+        ]
+
+
+class RateLimitBucket(models.Model):
+    """Token bucket shared by every worker process through the database.
+
+    ``tokens`` and ``refilled_at`` (unix seconds) are only touched by the
+    single UPSERT in ``consume``, which refills and takes a token at once.
+    """
+
+    key = models.CharField(max_length=100, unique=True)
+    tokens = models.FloatField()
+    refilled_at = models.FloatField()
+
+    class Meta:
+        db_table = "rate_limit_buckets"
+
+    def __str__(self):
+        return f"{self.key}: {self.tokens:.1f} tokens"
+
+    @classmethod
+    def consume(cls, key, burst, rate, now):
+        """Take one token from ``key``; return 0 or the seconds until one is free."""
+        quote = connection.ops.quote_name
+        table = quote(cls._meta.db_table)
+        key_column, tokens_column, refilled_column = (
+            quote(cls._meta.get_field(name).column)
+            for name in ("key", "tokens", "refilled_at")
+        )
+        refilled = (
+            f"MIN(%s, {table}.{tokens_column} + (%s - {table}.{refilled_column}) * %s)"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} "
+                f"({key_column}, {tokens_column}, {refilled_column}) "
+                f"VALUES (%s, %s, %s) ON CONFLICT({key_column}) DO UPDATE SET "
+                f"{tokens_column} = {refilled} - 1, "
+                f"{refilled_column} = excluded.{refilled_column} "
+                f"WHERE {refilled} >= 1 RETURNING {tokens_column}",
+                [key, burst - 1, now, burst, now, rate, burst, now, rate],
+            )
+            if cursor.fetchone() is not None:
+                return 0.0
+
+            # 1-Empty Bucket, Work Out When The Next Token Drips In
+            cursor.execute(
+                f"SELECT {tokens_column}, {refilled_column} FROM {table} "
+                f"WHERE {key_column} = %s",
+                [key],
+            )
+            tokens, refilled_at = cursor.fetchone()
+        available = min(burst, tokens + (now - refilled_at) * rate)
+        return max((1 - available) / rate, 0.0)
+
+
+class LedgerEvent(models.Model):
+    """Append-only outbox of ledger changes, served by /transactions/changes/.
+
+    Events are inserted in the DB transaction making the change. Writers
+    hold the database write lock from their first write until commit, so ids
+    become visible in order and the last id read is a resumable cursor.
+    """
+
+    TRANSACTION_CREATED = "transaction.created"
+    TRANSACTION_STATUS_CHANGED = "transaction.status_changed"
+    CREDIT_REQUEST_STATUS_CHANGED = "credit_request.status_changed"
+    EVENT_TYPE_CHOICES = [
+        (TRANSACTION_CREATED, "Transaction Created"),
+        (TRANSACTION_STATUS_CHANGED, "Transaction Status Changed"),
+        (CREDIT_REQUEST_STATUS_CHANGED, "Credit Request Status Changed"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    event_type = models.CharField(max_length=40, choices=EVENT_TYPE_CHOICES)
+    # Plain Columns, Events Outlive Archived Or Deleted Rows
+    seller = models.ForeignKey(
+        Seller,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+    )
+    transaction = models.ForeignKey(
+        Transaction,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        null=True,
+        related_name="+",
+    )
+    credit_request = models.ForeignKey(
+        CreditRequest,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        null=True,
+        related_name="+",
+    )
+    status = models.IntegerField()
+    amount = models.DecimalField(max_digits=15, decimal_places=2)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "ledger_events"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["seller", "id"]),
+        ]
+
+    @classmethod
+    def record_transactions(cls, transactions, event_type=TRANSACTION_CREATED):
+        cls.objects.bulk_create(
+            cls(
+                event_type=event_type,
+                seller_id=ledger_row.seller_id,
+                transaction_id=ledger_row.id,
+                credit_request_id=ledger_row.credit_request_id,
+                status=ledger_row.status,
+                amount=ledger_row.amount,
+            )
+            for ledger_row in transactions
+        )
+
+    @classmethod
+    def record_credit_requests(cls, credit_requests):
+        cls.objects.bulk_create(
+            cls(
+                event_type=cls.CREDIT_REQUEST_STATUS_CHANGED,
+                seller_id=credit_request.seller_id,
+                credit_request_id=credit_request.id,
+                status=credit_request.status,
+                amount=credit_request.amount,
+            )
+            for credit_request in credit_requests
+        )
@@ -0,0 +1,196 @@
+import base64
+import heapq
+import json
+from itertools import islice
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination on ``(created_at, id)``, newest first.
+
+    The cursor holds the last row's key, so every page is a range scan on
+    the ``created_at`` indexes and deep pages cost the same as the first.
+    """
+
+    page_size = 100
+    max_page_size = 1000
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_querysets([queryset], request, view)
+
+    def paginate_querysets(self, querysets, request, view=None):
+        """Paginate the newest-first merge of several querysets.
+
+        Rows must come back as dicts when more than one queryset is given.
+        """
+        position = self.start(request)
+        pages = [
+            list(self.slice(queryset, position)[: self.page_size + 1])
+            for queryset in querysets
+        ]
+        return self.merge(pages)
+
+    async def apaginate_querysets(self, querysets, request, view=None):
+        """``paginate_querysets`` on the async ORM."""
+        position = self.start(request)
+        pages = []
+        for queryset in querysets:
+            queryset = self.slice(queryset, position)[: self.page_size + 1]
+            pages.append([row async for row in queryset.aiterator()])
+        return self.merge(pages)
+
+    def start(self, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        return self.decode_cursor(request)
+
+    def merge(self, pages):
+        if len(pages) == 1:
+            page = pages[0]
+        else:
+            page = heapq.merge(
+                *pages, key=lambda row: (row["created_at"], row["id"]), reverse=True
+            )
+            page = list(islice(page, self.page_size + 1))
+        self.has_next = len(page) > self.page_size
+        page = page[: self.page_size]
+        self.next_position = self.get_position(page[-1]) if self.has_next else None
+        return page
+
+    @staticmethod
+    def slice(queryset, position):
+        queryset = queryset.order_by("-created_at", "-id")
+        if position is not None:
+            created_at, pk = position
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )
+        return queryset
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    @staticmethod
+    def get_position(item):
+        if isinstance(item, dict):
+            return item["created_at"], item["id"]
+        return item.created_at, item.pk
+
+    @staticmethod
+    def encode_cursor(position):
+        created_at, pk = position
+        payload = json.dumps([created_at.isoformat(), pk]).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            created_at, pk = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            created_at = parse_datetime(created_at)
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+
+class ChangeFeedPagination(KeysetPagination):
+    """Ascending pages of an id ordered feed, resumed with ``?since=<id>``.
+
+    The cursor is the id of the last row read, so each page is one range
+    read on the primary key (or a ``(filter, id)`` index) and a consumer
+    can store it and pick up where it stopped.
+    """
+
+    page_size = 500
+    max_page_size = 5000
+    cursor_query_param = "since"
+
+    def paginate_querysets(self, querysets, request, view=None):
+        (queryset,) = querysets
+        since = self.start(request)
+        if since is not None:
+            queryset = queryset.filter(id__gt=since)
+        page = list(queryset.order_by("id")[: self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[: self.page_size]
+        self.next_position = self.get_position(page[-1]) if page else since
+        return page
+
+    def get_paginated_response(self, data):
+        cursor = None if self.next_position is None else str(self.next_position)
+        return Response(
+            {
+                "cursor": cursor,
+                "has_more": self.has_next,
+                "next": self.get_next_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["cursor", "has_more", "results"],
+            "properties": {
+                "cursor": {"type": "string", "nullable": True},
+                "has_more": {"type": "boolean"},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    @staticmethod
+    def get_position(item):
+        return item["id"] if isinstance(item, dict) else item.pk
+
+    @staticmethod
+    def encode_cursor(position):
+        return str(position)
+
+    def decode_cursor(self, request):
+        since = request.query_params.get(self.cursor_query_param)
+        if not since:
+            return None
+        if not since.isdigit():
+            raise NotFound(self.invalid_cursor_message)
+        return int(since)
@@ -0,0 +1,254 @@
+import random
+import re
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connections
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .caches import idempotency_keys
+from .models import (
+    ChargeIdempotencyKey,
+    ChargeOrder,
+    CreditRequest,
+    PhoneNumber,
+    Seller,
+    Transaction,
+    TransactionDailySummary,
+    User,
+)
+
+# Plan Lines That Mean Every Row Of A Table Or A Sort Of The Result Is Read
+FULL_SCAN = re.compile(r"^SCAN \S+$")
+INDEX_SCAN = re.compile(r"^SCAN \S+ USING (COVERING )?INDEX ")
+TEMP_BTREE = re.compile(r"USE TEMP B-TREE")
+LIMIT = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
+class StatementCollector:
+    """execute_wrapper keeping the SELECT statements run with their params."""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith("SELECT"):
+            self.statements.append((sql, params))
+        return execute(sql, params, many, context)
+
+
+def explain(sql, params, using="default"):
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def plan_problems(sql, plan):
+    """Plan lines reading a whole table, or a whole index without a LIMIT."""
+    bounded = LIMIT.search(sql) is not None
+    return [
+        detail
+        for detail in plan
+        if FULL_SCAN.match(detail)
+        or TEMP_BTREE.search(detail)
+        or (INDEX_SCAN.match(detail) and not bounded)
+    ]
+
+
+def api_get(path, params=lambda sample: {}, user="admin"):
+    def run(sample, client):
+        client.force_authenticate(user=sample[user])
+        response = client.get(path, params(sample))
+        if response.status_code != 200:
+            raise AssertionError(f"GET {path} returned {response.status_code}")
+
+    return run
+
+
+def recent_order(sample, client):
+    # The Process Cache Would Hide The Query
+    idempotency_keys.clear()
+    ChargeOrder.get_recent_order(
+        sample["seller_id"], sample["phone_number_id"], sample["amount"]
+    )
+
+
+def date_range(sample):
+    return {"date_from": sample["date_from"], "date_to": sample["date_to"]}
+
+
+HOT_QUERIES = {
+    "get_recent_order": recent_order,
+    "transactions": api_get("/transactions/"),
+    "transactions by type": api_get("/transactions/", lambda s: {"type": 2}),
+    "transactions by seller": api_get(
+        "/transactions/", lambda s: {"seller": s["seller_id"]}
+    ),
+    "transactions by phone number": api_get(
+        "/transactions/", lambda s: {"phone_number": s["phone_number_id"]}
+    ),
+    "transactions by status": api_get(
+        "/transactions/", lambda s: {"status": Transaction.PENDINGSTATUS}
+    ),
+    "transactions by date range": api_get("/transactions/", date_range),
+    "transactions by seller and date range": api_get(
+        "/transactions/", lambda s: {"seller": s["seller_id"], **date_range(s)}
+    ),
+    "summary by date range": api_get("/transactions/summary/", date_range),
+    "summary by seller and date range": api_get(
+        "/transactions/summary/", lambda s: {"seller": s["seller_id"], **date_range(s)}
+    ),
+    "summary by status": api_get(
+        "/transactions/summary/", lambda s: {"status": Transaction.PENDINGSTATUS}
+    ),
+    "summary by phone number and date range": api_get(
+        "/transactions/summary/",
+        lambda s: {"phone_number": s["phone_number_id"], **date_range(s)},
+    ),
+    "charge order list": api_get("/charge-orders-list/", user="seller_user"),
+    "pending credit requests": api_get(
+        "/credit-requests/", lambda s: {"status": "pending"}
+    ),
+    "ledger changes": api_get("/transactions/changes/", lambda s: {"since": 1}),
+    "ledger changes by seller": api_get(
+        "/transactions/changes/", lambda s: {"seller": s["seller_id"], "since": 1}
+    ),
+}
+
+
+def check_hot_queries(sample, names=None, using="default"):
+    """Run each hot path and return ``{name: [(sql, plan, problems), ...]}``."""
+    client = APIClient()
+    results = {}
+    for name, run in HOT_QUERIES.items():
+        if names and name not in names:
+            continue
+        collector = StatementCollector()
+        with connections[using].execute_wrapper(collector):
+            run(sample, client)
+        results[name] = []
+        for sql, params in collector.statements:
+            plan = explain(sql, params, using)
+            results[name].append((sql, plan, plan_problems(sql, plan)))
+    return results
+
+
+def seed(sellers=20, phone_numbers=500, transactions=20000, seed=0):
+    """Fill the ledger tables with a spread of synthetic rows, then ANALYZE.
+
+    Returns the ids and users the hot queries are run with.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+
+    users = User.objects.bulk_create(
+        [User(username=f"plan-seller-{index}") for index in range(sellers)]
+    )
+    admin = User.objects.create(username="plan-admin", is_staff=True)
+    seller_rows = Seller.objects.bulk_create(
+        [Seller(user=user, balance=Decimal("1000000.00")) for user in users]
+    )
+    phones = PhoneNumber.objects.bulk_create(
+        [PhoneNumber(phone_number=f"0930{index:07d}") for index in range(phone_numbers)]
+    )
+
+    # 1-A Queue Of Credit Requests, Mostly Processed
+    credit_requests = CreditRequest.objects.bulk_create(
+        [
+            CreditRequest(
+                seller=rng.choice(seller_rows),
+                amount=Decimal(index + 1),
+                status=rng.choices(
+                    [
+                        CreditRequest.PENDINGSTATUS,
+                        CreditRequest.APPROVEDSTATUS,
+                        CreditRequest.REJECCTEDSTATUS,
+                    ],
+                    weights=[5, 85, 10],
+                )[0],
+            )
+            for index in range(max(transactions // 10, 1))
+        ],
+        batch_size=2000,
+    )
+    credit_requests = [
+        credit_request
+        for credit_request in credit_requests
+        if credit_request.status != CreditRequest.PENDINGSTATUS
+    ]
+
+    # 2-Charge Orders, Their Idempotency Keys And Ledger Rows Over Ninety Days
+    orders = []
+    ledger = []
+    timestamps = []
+    for index in range(transactions):
+        seller = rng.choice(seller_rows)
+        phone = rng.choice(phones)
+        amount = Decimal(rng.choice((1000, 2000, 5000, 10000)))
+        timestamps.append(now - timedelta(seconds=rng.randrange(90 * 86400)))
+        status = rng.choices(
+            [
+                Transaction.COMPLETESTATUS,
+                Transaction.PENDINGSTATUS,
+                Transaction.FAILDSTATUS,
+                Transaction.CANCELEDSTATUS,
+            ],
+            weights=[90, 4, 4, 2],
+        )[0]
+        transaction_type = 2 if rng.random() < 0.9 else 1
+        if transaction_type == 2:
+            orders.append(ChargeOrder(seller=seller, phone_number=phone, amount=amount))
+        ledger.append(
+            Transaction(
+                seller=seller,
+                phone_number=phone if transaction_type == 2 else None,
+                transaction_type=transaction_type,
+                amount=amount,
+                status=status,
+                reference_id=uuid.uuid4(),
+                balance_before=Decimal("0.00"),
+                balance_after=Decimal("0.00"),
+            )
+        )
+    orders = ChargeOrder.objects.bulk_create(orders, batch_size=2000)
+    ChargeIdempotencyKey.objects.bulk_create(
+        [
+            ChargeIdempotencyKey(
+                seller=order.seller,
+                key=ChargeIdempotencyKey.keys_for(order.phone_number, order.amount)[0],
+                charge_order=order,
+            )
+            for order in orders
+        ],
+        ignore_conflicts=True,
+        batch_size=2000,
+    )
+    charges = iter(orders)
+    for ledger_row in ledger:
+        if ledger_row.transaction_type == 2:
+            ledger_row.charge_order = next(charges)
+        elif credit_requests:
+            ledger_row.credit_request = credit_requests.pop()
+    ledger = Transaction.objects.bulk_create(ledger, batch_size=2000)
+    # auto_now_add Stamped Every Row With Now, Ids Grow With Time As In Production
+    for ledger_row, created_at in zip(ledger, sorted(timestamps)):
+        ledger_row.created_at = created_at
+    Transaction.objects.bulk_update(ledger, ["created_at"], batch_size=2000)
+    TransactionDailySummary.record(ledger)
+
+    with connections["default"].cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    order = orders[0]
+    return {
+        "admin": admin,
+        "seller_user": order.seller.user,
+        "seller_id": order.seller_id,
+        "transaction_id": ledger[-1].id,
+        "phone_number_id": order.phone_number_id,
+        "amount": order.amount,
+        "date_from": (now - timedelta(days=7)).date().isoformat(),
+        "date_to": now.date().isoformat(),
+    }
@@ -0,0 +1,169 @@
+from itertools import islice
+
+import numpy as np
+from django.db.models import BigIntegerField, F, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Greatest, Round
+from django.utils import timezone
+
+from .archive import merge_by_id
+from .models import (
+    ArchivedTransaction,
+    ReconciliationCheckpoint,
+    Seller,
+    Transaction,
+    stripes_total,
+)
+
+MINOR_UNITS = 100
+CREDIT_INCREASE = 1
+UNSTRIPED = -1
+COLUMNS = (
+    "id",
+    "stripe",
+    "transaction_type",
+    "amount_minor",
+    "before_minor",
+    "after_minor",
+)
+ISSUE_SAMPLE = 20
+
+
+def minor_units(expression):
+    return Cast(Round(expression * MINOR_UNITS), BigIntegerField())
+
+
+def new_state():
+    return {"opening": None, "started": False, "last_after": None, "delta": 0}
+
+
+def seller_snapshot(seller_id):
+    """Balance, stripe total and newest transaction id, read in one statement."""
+    last_ids = [
+        Coalesce(
+            Subquery(
+                model.objects.filter(seller=OuterRef("pk"))
+                .order_by("-id")
+                .values("id")[:1]
+            ),
+            Value(0),
+        )
+        for model in (Transaction, ArchivedTransaction)
+    ]
+    return (
+        Seller.objects.filter(pk=seller_id)
+        .annotate(
+            balance_minor=minor_units(F("balance")),
+            stripes_minor=minor_units(Subquery(stripes_total())),
+            last_transaction_id=Greatest(*last_ids),
+        )
+        .values("balance_minor", "stripes_minor", "last_transaction_id")
+        .first()
+    )
+
+
+def ledger_chunks(seller_id, after_id, up_to_id, chunk_size):
+    """Yield the seller's transactions in id order as int64 arrays."""
+    # Archived Rows Belong To The Chain Until A Checkpoint Has Passed Them
+    rows = merge_by_id(
+        *(
+            model.objects.filter(seller_id=seller_id, id__gt=after_id, id__lte=up_to_id)
+            .order_by("id")
+            .annotate(
+                stripe=Coalesce("balance_stripe", Value(UNSTRIPED)),
+                amount_minor=minor_units(F("amount")),
+                before_minor=minor_units(F("balance_before")),
+                after_minor=minor_units(F("balance_after")),
+            )
+            .values_list(*COLUMNS)
+            .iterator(chunk_size=chunk_size)
+            for model in (ArchivedTransaction, Transaction)
+        )
+    )
+    while chunk := list(islice(rows, chunk_size)):
+        yield np.array(chunk, dtype=np.int64)
+
+
+def check_chunk(state, rows):
+    """Fold one chunk into ``state`` and return the ids of suspicious rows.
+
+    Rows with equal before and after balances are snapshots (rejected
+    credits) and do not take part in the checks.
+    """
+    ids, stripes, types, amounts, before, after = rows.T
+    moving = before != after
+    signed = np.where(types == CREDIT_INCREASE, amounts, -amounts)
+    amount_mismatches = ids[moving & (after - before != signed)]
+
+    if not state["started"] and moving.any():
+        first = np.argmax(moving)
+        state["started"] = True
+        # Stripes Are Carved Out Of The Balance Without A Ledger Row
+        if stripes[first] == UNSTRIPED:
+            state["opening"] = int(before[first])
+
+    # Consolidation Moves Money Between Stripes, Only The Unstriped Chain Links Up
+    chain = moving & (stripes == UNSTRIPED)
+    chain_breaks = ids[:0]
+    if chain.any():
+        chain_before, chain_after = before[chain], after[chain]
+        previous = np.empty_like(chain_before)
+        previous[0] = (
+            chain_before[0] if state["last_after"] is None else state["last_after"]
+        )
+        previous[1:] = chain_after[:-1]
+        chain_breaks = ids[chain][chain_before != previous]
+        state["last_after"] = int(chain_after[-1])
+
+    state["delta"] += int(signed[moving].sum())
+    return chain_breaks, amount_mismatches
+
+
+def reconcile_seller(seller_id, chunk_size):
+    snapshot = seller_snapshot(seller_id)
+    checkpoint, _ = ReconciliationCheckpoint.objects.get_or_create(seller_id=seller_id)
+    state = {**new_state(), **checkpoint.state}
+    up_to_id = snapshot["last_transaction_id"] or 0
+
+    rows = 0
+    chain_breaks = []
+    amount_mismatches = []
+    # The Checkpoint Stops Before The First Chunk With Issues
+    clean_id = max(checkpoint.last_transaction_id, up_to_id)
+    clean_state = None
+    for chunk in ledger_chunks(
+        seller_id, checkpoint.last_transaction_id, up_to_id, chunk_size
+    ):
+        chunk_state = dict(state)
+        breaks, mismatches = check_chunk(state, chunk)
+        rows += len(chunk)
+        chain_breaks.extend(breaks[:ISSUE_SAMPLE].tolist())
+        amount_mismatches.extend(mismatches[:ISSUE_SAMPLE].tolist())
+        if clean_state is None and (len(breaks) or len(mismatches)):
+            clean_id = int(chunk[0, 0]) - 1
+            clean_state = chunk_state
+
+    balance = snapshot["stripes_minor"]
+    if balance is None:
+        balance = snapshot["balance_minor"]
+    expected = None if state["opening"] is None else state["opening"] + state["delta"]
+
+    checkpoint.last_transaction_id = clean_id
+    checkpoint.state = state if clean_state is None else clean_state
+    checkpoint.checked_at = timezone.now()
+    checkpoint.save(
+        update_fields=["last_transaction_id", "state", "checked_at", "updated_at"]
+    )
+
+    return {
+        "seller": seller_id,
+        "rows": rows,
+        "balance": balance,
+        "expected": expected,
+        "balance_mismatch": expected is not None and expected != balance,
+        "chain_breaks": chain_breaks[:ISSUE_SAMPLE],
+        "amount_mismatches": amount_mismatches[:ISSUE_SAMPLE],
+    }
+
+
+def reconcile_sellers(seller_ids, chunk_size):
+    return [reconcile_seller(seller_id, chunk_size) for seller_id in seller_ids]
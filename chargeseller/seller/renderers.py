@@ -0,0 +1,164 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import orjson
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Keys Holding Money, Rendered As Strings By The Serializers
+MONEY_FIELDS = frozenset(
+    {
+        "amount",
+        "balance",
+        "balance_after",
+        "balance_before",
+        "charge_amount",
+        "total_amount",
+    }
+)
+# Amounts Go Out As Hundredths Of The Currency Unit
+MINOR_UNIT_EXPONENT = 2
+
+encoder = JSONEncoder()
+
+
+def to_minor_units(value):
+    if isinstance(value, str):
+        # Serializers Already Rendered Two Places, Dropping The Point Is Enough
+        whole, point, fraction = value.partition(".")
+        if point and len(fraction) == MINOR_UNIT_EXPONENT:
+            return int(whole + fraction)
+    return int(Decimal(value).scaleb(MINOR_UNIT_EXPONENT).to_integral_value())
+
+
+def minor_units(data):
+    """``data`` with every amount turned into an integer count of minor units."""
+    if isinstance(data, dict):
+        return {
+            name: (
+                to_minor_units(value)
+                if name in MONEY_FIELDS and isinstance(value, (str, Decimal))
+                else minor_units(value)
+            )
+            for name, value in data.items()
+        }
+    if isinstance(data, (list, tuple)):
+        return [minor_units(value) for value in data]
+    if isinstance(data, Decimal):
+        return to_minor_units(data)
+    return data
+
+
+def plain(value):
+    """The JSON value of what msgpack and Arrow cannot encode themselves."""
+    if isinstance(value, (datetime, date, time)):
+        return encoder.default(value)
+    if isinstance(value, dict):
+        return {name: plain(item) for name, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return encoder.default(value)
+
+
+def listing_rows(data):
+    """Rows and pagination metadata of a listing, a detail is a single row."""
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        metadata = {name: value for name, value in data.items() if name != "results"}
+        return data["results"], metadata
+    if isinstance(data, list):
+        return data, {}
+    return [data], {}
+
+
+class ORJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` output produced by orjson.
+
+    Types orjson does not know go through DRF's encoder, so the bytes match
+    the stock renderer. Indented output is left to the stock renderer.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        output = orjson.dumps(data, default=encoder.default, option=self.options)
+        # Same Escapes As The Stock Renderer, Valid In JSON But Not In JavaScript
+        if b"\xe2\x80\xa8" in output or b"\xe2\x80\xa9" in output:
+            output = output.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return output
+
+
+class MessagePackRenderer(BaseRenderer):
+    """The response as MessagePack, amounts in integer minor units."""
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    available = msgpack is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(minor_units(data), default=plain, use_bin_type=True)
+
+
+class ArrowStreamRenderer(BaseRenderer):
+    """A listing as an Arrow IPC stream, one row per result.
+
+    Amounts are integer minor units and the pagination links travel in the
+    schema metadata.
+    """
+
+    media_type = "application/vnd.apache.arrow.stream"
+    format = "arrow"
+    charset = None
+    render_style = "binary"
+    available = pyarrow is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows, metadata = listing_rows(data)
+        rows = minor_units(rows)
+        try:
+            table = pyarrow.Table.from_pylist(rows)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            table = pyarrow.Table.from_pylist(plain(rows))
+        table = table.replace_schema_metadata(
+            {name: orjson.dumps(value) for name, value in metadata.items()}
+        )
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+
+class AvailableRendererNegotiation(DefaultContentNegotiation):
+    """Content negotiation skipping renderers whose library is not installed."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderers = [
+            renderer for renderer in renderers if getattr(renderer, "available", True)
+        ]
+        return super().select_renderer(request, renderers, format_suffix)
@@ -1,5 +1,15 @@
 from rest_framework import serializers
-from .models import Seller, CreditRequest, Transaction, PhoneNumber, ChargeOrder
+from rest_framework.validators import UniqueTogetherValidator
+from .caches import phone_numbers
+from .models import (
+    Seller,
+    CreditRequest,
+    Transaction,
+    PhoneNumber,
+    ChargeOrder,
+    ChargeJob,
+    LedgerEvent,
+)
 
 
 class SellerSerializer(serializers.ModelSerializer):
@@ -11,8 +21,24 @@ class SellerSerializer(serializers.ModelSerializer):
     def validate_balance(self, value):
         if value < 0:
             raise serializers.ValidationError("Balance cannot be negative.")
+        # Stripes Hold The Live Balance, The Next Sync Would Overwrite The Column
+        striped_balance = getattr(self.instance, "striped_balance", None)
+        if striped_balance is not None and value != striped_balance:
+            raise serializers.ValidationError(
+                "Balance cannot be set directly while balance striping is enabled."
+            )
         return value
 
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        # With Striping Enabled The Live Balance Is The Sum Of The Stripes
+        striped_balance = getattr(instance, "striped_balance", None)
+        if striped_balance is not None:
+            representation["balance"] = self.fields["balance"].to_representation(
+                striped_balance
+            )
+        return representation
+
 
 class TransactionSerializer(serializers.ModelSerializer):
 
@@ -21,6 +47,22 @@ class TransactionSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class LedgerEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LedgerEvent
+        fields = [
+            "id",
+            "event_type",
+            "seller",
+            "transaction",
+            "credit_request",
+            "status",
+            "amount",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
 class CreditRequestSerializer(serializers.ModelSerializer):
     transactions = TransactionSerializer(read_only=True, many=True)
     STATUS_MAP = {
@@ -48,6 +90,15 @@ class CreditRequestSerializer(serializers.ModelSerializer):
             "transactions",
             "is_processed",
         ]
+        # The Partial Constraint Also Filters On deleted_at, Which DRF Cannot Map
+        validators = [
+            UniqueTogetherValidator(
+                queryset=CreditRequest.objects.filter(
+                    status=CreditRequest.PENDINGSTATUS
+                ),
+                fields=["seller", "amount"],
+            )
+        ]
 
     def validate_amount(self, value):
         if value <= 0:
@@ -87,6 +138,25 @@ class CreditRequestUpdateStatusSerializer(serializers.ModelSerializer):
         return representation
 
 
+class CreditRequestBulkUpdateStatusItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=[2, 3])
+
+
+class CreditRequestBulkUpdateStatusSerializer(serializers.Serializer):
+    MAX_ITEMS = 5000
+
+    items = CreditRequestBulkUpdateStatusItemSerializer(
+        many=True, allow_empty=False, max_length=MAX_ITEMS
+    )
+
+    def validate_items(self, items):
+        ids = [item["id"] for item in items]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("Each credit request may appear once.")
+        return items
+
+
 class PhoneNumberSerializer(serializers.ModelSerializer):
 
     class Meta:
@@ -94,8 +164,36 @@ class PhoneNumberSerializer(serializers.ModelSerializer):
         fields = ["id", "phone_number", "is_active"]
 
 
+class CachedPhoneNumberField(serializers.PrimaryKeyRelatedField):
+    """Resolves phone numbers from the process cache and rejects inactive ones."""
+
+    default_error_messages = {
+        "inactive": 'Phone number "{pk_value}" is inactive.',
+    }
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("queryset", PhoneNumber.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        entry = phone_numbers.get(pk)
+        if entry is None:
+            self.fail("does_not_exist", pk_value=data)
+        if not entry.is_active:
+            self.fail("inactive", pk_value=data)
+        return entry.instance()
+
+
 class ChargeOrderSerializer(serializers.ModelSerializer):
     transaction = TransactionSerializer(read_only=True)
+    phone_number = CachedPhoneNumberField()
 
     class Meta:
         model = ChargeOrder
@@ -120,19 +218,78 @@ class ChargeOrderSerializer(serializers.ModelSerializer):
         seller = attrs.get("seller")
         amount = attrs.get("amount")
 
-        try:
-            seller_obj = Seller.objects.select_for_update().get(id=seller.id)
-        except Seller.DoesNotExist:
+        # Early Reject On The Already Loaded Seller, Seller.debit Is Authoritative
+        if seller and amount and seller.balance < amount:
+            raise serializers.ValidationError("Insufficient seller balance")
+
+        return attrs
+
+
+class ChargeOrderBatchItemSerializer(serializers.Serializer):
+    phone_number = serializers.IntegerField()
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+    def validate_amount(self, value):
+
+        if value <= 0:
+            raise serializers.ValidationError("Amount cannot be negative or zero")
+        return value
+
+
+class ChargeOrderBatchSerializer(serializers.Serializer):
+    MAX_ITEMS = 1000
+
+    seller = serializers.PrimaryKeyRelatedField(queryset=Seller.objects.all())
+    items = ChargeOrderBatchItemSerializer(
+        many=True, allow_empty=False, max_length=MAX_ITEMS
+    )
+
+    def validate_items(self, items):
+        # Resolve Every Phone Number From The Process Cache
+        phone_ids = {item["phone_number"] for item in items}
+        entries = {pk: phone_numbers.get(pk) for pk in phone_ids}
+
+        missing = sorted(pk for pk, entry in entries.items() if entry is None)
+        if missing:
+            raise serializers.ValidationError(
+                f"Invalid phone number ids: {', '.join(map(str, missing))}"
+            )
+        inactive = sorted(pk for pk, entry in entries.items() if not entry.is_active)
+        if inactive:
             raise serializers.ValidationError(
-                {"seller": "Seller with this ID does not exist"}
+                f"Inactive phone number ids: {', '.join(map(str, inactive))}"
             )
-        except AttributeError:
-            raise serializers.ValidationError({"seller": "Seller field is required"})
 
-        # Check Seller Balance
-        if seller and amount:
-            seller_obj = Seller.objects.select_for_update().get(id=seller.id)
-            if seller_obj.balance < amount:
-                raise serializers.ValidationError("Insufficient seller balance")
+        instances = {pk: entry.instance() for pk, entry in entries.items()}
+        for item in items:
+            item["phone_number"] = instances[item["phone_number"]]
+        return items
 
-        return attrs
+
+class ChargeOrderStatusSerializer(serializers.ModelSerializer):
+    transaction = TransactionSerializer(read_only=True)
+    status = serializers.SerializerMethodField()
+    attempts = serializers.SerializerMethodField()
+
+    STATUS_MAP = {
+        ChargeJob.PENDINGSTATUS: "pending",
+        ChargeJob.PROCESSINGSTATUS: "processing",
+        ChargeJob.COMPLETESTATUS: "completed",
+        ChargeJob.FAILDSTATUS: "failed",
+    }
+
+    class Meta:
+        model = ChargeOrder
+        fields = ["id", "status", "attempts", "error_message", "transaction"]
+        read_only_fields = fields
+
+    def get_status(self, instance):
+        job = getattr(instance, "job", None)
+        if job is None:
+            # Orders charged synchronously have no job
+            return "completed"
+        return self.STATUS_MAP[job.status]
+
+    def get_attempts(self, instance):
+        job = getattr(instance, "job", None)
+        return job.attempts if job else 0
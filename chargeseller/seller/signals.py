@@ -0,0 +1,38 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caches import phone_numbers
+from .models import (
+    CacheVersion,
+    ChargeOrder,
+    CreditRequest,
+    PhoneNumber,
+    Seller,
+    Transaction,
+    TransactionDailySummary,
+    pre_soft_delete,
+)
+
+
+@receiver(post_save, sender=PhoneNumber)
+@receiver(post_delete, sender=PhoneNumber)
+@receiver(pre_soft_delete, sender=PhoneNumber)
+def invalidate_phone_numbers(sender, **kwargs):
+    # Other Processes See The Bump, This One Reloads After Commit Too
+    CacheVersion.bump(CacheVersion.PHONE_NUMBERS)
+    phone_numbers.invalidate()
+    transaction.on_commit(phone_numbers.invalidate)
+
+
+@receiver(pre_soft_delete, sender=Transaction)
+def discard_transactions(sender, queryset, **kwargs):
+    TransactionDailySummary.discard(queryset)
+
+
+@receiver(pre_soft_delete, sender=Transaction)
+@receiver(pre_soft_delete, sender=ChargeOrder)
+@receiver(pre_soft_delete, sender=CreditRequest)
+def bump_ledger_versions(sender, queryset, **kwargs):
+    # Listings Keyed By The Ledger Version Must Not Answer 304 With Deleted Rows
+    Seller.bump_ledger_version(queryset.values("seller_id"))
@@ -0,0 +1,20 @@
+from contextlib import contextmanager
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """Test case mixin for asserting an upper bound on executed queries."""
+
+    @contextmanager
+    def assertMaxQueries(self, budget, using="default"):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        executed = len(context.captured_queries)
+        if executed > budget:
+            statements = "\n".join(
+                f"{index}. {query['sql']}"
+                for index, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f"{executed} queries executed, budget is {budget}\n{statements}")
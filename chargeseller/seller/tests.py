@@ -1,20 +1,81 @@
+import base64
+import io
+import tempfile
+import json
 import multiprocessing
+import re
+import threading
+import unittest
+from unittest import mock
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from django.test import TestCase, TransactionTestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, TransactionTestCase, override_settings
+from asgiref.sync import sync_to_async
 from rest_framework.test import APIClient
 from rest_framework import status
+from datetime import timedelta
+from urllib.parse import urlencode
 from decimal import Decimal
-from django.db import transaction
+from django.db import OperationalError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from .factories import (
     UserFactory,
     SellerFactory,
     CreditRequestFactory,
     PhoneNumberFactory,
     ChargeOrderFactory,
+    TransactionFactory,
+)
+from .caches import idempotency_keys, phone_numbers
+from .conditional import ledger_etag
+from .testing import QueryBudgetMixin
+from .query_plans import check_hot_queries, explain, plan_problems, seed
+from .db import atomic_with_retry
+from .renderers import (
+    MessagePackRenderer,
+    ORJSONRenderer,
+    minor_units,
+    msgpack,
+    pyarrow,
+)
+from .fast_serializers import (
+    charge_order_values,
+    credit_request_values,
+    transaction_values,
+)
+from .serializers import (
+    CachedPhoneNumberField,
+    ChargeOrderSerializer,
+    CreditRequestSerializer,
+    PhoneNumberSerializer,
+    TransactionSerializer,
+)
+from rest_framework.renderers import JSONRenderer
+from rest_framework.exceptions import ValidationError
+from .models import (
+    CacheVersion,
+    ChargeIdempotencyKey,
+    PhoneNumber,
+    ArchivedChargeOrder,
+    ArchivedTransaction,
+    BalanceCheckpoint,
+    RateLimitBucket,
+    ReconciliationCheckpoint,
+    CreditRequest,
+    LedgerEvent,
+    Seller,
+    SellerBalanceStripe,
+    ChargeJob,
+    ChargeOrder,
+    Transaction,
+    TransactionDailySummary,
 )
-from .models import CreditRequest, Seller
 
 BASE_URL = "http://127.0.01:8000"
+CHARGE_CREATE_BUDGET = 19
+LIST_BUDGET = 4
 
 
 class CreditRequestAPITestCase(TestCase):
@@ -65,6 +126,20 @@ class CreditRequestAPITestCase(TestCase):
             self.seller2.refresh_from_db()
             self.assertEqual(self.seller2.balance, initial_balance)
 
+    def test_duplicate_pending_credit_request_is_rejected(self):
+        self.client.force_authenticate(user=self.user1)
+        data = {"seller": self.seller1.id, "amount": "100.00"}
+        deleted = CreditRequestFactory(seller=self.seller1, amount=Decimal("100.00"))
+        deleted.delete()
+
+        # Deleted Requests Do Not Count
+        response = self.client.post(f"{BASE_URL}/credit-requests/", data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(f"{BASE_URL}/credit-requests/", data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("non_field_errors", response.data)
+
     def test_list_credit_requests_seller1(self):
         self.client.force_authenticate(user=self.user1)
         initial_balance = self.seller1.balance
@@ -126,6 +201,1794 @@ class CreditRequestAPITestCase(TestCase):
         self.assertEqual(self.seller2.balance, initial_balance)
 
 
+class SellerLedgerTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("100.00"))
+        self.admin = UserFactory(is_staff=True)
+        self.phone = PhoneNumberFactory(phone_number="09123456789")
+
+    def test_debit_returns_before_and_after(self):
+        change = Seller.debit(self.seller.id, Decimal("40.00"))
+
+        self.assertEqual(change.balance_before, Decimal("100.00"))
+        self.assertEqual(change.balance_after, Decimal("60.00"))
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("60.00"))
+
+    def test_debit_insufficient_balance_leaves_balance(self):
+        self.assertIsNone(Seller.debit(self.seller.id, Decimal("100.01")))
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("100.00"))
+
+    def test_charge_order_insufficient_balance(self):
+        self.client.force_authenticate(user=self.seller.user)
+
+        data = {
+            "seller": self.seller.id,
+            "phone_number": self.phone.id,
+            "amount": "100.01",
+        }
+        response = self.client.post(f"{BASE_URL}/charge-orders/", data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ChargeOrder.objects.exists())
+        self.assertFalse(Transaction.objects.exists())
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("100.00"))
+
+    def test_approve_credit_request_records_balances(self):
+        self.client.force_authenticate(user=self.admin)
+        credit_request = CreditRequestFactory(
+            seller=self.seller, amount=Decimal("25.00")
+        )
+
+        response = self.client.patch(
+            f"{BASE_URL}/credit-requests/{credit_request.id}/update-status/",
+            {"status": CreditRequest.APPROVEDSTATUS},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("125.00"))
+        ledger_row = Transaction.objects.get(credit_request=credit_request)
+        self.assertEqual(ledger_row.balance_before, Decimal("100.00"))
+        self.assertEqual(ledger_row.balance_after, Decimal("125.00"))
+        self.assertEqual(ledger_row.status, Transaction.COMPLETESTATUS)
+
+    def test_reject_credit_request_keeps_balance(self):
+        self.client.force_authenticate(user=self.admin)
+        credit_request = CreditRequestFactory(
+            seller=self.seller, amount=Decimal("25.00")
+        )
+
+        response = self.client.patch(
+            f"{BASE_URL}/credit-requests/{credit_request.id}/update-status/",
+            {"status": CreditRequest.REJECCTEDSTATUS},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("100.00"))
+        ledger_row = Transaction.objects.get(credit_request=credit_request)
+        self.assertEqual(ledger_row.status, Transaction.CANCELEDSTATUS)
+        self.assertEqual(ledger_row.balance_after, Decimal("100.00"))
+
+
+@override_settings(SELLER_BALANCE_STRIPES=4)
+class StripedBalanceTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("100.00"))
+        self.phone = PhoneNumberFactory(phone_number="09123456789")
+
+    def stripe_total(self):
+        return sum(
+            SellerBalanceStripe.objects.filter(seller=self.seller).values_list(
+                "balance", flat=True
+            )
+        )
+
+    def test_first_debit_splits_balance_into_stripes(self):
+        change = Seller.debit(self.seller.id, Decimal("10.00"))
+
+        self.assertEqual(
+            SellerBalanceStripe.objects.filter(seller=self.seller).count(), 4
+        )
+        self.assertEqual(change.balance_before, Decimal("25.00"))
+        self.assertEqual(change.balance_after, Decimal("15.00"))
+        self.assertEqual(self.stripe_total(), Decimal("90.00"))
+
+    def test_debit_larger_than_any_stripe_consolidates(self):
+        Seller.debit(self.seller.id, Decimal("10.00"))
+
+        change = Seller.debit(self.seller.id, Decimal("90.00"))
+        self.assertEqual(change.balance_before, Decimal("90.00"))
+        self.assertEqual(change.balance_after, Decimal("0.00"))
+        self.assertIsNone(Seller.debit(self.seller.id, Decimal("0.01")))
+
+    def test_debits_keep_seller_balance_in_sync(self):
+        Seller.debit(self.seller.id, Decimal("10.00"))
+        Seller.debit(self.seller.id, Decimal("80.00"))
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("10.00"))
+        self.assertEqual(self.stripe_total(), Decimal("10.00"))
+
+    def test_credit_resyncs_seller_balance(self):
+        Seller.debit(self.seller.id, Decimal("30.00"))
+
+        change = Seller.credit(self.seller.id, Decimal("5.00"))
+        self.assertEqual(change.balance_after - change.balance_before, Decimal("5.00"))
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("75.00"))
+        self.assertEqual(self.stripe_total(), Decimal("75.00"))
+
+    def test_admin_cannot_overwrite_striped_balance(self):
+        Seller.debit(self.seller.id, Decimal("30.00"))
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(is_staff=True))
+        url = f"{BASE_URL}/sellers/{self.seller.id}/"
+
+        # Writing Back The Balance Just Read Is Allowed
+        response = client.put(url, {"user": self.seller.user.id, "balance": "70.00"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.stripe_total(), Decimal("70.00"))
+
+        response = client.put(url, {"user": self.seller.user.id, "balance": "500.00"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("balance", response.data)
+
+    def test_charge_order_records_stripe(self):
+        self.client.force_authenticate(user=self.seller.user)
+
+        data = {
+            "seller": self.seller.id,
+            "phone_number": self.phone.id,
+            "amount": "20.00",
+        }
+        response = self.client.post(f"{BASE_URL}/charge-orders/", data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        ledger_row = Transaction.objects.get(charge_order_id=response.data["id"])
+        self.assertIsNotNone(ledger_row.balance_stripe)
+        self.assertEqual(
+            ledger_row.balance_before - ledger_row.balance_after, Decimal("20.00")
+        )
+        self.assertEqual(self.stripe_total(), Decimal("80.00"))
+
+
+class ChargeOrderBatchAPITestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("1000.00"))
+        self.client.force_authenticate(user=self.seller.user)
+        self.phone1 = PhoneNumberFactory(phone_number="09123456789")
+        self.phone2 = PhoneNumberFactory(phone_number="09123456790")
+
+    def post_batch(self, items):
+        return self.client.post(
+            f"{BASE_URL}/charge-orders/batch/",
+            {"seller": self.seller.id, "items": items},
+            format="json",
+        )
+
+    def test_batch_for_another_seller_is_forbidden(self):
+        other = SellerFactory(balance=Decimal("500.00"))
+        response = self.client.post(
+            f"{BASE_URL}/charge-orders/batch/",
+            {
+                "seller": other.id,
+                "items": [{"phone_number": self.phone1.id, "amount": "10.00"}],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_batch_creates_orders_and_ledger_chain(self):
+        items = [
+            {"phone_number": self.phone1.id, "amount": str(amount)}
+            for amount in range(1, 41)
+        ]
+
+        response = self.post_batch(items)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 40)
+        self.assertEqual(ChargeOrder.objects.count(), 40)
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("180.00"))
+
+        ledger = list(Transaction.objects.order_by("id"))
+        self.assertEqual(ledger[0].balance_before, Decimal("1000.00"))
+        self.assertEqual(ledger[-1].balance_after, self.seller.balance)
+        for previous, current in zip(ledger, ledger[1:]):
+            self.assertEqual(current.balance_before, previous.balance_after)
+
+    def test_batch_reports_duplicates(self):
+        recent = self.client.post(
+            f"{BASE_URL}/charge-orders/",
+            {"seller": self.seller.id, "phone_number": self.phone1.id, "amount": "10"},
+        )
+        recent_order = ChargeOrder.objects.get(id=recent.data["id"])
+
+        response = self.post_batch(
+            [
+                {"phone_number": self.phone1.id, "amount": "10.00"},
+                {"phone_number": self.phone2.id, "amount": "10.00"},
+                {"phone_number": self.phone2.id, "amount": "10.00"},
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["duplicate", "created", "duplicate"],
+        )
+        self.assertEqual(results[0]["recent_order_id"], recent_order.id)
+        self.assertEqual(results[2]["recent_order_id"], results[1]["charge_order_id"])
+
+        recent_order.refresh_from_db()
+        self.assertEqual(recent_order.retry_count, 1)
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("980.00"))
+
+    def test_batch_rejected_when_total_exceeds_balance(self):
+        response = self.post_batch(
+            [
+                {"phone_number": self.phone1.id, "amount": "600.00"},
+                {"phone_number": self.phone2.id, "amount": "600.00"},
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ChargeOrder.objects.exists())
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("1000.00"))
+
+
+class ChargeIdempotencyTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("1000.00"))
+        self.client.force_authenticate(user=self.seller.user)
+        self.phone = PhoneNumberFactory(phone_number="09123456789")
+        self.data = {
+            "seller": self.seller.id,
+            "phone_number": self.phone.id,
+            "amount": "10.00",
+        }
+        idempotency_keys.clear()
+
+    def test_duplicate_detected_by_key_and_retry_counted(self):
+        first = self.client.post(f"{BASE_URL}/charge-orders/", self.data)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        for retry_count in (1, 2):
+            response = self.client.post(f"{BASE_URL}/charge-orders/", self.data)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data["recent_order_id"], first.data["id"])
+            self.assertEqual(response.data["retry_count"], retry_count)
+
+        self.assertEqual(ChargeOrder.objects.count(), 1)
+        self.assertEqual(ChargeIdempotencyKey.objects.count(), 1)
+
+    def test_duplicate_in_previous_bucket_within_window(self):
+        charge_order = ChargeOrderFactory(
+            seller=self.seller, phone_number=self.phone, amount=Decimal("10.00")
+        )
+        _, previous_key = ChargeIdempotencyKey.keys_for(self.phone, "10.00")
+        ChargeIdempotencyKey.objects.create(
+            seller=self.seller, key=previous_key, charge_order=charge_order
+        )
+
+        self.assertEqual(
+            ChargeOrder.get_recent_order(self.seller.id, self.phone, Decimal("10")),
+            charge_order,
+        )
+
+    def test_client_key_overrides_derived_key(self):
+        first = self.client.post(
+            f"{BASE_URL}/charge-orders/", self.data, HTTP_IDEMPOTENCY_KEY="abc"
+        )
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        # Same payload under a different client key is a new order
+        second = self.client.post(
+            f"{BASE_URL}/charge-orders/", self.data, HTTP_IDEMPOTENCY_KEY="abd"
+        )
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+
+        replay = self.client.post(
+            f"{BASE_URL}/charge-orders/", self.data, HTTP_IDEMPOTENCY_KEY="abc"
+        )
+        self.assertEqual(replay.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(replay.data["recent_order_id"], first.data["id"])
+
+    def test_failed_charge_releases_key(self):
+        self.data["amount"] = "2000.00"
+        Seller.objects.filter(id=self.seller.id).update(balance=Decimal("5000.00"))
+        Seller.debit(self.seller.id, Decimal("4500.00"))
+
+        response = self.client.post(f"{BASE_URL}/charge-orders/", self.data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ChargeIdempotencyKey.objects.exists())
+
+
+class TransactionPaginationTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory()
+        self.other_seller = SellerFactory()
+        self.client.force_authenticate(user=self.seller.user)
+
+        for _ in range(25):
+            TransactionFactory(seller=self.seller)
+        TransactionFactory(seller=self.other_seller)
+        # Rows sharing a timestamp must still page without gaps or repeats
+        Transaction.objects.filter(seller=self.seller).update(created_at=timezone.now())
+
+    def test_cursor_walks_every_row_newest_first(self):
+        pages = []
+        url = f"{BASE_URL}/transactions/?seller={self.seller.id}&page_size=10"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([row["id"] for row in response.data["results"]])
+            url = response.data["next"]
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        listed_ids = [pk for page in pages for pk in page]
+        self.assertEqual(listed_ids, sorted(listed_ids, reverse=True))
+        self.assertEqual(
+            set(listed_ids),
+            set(
+                Transaction.objects.filter(seller=self.seller).values_list(
+                    "id", flat=True
+                )
+            ),
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f"{BASE_URL}/transactions/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TransactionExportTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory()
+        self.client.force_authenticate(user=self.seller.user)
+        for _ in range(3):
+            TransactionFactory(seller=self.seller, status=Transaction.COMPLETESTATUS)
+        TransactionFactory(seller=self.seller, status=Transaction.FAILDSTATUS)
+        TransactionFactory(status=Transaction.COMPLETESTATUS)
+
+    def test_export_ndjson_filtered(self):
+        response = self.client.get(
+            f"{BASE_URL}/transactions/export/",
+            {"seller": self.seller.id, "status": Transaction.COMPLETESTATUS},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row["seller_id"] for row in rows}, {self.seller.id})
+        self.assertEqual(rows[0]["amount"], "100.00")
+
+    def test_export_csv_date_range(self):
+        today = timezone.now().date().isoformat()
+        response = self.client.get(
+            f"{BASE_URL}/transactions/export/",
+            {"output": "csv", "date_from": today, "date_to": today},
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(",")[0], "id")
+        self.assertEqual(len(lines), 5)
+
+        response = self.client.get(
+            f"{BASE_URL}/transactions/export/", {"date_from": "2000-01-01x"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_is_scoped_to_the_caller(self):
+        response = self.client.get(f"{BASE_URL}/transactions/export/")
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            {json.loads(row)["seller_id"] for row in rows}, {self.seller.id}
+        )
+
+        self.client.force_authenticate(user=UserFactory(is_staff=True))
+        response = self.client.get(f"{BASE_URL}/transactions/export/")
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 5)
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(f"{BASE_URL}/transactions/export/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unknown_choices_are_rejected(self):
+        for path in ("transactions/", "transactions/export/", "transactions/summary/"):
+            for params in ({"status": "abc"}, {"type": "9"}, {"seller": "x"}):
+                with self.subTest(path=path, params=params):
+                    response = self.client.get(f"{BASE_URL}/{path}", params)
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                    self.assertIn(next(iter(params)), response.data)
+
+
+class RendererTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory()
+        self.client.force_authenticate(user=self.seller.user)
+        for _ in range(3):
+            TransactionFactory(
+                seller=self.seller,
+                amount=Decimal("12.50"),
+                status=Transaction.COMPLETESTATUS,
+            )
+
+    def test_orjson_matches_json_renderer(self):
+        response = self.client.get(f"{BASE_URL}/transactions/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+        data = {
+            "total_amount": Decimal("1.50"),
+            "at": timezone.now(),
+            "note": "line\u2028break",
+            1: None,
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_minor_units(self):
+        data = {
+            "next": None,
+            "results": [
+                {"amount": "12.50", "phone_number": "09120000000"},
+                {"amount": None, "transaction": {"balance_after": "-0.05"}},
+            ],
+            "total_amount": Decimal("7.5"),
+        }
+        self.assertEqual(
+            minor_units(data),
+            {
+                "next": None,
+                "results": [
+                    {"amount": 1250, "phone_number": "09120000000"},
+                    {"amount": None, "transaction": {"balance_after": -5}},
+                ],
+                "total_amount": 750,
+            },
+        )
+
+    @mock.patch.object(MessagePackRenderer, "available", False)
+    def test_missing_library_is_not_acceptable(self):
+        response = self.client.get(
+            f"{BASE_URL}/transactions/", HTTP_ACCEPT="application/msgpack"
+        )
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+    @unittest.skipUnless(msgpack is not None, "msgpack is not installed")
+    def test_msgpack_listing_and_export(self):
+        response = self.client.get(
+            f"{BASE_URL}/transactions/", HTTP_ACCEPT="application/msgpack"
+        )
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        data = msgpack.unpackb(response.content)
+        self.assertEqual([row["amount"] for row in data["results"]], [1250] * 3)
+
+        response = self.client.get(
+            f"{BASE_URL}/transactions/export/", {"output": "msgpack"}
+        )
+        rows = list(msgpack.Unpacker(io.BytesIO(b"".join(response.streaming_content))))
+        self.assertEqual([row["amount"] for row in rows], [1250] * 3)
+
+    @unittest.skipUnless(pyarrow is not None, "pyarrow is not installed")
+    def test_arrow_listing_and_export(self):
+        response = self.client.get(f"{BASE_URL}/transactions/", {"format": "arrow"})
+        table = pyarrow.ipc.open_stream(response.content).read_all()
+        self.assertEqual(table.column("amount").to_pylist(), [1250] * 3)
+        self.assertIn(b"next", table.schema.metadata)
+
+        response = self.client.get(
+            f"{BASE_URL}/transactions/export/", {"output": "arrow"}
+        )
+        table = pyarrow.ipc.open_stream(b"".join(response.streaming_content)).read_all()
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column("amount").to_pylist(), [1250] * 3)
+
+
+class LedgerChangeFeedTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = UserFactory(is_staff=True)
+        self.seller = SellerFactory(balance=Decimal("100.00"))
+        self.phone = PhoneNumberFactory()
+
+    def charge(self, amount, **headers):
+        self.client.force_authenticate(user=self.seller.user)
+        return self.client.post(
+            f"{BASE_URL}/charge-orders/",
+            {"seller": self.seller.id, "phone_number": self.phone.id, "amount": amount},
+            headers=headers,
+        )
+
+    def changes(self, **params):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(f"{BASE_URL}/transactions/changes/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_events_are_written_with_the_change(self):
+        credit_request = CreditRequestFactory(seller=self.seller)
+        self.client.force_authenticate(user=self.admin)
+        self.client.patch(
+            f"{BASE_URL}/credit-requests/{credit_request.id}/update-status/",
+            {"status": CreditRequest.APPROVEDSTATUS},
+        )
+        self.charge("10.00")
+
+        events = self.changes()["results"]
+        self.assertEqual(
+            [(event["event_type"], event["status"]) for event in events],
+            [
+                (
+                    LedgerEvent.CREDIT_REQUEST_STATUS_CHANGED,
+                    CreditRequest.APPROVEDSTATUS,
+                ),
+                (LedgerEvent.TRANSACTION_CREATED, Transaction.COMPLETESTATUS),
+                (LedgerEvent.TRANSACTION_CREATED, Transaction.COMPLETESTATUS),
+            ],
+        )
+        self.assertEqual(events[0]["credit_request"], credit_request.id)
+        self.assertEqual(events[2]["amount"], "10.00")
+        self.assertEqual(
+            {event["transaction"] for event in events[1:]},
+            set(Transaction.objects.values_list("id", flat=True)),
+        )
+
+    def test_settled_reservation_reports_status_change(self):
+        response = self.charge("10.00", Prefer="respond-async")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        cursor = self.changes()["cursor"]
+
+        ChargeJob.settle_batch(list(ChargeJob.objects.values_list("id", flat=True)))
+        events = self.changes(since=cursor)["results"]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(
+            events[0]["event_type"], LedgerEvent.TRANSACTION_STATUS_CHANGED
+        )
+        self.assertEqual(events[0]["status"], Transaction.COMPLETESTATUS)
+
+    def test_cursor_resumes_in_order(self):
+        for amount in ("1.00", "2.00", "3.00"):
+            self.charge(amount)
+
+        first = self.changes(page_size=2)
+        self.assertTrue(first["has_more"])
+        rest = self.changes(since=first["cursor"], page_size=2)
+        self.assertFalse(rest["has_more"])
+        ids = [event["id"] for event in first["results"] + rest["results"]]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(
+            [event["amount"] for event in first["results"] + rest["results"]],
+            ["1.00", "2.00", "3.00"],
+        )
+
+        # Nothing New Keeps The Cursor Where It Was
+        empty = self.changes(since=rest["cursor"])
+        self.assertEqual(empty["results"], [])
+        self.assertEqual(empty["cursor"], rest["cursor"])
+        self.assertEqual(self.changes(seller=self.seller.id + 1)["results"], [])
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(f"{BASE_URL}/transactions/changes/", {"since": "x"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_feed_is_admin_only(self):
+        self.charge("10.00")
+        url = f"{BASE_URL}/transactions/changes/"
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_invalid_seller_is_rejected(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(
+            f"{BASE_URL}/transactions/changes/", {"seller": "abc"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("seller", response.data)
+
+
+class TransactionSummaryTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("1000.00"))
+        self.admin = UserFactory(is_staff=True)
+        self.phone = PhoneNumberFactory(phone_number="09123456789")
+
+        self.client.force_authenticate(user=self.seller.user)
+        for amount in ("10.00", "20.00", "30.00"):
+            self.client.post(
+                f"{BASE_URL}/charge-orders/",
+                {
+                    "seller": self.seller.id,
+                    "phone_number": self.phone.id,
+                    "amount": amount,
+                },
+            )
+        self.client.post(
+            f"{BASE_URL}/charge-orders/batch/",
+            {
+                "seller": self.seller.id,
+                "items": [{"phone_number": self.phone.id, "amount": "5.00"}],
+            },
+            format="json",
+        )
+
+        self.client.force_authenticate(user=self.admin)
+        credit_request = CreditRequestFactory(seller=self.seller)
+        self.client.patch(
+            f"{BASE_URL}/credit-requests/{credit_request.id}/update-status/",
+            {"status": CreditRequest.APPROVEDSTATUS},
+        )
+
+    def get_summary(self, **params):
+        response = self.client.get(f"{BASE_URL}/transactions/summary/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {
+            row["transaction_type"]: (row["count"], Decimal(row["total_amount"]))
+            for row in response.data
+        }
+
+    def test_summary_reads_maintained_totals(self):
+        expected = {1: (1, Decimal("100.00")), 2: (4, Decimal("65.00"))}
+        self.assertEqual(self.get_summary(seller=self.seller.id), expected)
+        # The ledger fallback agrees with the maintained totals
+        self.assertEqual(
+            self.get_summary(seller=self.seller.id, status=Transaction.COMPLETESTATUS),
+            expected,
+        )
+
+    def test_summary_date_range(self):
+        today = timezone.localdate()
+        yesterday = (today - timedelta(days=1)).isoformat()
+        self.assertEqual(self.get_summary(date_to=yesterday), {})
+        self.assertEqual(len(self.get_summary(date_from=today.isoformat())), 2)
+
+    def test_rebuild_matches_incremental_totals(self):
+        before = self.get_summary()
+        TransactionDailySummary.objects.update(count=0)
+
+        call_command("rebuild_transaction_summaries", stdout=io.StringIO())
+        self.assertEqual(self.get_summary(), before)
+
+    def test_rebuild_reads_ledger_inside_its_transaction(self):
+        with CaptureQueriesContext(connection) as queries:
+            call_command("rebuild_transaction_summaries", stdout=io.StringIO())
+        statements = [query["sql"] for query in queries.captured_queries]
+        self.assertTrue(statements[0].startswith("SAVEPOINT"))
+        self.assertIn('FROM "transactions"', statements[1])
+
+
+class AsyncChargeOrderTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("100.00"))
+        self.client.force_authenticate(user=self.seller.user)
+        self.phone = PhoneNumberFactory(phone_number="09123456789")
+
+    def accept(self, amount="30.00"):
+        response = self.client.post(
+            f"{BASE_URL}/charge-orders/",
+            {"seller": self.seller.id, "phone_number": self.phone.id, "amount": amount},
+            HTTP_PREFER="respond-async",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        return response
+
+    def get_status(self, order_id):
+        return self.client.get(f"{BASE_URL}/charge-orders/{order_id}/status/").data
+
+    def test_accept_reserves_funds_and_workers_settle(self):
+        response = self.accept()
+        order_id = response.data["id"]
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(response["Location"], f"/charge-orders/{order_id}/status/")
+
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("70.00"))
+        reserved = Transaction.objects.get(charge_order_id=order_id)
+        self.assertEqual(reserved.status, Transaction.PENDINGSTATUS)
+
+        call_command(
+            "run_charge_workers", "--processes", "0", "--once", stdout=io.StringIO()
+        )
+
+        settled = self.get_status(order_id)
+        self.assertEqual(settled["status"], "completed")
+        self.assertEqual(settled["attempts"], 1)
+        self.assertEqual(settled["transaction"]["status"], Transaction.COMPLETESTATUS)
+
+    def test_exhausted_job_is_refunded(self):
+        order_id = self.accept().data["id"]
+        job = ChargeJob.objects.get(charge_order_id=order_id)
+        ChargeJob.objects.filter(id=job.id).update(attempts=ChargeJob.MAX_ATTEMPTS)
+
+        ChargeJob.release_batch([job.id], "operator unavailable")
+
+        self.assertEqual(self.get_status(order_id)["status"], "failed")
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("100.00"))
+        self.assertEqual(
+            Transaction.objects.get(charge_order_id=order_id).status,
+            Transaction.FAILDSTATUS,
+        )
+
+    def test_claimed_jobs_are_not_claimed_twice(self):
+        for amount in ("10.00", "20.00", "30.00"):
+            self.accept(amount)
+
+        first = ChargeJob.claim_batch("worker-a", 2)
+        second = ChargeJob.claim_batch("worker-b", 2)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse(set(first) & set(second))
+
+
+class CreditRequestBulkStatusTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = UserFactory(is_staff=True)
+        self.client.force_authenticate(user=self.admin)
+        self.seller1 = SellerFactory(balance=Decimal("100.00"))
+        self.seller2 = SellerFactory(balance=Decimal("50.00"))
+
+    def bulk_update(self, items):
+        return self.client.post(
+            f"{BASE_URL}/credit-requests/bulk-update-status/",
+            {"items": items},
+            format="json",
+        )
+
+    def test_bulk_approve_and_reject(self):
+        approve = [
+            CreditRequestFactory(seller=self.seller1, amount=Decimal(amount))
+            for amount in ("10.00", "20.00", "30.00")
+        ]
+        reject = CreditRequestFactory(seller=self.seller2, amount=Decimal("5.00"))
+        processed = CreditRequestFactory(
+            seller=self.seller2, amount=Decimal("7.00"), is_processed=True
+        )
+
+        items = [
+            {"id": cr.id, "status": CreditRequest.APPROVEDSTATUS} for cr in approve
+        ]
+        items += [
+            {"id": reject.id, "status": CreditRequest.REJECCTEDSTATUS},
+            {"id": processed.id, "status": CreditRequest.APPROVEDSTATUS},
+            {"id": 999999, "status": CreditRequest.APPROVEDSTATUS},
+        ]
+        response = self.bulk_update(items)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["processed"], 4)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            ["approved"] * 3 + ["rejected", "already_processed", "not_found"],
+        )
+
+        self.seller1.refresh_from_db()
+        self.seller2.refresh_from_db()
+        self.assertEqual(self.seller1.balance, Decimal("160.00"))
+        self.assertEqual(self.seller2.balance, Decimal("50.00"))
+
+        chain = list(Transaction.objects.filter(seller=self.seller1).order_by("id"))
+        self.assertEqual(
+            [(row.balance_before, row.balance_after) for row in chain],
+            [
+                (Decimal("100.00"), Decimal("110.00")),
+                (Decimal("110.00"), Decimal("130.00")),
+                (Decimal("130.00"), Decimal("160.00")),
+            ],
+        )
+        self.assertEqual(
+            Transaction.objects.get(credit_request=reject).status,
+            Transaction.CANCELEDSTATUS,
+        )
+        self.assertEqual(CreditRequest.objects.filter(is_processed=True).count(), 5)
+
+    def test_bulk_rejects_repeated_ids(self):
+        credit_request = CreditRequestFactory(seller=self.seller1)
+        item = {"id": credit_request.id, "status": CreditRequest.APPROVEDSTATUS}
+
+        response = self.bulk_update([item, item])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_requires_admin(self):
+        self.client.force_authenticate(user=self.seller1.user)
+        response = self.bulk_update([{"id": 1, "status": 2}])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class QueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("100000.00"))
+        self.client.force_authenticate(user=self.seller.user)
+        self.phone_number = PhoneNumberFactory()
+
+    def create_charge_orders(self, count):
+        for _ in range(count):
+            charge_order = ChargeOrderFactory(
+                seller=self.seller, phone_number=self.phone_number
+            )
+            TransactionFactory(
+                seller=self.seller,
+                charge_order=charge_order,
+                phone_number=self.phone_number,
+                transaction_type=2,
+            )
+
+    def test_server_timing_header(self):
+        response = self.client.get(f"{BASE_URL}/charge-orders-list/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(
+            response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries"'
+        )
+
+    def test_charge_create_budget(self):
+        data = {
+            "seller": self.seller.id,
+            "phone_number": self.phone_number.id,
+            "amount": "10.00",
+        }
+        with self.assertMaxQueries(CHARGE_CREATE_BUDGET):
+            response = self.client.post(f"{BASE_URL}/charge-orders/", data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_charge_order_list_budget(self):
+        self.create_charge_orders(50)
+        with self.assertMaxQueries(LIST_BUDGET):
+            response = self.client.get(f"{BASE_URL}/charge-orders-list/")
+        self.assertEqual(len(response.data["results"]), 50)
+
+    def test_transaction_list_budget(self):
+        self.create_charge_orders(50)
+        with self.assertMaxQueries(LIST_BUDGET):
+            response = self.client.get(f"{BASE_URL}/transactions/")
+        self.assertEqual(len(response.data["results"]), 50)
+
+    def test_credit_request_list_budget(self):
+        for amount in range(1, 21):
+            credit_request = CreditRequestFactory(
+                seller=self.seller, amount=Decimal(amount)
+            )
+            TransactionFactory(
+                seller=self.seller,
+                credit_request=credit_request,
+                transaction_type=1,
+            )
+        with self.assertMaxQueries(LIST_BUDGET):
+            response = self.client.get(f"{BASE_URL}/credit-requests/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(SELLER_DB_RETRY_BASE_DELAY=0)
+class AtomicWithRetryTestCase(TransactionTestCase):
+    def locked_until(self, attempt):
+        calls = []
+
+        @atomic_with_retry
+        def write():
+            calls.append(transaction.get_connection().in_atomic_block)
+            if len(calls) < attempt:
+                raise OperationalError("database is locked")
+            return len(calls)
+
+        return write, calls
+
+    def test_retries_lock_errors_in_a_fresh_transaction(self):
+        write, calls = self.locked_until(3)
+        self.assertEqual(write(), 3)
+        self.assertEqual(calls, [True, True, True])
+
+    @override_settings(SELLER_DB_RETRY_ATTEMPTS=2)
+    def test_gives_up_after_max_attempts(self):
+        write, calls = self.locked_until(5)
+        with self.assertRaises(OperationalError):
+            write()
+        self.assertEqual(len(calls), 2)
+
+    def test_does_not_retry_inside_outer_transaction(self):
+        write, calls = self.locked_until(2)
+        with self.assertRaises(OperationalError):
+            with transaction.atomic():
+                write()
+        self.assertEqual(len(calls), 1)
+
+    def test_does_not_retry_other_errors(self):
+        calls = []
+
+        @atomic_with_retry
+        def write():
+            calls.append(1)
+            raise OperationalError("no such table: missing")
+
+        with self.assertRaises(OperationalError):
+            write()
+        self.assertEqual(len(calls), 1)
+
+    def test_reads_do_not_wait_for_a_writer(self):
+        seller = SellerFactory()
+        writing, done = threading.Event(), threading.Event()
+
+        @atomic_with_retry
+        def write():
+            RateLimitBucket.consume("writer", 1, 1, now=0.0)
+            writing.set()
+            done.wait(10)
+
+        def writer():
+            try:
+                write()
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            self.assertTrue(writing.wait(10))
+            client = APIClient()
+            client.force_authenticate(user=seller.user)
+            response = client.get(f"{BASE_URL}/transactions/")
+        finally:
+            done.set()
+            thread.join()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ValuesSerializerTestCase(TestCase):
+    def setUp(self):
+        self.seller = SellerFactory(balance=Decimal("1000.00"))
+        self.phone_number = PhoneNumberFactory()
+        for amount in ("10.00", "0.50", "1234567.89"):
+            credit_request = CreditRequestFactory(
+                seller=self.seller, amount=Decimal(amount)
+            )
+            TransactionFactory(
+                seller=self.seller,
+                credit_request=credit_request,
+                amount=Decimal(amount),
+                processed_at=timezone.now(),
+            )
+        CreditRequestFactory(seller=self.seller, status=CreditRequest.REJECCTEDSTATUS)
+        charge_order = ChargeOrderFactory(
+            seller=self.seller, phone_number=self.phone_number
+        )
+        TransactionFactory(
+            seller=self.seller,
+            charge_order=charge_order,
+            phone_number=self.phone_number,
+            transaction_type=2,
+            status=Transaction.COMPLETESTATUS,
+        )
+        ChargeOrderFactory(seller=self.seller, phone_number=self.phone_number)
+
+    def assertSameJSON(self, serializer_class, values_serializer, queryset):
+        expected = serializer_class(queryset, many=True).data
+        rendered = values_serializer.render(values_serializer.values(queryset))
+        self.assertEqual(
+            JSONRenderer().render(rendered), JSONRenderer().render(expected)
+        )
+
+    def test_transactions_render_identically(self):
+        queryset = Transaction.objects.order_by("id")
+        self.assertSameJSON(TransactionSerializer, transaction_values, queryset)
+
+    def test_charge_orders_render_identically(self):
+        queryset = ChargeOrder.objects.order_by("id")
+        self.assertSameJSON(ChargeOrderSerializer, charge_order_values, queryset)
+
+    def test_credit_requests_render_identically(self):
+        queryset = CreditRequest.objects.prefetch_related("transactions").order_by("id")
+        self.assertSameJSON(CreditRequestSerializer, credit_request_values, queryset)
+
+
+class PhoneNumberCacheTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory(balance=Decimal("100.00"))
+        self.client.force_authenticate(user=self.seller.user)
+        self.phone_number = PhoneNumberFactory()
+
+    def test_inactive_number_rejected_without_query(self):
+        inactive = PhoneNumberFactory(is_active=False)
+        phone_numbers.get(inactive.id)
+
+        field = CachedPhoneNumberField()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                field.to_internal_value(self.phone_number.id).pk, self.phone_number.id
+            )
+            with self.assertRaises(ValidationError):
+                field.to_internal_value(inactive.id)
+
+        response = self.client.post(
+            f"{BASE_URL}/charge-orders/",
+            {"seller": self.seller.id, "phone_number": inactive.id, "amount": "5.00"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ChargeOrder.objects.exists())
+
+    def test_save_invalidates_cache(self):
+        self.assertTrue(phone_numbers.get(self.phone_number.id).is_active)
+
+        self.phone_number.is_active = False
+        self.phone_number.save()
+        self.assertFalse(phone_numbers.get(self.phone_number.id).is_active)
+
+        self.phone_number.delete()
+        self.assertIsNone(phone_numbers.get(self.phone_number.id))
+
+    def test_version_stamp_reloads_changes_from_other_processes(self):
+        phone_numbers.get(self.phone_number.id)
+        # Queryset Updates Send No Signal, Like A Write From Another Process
+        PhoneNumber.objects.filter(id=self.phone_number.id).update(is_active=False)
+        CacheVersion.bump(CacheVersion.PHONE_NUMBERS)
+
+        with override_settings(SELLER_PHONE_CACHE_CHECK_INTERVAL=60):
+            self.assertTrue(phone_numbers.get(self.phone_number.id).is_active)
+        with override_settings(SELLER_PHONE_CACHE_CHECK_INTERVAL=0):
+            self.assertFalse(phone_numbers.get(self.phone_number.id).is_active)
+
+    def test_cache_loads_before_the_write_transaction(self):
+        phone_numbers.invalidate()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                f"{BASE_URL}/charge-orders/",
+                {
+                    "seller": self.seller.id,
+                    "phone_number": self.phone_number.id,
+                    "amount": "5.00",
+                },
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        statements = [query["sql"] for query in queries.captured_queries]
+        load = next(
+            index
+            for index, sql in enumerate(statements)
+            if 'FROM "phone_numbers"' in sql and "LIMIT" in sql
+        )
+        begin = next(
+            index for index, sql in enumerate(statements) if sql.startswith("SAVEPOINT")
+        )
+        self.assertLess(load, begin)
+
+    @override_settings(SELLER_PHONE_CACHE_MAX_ROWS=1)
+    def test_large_table_is_looked_up_per_id(self):
+        other = PhoneNumberFactory()
+        phone_numbers.invalidate()
+        self.assertEqual(phone_numbers.get(other.id).id, other.id)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(phone_numbers.get(self.phone_number.id).is_active)
+        with self.assertNumQueries(1):
+            self.assertIsNone(phone_numbers.get(0))
+
+
+class SoftDeleteTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = UserFactory(is_staff=True)
+        self.seller = SellerFactory()
+        self.phone = PhoneNumberFactory(phone_number="09121112233")
+        self.ledger_row = TransactionFactory(seller=self.seller)
+
+    def test_delete_hides_row_without_cascading(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.delete(f"{BASE_URL}/sellers/{self.seller.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(Seller.objects.filter(id=self.seller.id).exists())
+        self.assertIsNotNone(Seller.all_objects.get(id=self.seller.id).deleted_at)
+        self.assertTrue(Transaction.objects.filter(id=self.ledger_row.id).exists())
+
+        count, _ = Transaction.objects.filter(seller=self.seller).delete()
+        self.assertEqual(count, 1)
+        self.assertEqual(Transaction.all_objects.filter(seller=self.seller).count(), 1)
+
+        response = self.client.get(f"{BASE_URL}/sellers/{self.seller.id}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deleted_phone_number_can_be_added_again(self):
+        self.client.force_authenticate(user=self.seller.user)
+        # A 400 From The Non-Atomic View Would Mark TestCase's Block For Rollback
+        serializer = PhoneNumberSerializer(data={"phone_number": "09121112233"})
+        self.assertFalse(serializer.is_valid())
+
+        self.client.delete(f"{BASE_URL}/phone-number/{self.phone.id}/")
+        self.assertIsNone(phone_numbers.get(self.phone.id))
+        response = self.client.post(
+            f"{BASE_URL}/phone-number/", {"phone_number": "09121112233"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            PhoneNumber.all_objects.filter(phone_number="09121112233").count(), 2
+        )
+
+    def test_queryset_delete_invalidates_phone_numbers(self):
+        self.assertIsNotNone(phone_numbers.get(self.phone.id))
+        version = CacheVersion.current(CacheVersion.PHONE_NUMBERS)
+
+        PhoneNumber.objects.filter(id=self.phone.id).delete()
+        self.assertIsNone(phone_numbers.get(self.phone.id))
+        self.assertEqual(CacheVersion.current(CacheVersion.PHONE_NUMBERS), version + 1)
+
+    def test_queryset_delete_updates_etag_and_summaries(self):
+        rows = [self.ledger_row] + [
+            TransactionFactory(seller=self.seller) for _ in range(4)
+        ]
+        TransactionDailySummary.record(rows)
+        _, etag = ledger_etag("application/json", id=self.seller.id)
+
+        # Set Based, The Deleted Rows Are Never Fetched One By One
+        with self.assertNumQueries(6):
+            Transaction.objects.filter(seller=self.seller).delete()
+        self.assertNotEqual(ledger_etag("application/json", id=self.seller.id)[1], etag)
+        summary = TransactionDailySummary.objects.get(seller=self.seller)
+        self.assertEqual(summary.count, 0)
+        self.assertEqual(summary.total_amount, Decimal("0.00"))
+
+    def test_charge_order_delete_updates_etag(self):
+        charge_order = ChargeOrderFactory(seller=self.seller)
+        _, etag = ledger_etag("application/json", id=self.seller.id)
+
+        ChargeOrder.objects.filter(id=charge_order.id).delete()
+        self.assertNotEqual(ledger_etag("application/json", id=self.seller.id)[1], etag)
+
+    def test_live_queries_use_partial_indexes(self):
+        queryset = Transaction.objects.filter(seller=self.seller).order_by(
+            "-created_at"
+        )
+        sql, params = queryset.query.sql_with_params()
+        self.assertIn(
+            "USING INDEX tx_seller_created_live", " ".join(explain(sql, params))
+        )
+
+
+class ImportPhoneNumbersTestCase(TestCase):
+    def import_file(self, content, suffix, *args):
+        with tempfile.NamedTemporaryFile("w", suffix=suffix) as handle:
+            handle.write(content)
+            handle.flush()
+            stdout = io.StringIO()
+            call_command("import_phone_numbers", handle.name, *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_text_import_skips_invalid_and_existing(self):
+        PhoneNumberFactory(phone_number="09120000001")
+        phone_numbers.get(0)
+
+        output = self.import_file(
+            "09120000001\n09120000002\n 09120000003 \n0912\nphone\n\n09120000002\n",
+            ".txt",
+            "--batch-size",
+            "2",
+        )
+        self.assertIn("Imported 2 phone numbers", output)
+        self.assertIn("2 invalid", output)
+        self.assertEqual(PhoneNumber.objects.count(), 3)
+        imported = PhoneNumber.objects.get(phone_number="09120000003")
+        self.assertIsNotNone(phone_numbers.get(imported.id))
+
+    def test_csv_import_in_worker_processes(self):
+        rows = "".join(f"{index},0913{index:07d}\n" for index in range(50))
+        self.import_file(
+            "id,number\n" + rows,
+            ".csv",
+            "--skip-header",
+            "--column",
+            "1",
+            "--workers",
+            "2",
+            "--inactive",
+        )
+        self.assertEqual(PhoneNumber.objects.filter(is_active=False).count(), 50)
+
+
+class ReconcileLedgerTestCase(TestCase):
+    def setUp(self):
+        self.admin = UserFactory(is_staff=True)
+        self.seller = SellerFactory(balance=Decimal("100.00"))
+        self.other = SellerFactory(balance=Decimal("10.00"))
+        self.phone = PhoneNumberFactory()
+        self.credit(self.seller, "50.00", CreditRequest.APPROVEDSTATUS)
+        self.credit(self.seller, "20.00", CreditRequest.REJECCTEDSTATUS)
+        self.charge(self.seller, "30.50")
+        self.charge(self.other, "4.00")
+
+    def credit(self, seller, amount, credit_status):
+        credit_request = CreditRequestFactory(
+            seller=seller, amount=Decimal(amount), status=credit_status
+        )
+        Transaction.submit_transaction_for_credit_increase(credit_request, self.admin)
+
+    def charge(self, seller, amount):
+        charge_order = ChargeOrderFactory(
+            seller=seller, phone_number=self.phone, amount=Decimal(amount)
+        )
+        Transaction.submit_transaction_for_charge_order(
+            charge_order, seller, seller.user
+        )
+
+    def reconcile(self):
+        stdout = io.StringIO()
+        call_command("reconcile_ledger", "--processes", "0", stdout=stdout)
+        return stdout.getvalue()
+
+    def test_clean_ledger_then_resume_from_checkpoint(self):
+        output = self.reconcile()
+        self.assertIn("Reconciled 2 sellers, 4 new transactions: no issues", output)
+
+        checkpoint = ReconciliationCheckpoint.objects.get(seller=self.seller)
+        self.assertEqual(checkpoint.state["opening"], 10000)
+        self.assertEqual(checkpoint.state["delta"], 1950)
+
+        self.charge(self.seller, "1.00")
+        output = self.reconcile()
+        self.assertIn("Reconciled 2 sellers, 1 new transactions: no issues", output)
+
+    def test_detects_balance_drift_and_broken_chain(self):
+        self.reconcile()
+        Seller.objects.filter(id=self.other.id).update(balance=Decimal("7.00"))
+        self.charge(self.seller, "5.00")
+        Transaction.objects.filter(seller=self.seller).order_by("-id").update(
+            balance_before=Decimal("500.00"), balance_after=Decimal("495.00")
+        )
+
+        stdout = io.StringIO()
+        with self.assertRaisesMessage(CommandError, "2 issues found"):
+            call_command("reconcile_ledger", "--processes", "0", stdout=stdout)
+        self.assertIn(
+            f"Seller {self.other.id}: balance 7.00, ledger says 6.00", stdout.getvalue()
+        )
+        self.assertIn(
+            f"Seller {self.seller.id}: balance chain breaks", stdout.getvalue()
+        )
+
+    def test_issues_are_reported_again_until_fixed(self):
+        row = Transaction.objects.filter(seller=self.seller).order_by("-id").first()
+        Transaction.objects.filter(id=row.id).update(
+            balance_before=Decimal("500.00"), balance_after=Decimal("469.50")
+        )
+
+        for _ in range(2):
+            stdout = io.StringIO()
+            with self.assertRaisesMessage(CommandError, "1 issues found"):
+                call_command("reconcile_ledger", "--processes", "0", stdout=stdout)
+            self.assertIn(
+                f"Seller {self.seller.id}: balance chain breaks", stdout.getvalue()
+            )
+
+        Transaction.objects.filter(id=row.id).update(
+            balance_before=row.balance_before, balance_after=row.balance_after
+        )
+        output = self.reconcile()
+        self.assertIn("Reconciled 2 sellers, 3 new transactions: no issues", output)
+
+
+class LedgerArchiveTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = UserFactory(is_staff=True)
+        self.client.force_authenticate(user=self.admin)
+        self.seller = SellerFactory()
+        self.phone = PhoneNumberFactory()
+        old = timezone.now() - timedelta(days=60)
+
+        self.old_ids = []
+        for amount in ("1.00", "2.00", "3.00"):
+            charge_order = ChargeOrderFactory(
+                seller=self.seller, phone_number=self.phone, amount=Decimal(amount)
+            )
+            row = TransactionFactory(
+                seller=self.seller,
+                charge_order=charge_order,
+                transaction_type=2,
+                amount=Decimal(amount),
+                status=Transaction.COMPLETESTATUS,
+            )
+            ChargeOrder.objects.filter(id=charge_order.id).update(created_at=old)
+            Transaction.objects.filter(id=row.id).update(created_at=old)
+            self.old_ids.append(row.id)
+
+        self.pending = TransactionFactory(seller=self.seller)
+        Transaction.objects.filter(id=self.pending.id).update(created_at=old)
+        self.recent = TransactionFactory(
+            seller=self.seller, status=Transaction.COMPLETESTATUS
+        )
+        call_command(
+            "archive_ledger",
+            "--retention-days",
+            "30",
+            "--batch-size",
+            "2",
+            stdout=io.StringIO(),
+        )
+        self.date_from = (old - timedelta(days=1)).date().isoformat()
+
+    def test_moves_settled_rows_in_batches(self):
+        self.assertEqual(
+            sorted(ArchivedTransaction.objects.values_list("id", flat=True)),
+            self.old_ids,
+        )
+        self.assertEqual(
+            set(Transaction.objects.values_list("id", flat=True)),
+            {self.pending.id, self.recent.id},
+        )
+        self.assertEqual(ArchivedChargeOrder.objects.count(), 3)
+        self.assertFalse(ChargeOrder.objects.exists())
+
+        archived = ArchivedTransaction.objects.get(id=self.old_ids[0])
+        self.assertEqual(archived.amount, Decimal("1.00"))
+        self.assertLess(archived.created_at, timezone.now() - timedelta(days=30))
+
+    def test_list_reads_archive_only_for_old_date_ranges(self):
+        response = self.client.get(f"{BASE_URL}/transactions/")
+        self.assertEqual(len(response.data["results"]), 2)
+
+        ids = []
+        url = f"{BASE_URL}/transactions/?date_from={self.date_from}&page_size=2"
+        while url:
+            response = self.client.get(url)
+            ids += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(ids[0], self.recent.id)
+        self.assertEqual(
+            set(ids), set(self.old_ids) | {self.pending.id, self.recent.id}
+        )
+
+    def test_retrieve_export_and_summary_include_archive(self):
+        response = self.client.get(f"{BASE_URL}/transactions/{self.old_ids[1]}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["amount"], "2.00")
+
+        response = self.client.get(
+            f"{BASE_URL}/transactions/export/?date_from={self.date_from}"
+        )
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual([row["id"] for row in rows], sorted(row["id"] for row in rows))
+        self.assertEqual(len(rows), 5)
+
+        response = self.client.get(
+            f"{BASE_URL}/transactions/summary/"
+            f"?date_from={self.date_from}&status={Transaction.COMPLETESTATUS}"
+        )
+        charges = [row for row in response.data if row["transaction_type"] == 2]
+        self.assertEqual(charges[0]["count"], 3)
+        self.assertEqual(charges[0]["total_amount"], Decimal("6.00"))
+
+
+class BalanceAtTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = UserFactory(is_staff=True)
+        self.client.force_authenticate(user=self.admin)
+        self.seller = SellerFactory(balance=Decimal("1000.00"))
+        self.phone = PhoneNumberFactory()
+        self.start = timezone.now() - timedelta(days=60)
+        Seller.objects.filter(id=self.seller.id).update(created_at=self.start)
+
+    def charge(self, hours, amount="50.00"):
+        charge_order = ChargeOrderFactory(
+            seller=self.seller, phone_number=self.phone, amount=Decimal(amount)
+        )
+        row = Transaction.submit_transaction_for_charge_order(
+            charge_order, self.seller, self.admin
+        )
+        Transaction.objects.filter(id=row.id).update(
+            created_at=self.start + timedelta(hours=hours)
+        )
+        return row
+
+    def at(self, hours):
+        return self.start + timedelta(hours=hours)
+
+    def test_unstriped_lookup_reads_one_row(self):
+        for hours in (1, 2, 3):
+            self.charge(hours)
+
+        with self.assertNumQueries(3):
+            self.assertEqual(
+                Seller.balance_at(self.seller.id, self.at(2.5)), Decimal("900.00")
+            )
+        self.assertEqual(
+            Seller.balance_at(self.seller.id, self.at(0.5)), Decimal("1000.00")
+        )
+        self.assertEqual(
+            Seller.balance_at(self.seller.id, self.at(4)), Decimal("850.00")
+        )
+        self.assertIsNone(Seller.balance_at(self.seller.id, self.at(-1)))
+
+        # Archived Rows Still Answer Old Lookups
+        call_command("archive_ledger", "--retention-days", "30", stdout=io.StringIO())
+        self.assertFalse(Transaction.objects.exists())
+        self.assertEqual(
+            Seller.balance_at(self.seller.id, self.at(1.5)), Decimal("950.00")
+        )
+
+    @override_settings(SELLER_BALANCE_STRIPES=4)
+    def test_striped_lookup_adds_up_from_checkpoint(self):
+        self.charge(1)
+        self.charge(2, "30.00")
+        self.assertEqual(
+            Seller.balance_at(self.seller.id, self.at(1.5)), Decimal("950.00")
+        )
+
+        call_command(
+            "checkpoint_balances", "--min-transactions", "2", stdout=io.StringIO()
+        )
+        checkpoint = BalanceCheckpoint.objects.get(seller=self.seller)
+        self.assertEqual(checkpoint.balance, Decimal("920.00"))
+
+        later = (checkpoint.as_of - self.start).total_seconds() / 3600
+        self.charge(later + 1, "20.00")
+        self.charge(later + 2, "10.00")
+        self.assertEqual(
+            Seller.balance_at(self.seller.id, self.at(later + 1.5)), Decimal("900.00")
+        )
+
+        # Below The Threshold No New Checkpoint Is Taken
+        call_command(
+            "checkpoint_balances", "--min-transactions", "3", stdout=io.StringIO()
+        )
+        self.assertEqual(
+            BalanceCheckpoint.objects.filter(seller=self.seller).count(), 1
+        )
+
+    @override_settings(SELLER_BALANCE_STRIPES=4)
+    def test_striped_rejected_credit_records_stripe_total(self):
+        self.charge(1, "300.00")
+        self.seller.refresh_from_db()
+        self.assertEqual(self.seller.balance, Decimal("700.00"))
+
+        rejected = CreditRequestFactory(
+            seller=self.seller, status=CreditRequest.REJECCTEDSTATUS
+        )
+        row = Transaction.submit_transaction_for_credit_increase(rejected, self.admin)
+        self.assertEqual(row.balance_after, Decimal("700.00"))
+        self.assertEqual(
+            Seller.balance_at(self.seller.id, timezone.now()), Decimal("700.00")
+        )
+
+        rejected = CreditRequestFactory(
+            seller=self.seller, status=CreditRequest.REJECCTEDSTATUS
+        )
+        (row,) = Transaction.submit_transactions_for_credit_requests(
+            [rejected], self.admin
+        )
+        self.assertEqual(row.balance_after, Decimal("700.00"))
+
+    def test_balance_at_api(self):
+        self.charge(1)
+        url = f"{BASE_URL}/sellers/{self.seller.id}/balance-at/"
+
+        response = self.client.get(f"{url}?{urlencode({'at': self.at(2).isoformat()})}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["balance"], "950.00")
+
+        response = self.client.get(
+            f"{url}?at={(self.start - timedelta(days=1)).date()}"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(f"{url}?at=yesterday")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ISO 8601 datetime", str(response.data["at"]))
+        self.assertIn("YYYY-MM-DD format", str(response.data["at"]))
+
+
+class QueryPlanTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.sample = seed(sellers=5, phone_numbers=100, transactions=2000)
+
+    def test_hot_queries_use_indexes(self):
+        for name, statements in check_hot_queries(self.sample).items():
+            for sql, plan, problems in statements:
+                with self.subTest(query=name, sql=sql):
+                    self.assertEqual(problems, [], plan)
+
+    def test_scans_and_sorts_are_reported(self):
+        queryset = Transaction.objects.filter(amount=Decimal("1000.00"))
+        sql, params = queryset.query.sql_with_params()
+        self.assertTrue(plan_problems(sql, explain(sql, params)))
+
+        queryset = Transaction.objects.filter(seller=self.sample["seller_id"])
+        sql, params = queryset.order_by("amount").query.sql_with_params()
+        self.assertIn(
+            "USE TEMP B-TREE FOR ORDER BY", plan_problems(sql, explain(sql, params))
+        )
+
+    def test_credit_requests_filter_by_status(self):
+        self.client.force_login(self.sample["admin"])
+        response = self.client.get(f"{BASE_URL}/credit-requests/?status=pending")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data)
+        self.assertEqual({row["status"] for row in response.data}, {"pending"})
+
+        response = self.client.get(f"{BASE_URL}/credit-requests/?status=2")
+        self.assertEqual({row["status"] for row in response.data}, {"approved"})
+
+        response = self.client.get(f"{BASE_URL}/credit-requests/?status=garbage")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("status", response.data)
+
+
+class RateLimitTestCase(TransactionTestCase):
+    # A 429 Raised Inside TestCase's Atomic Block Would Mark It For Rollback
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = SellerFactory()
+        self.other_seller = SellerFactory()
+        self.phone = PhoneNumberFactory()
+
+    def charge(self, seller, amount="10.00"):
+        self.client.force_authenticate(user=seller.user)
+        data = {"seller": seller.id, "phone_number": self.phone.id, "amount": amount}
+        return self.client.post(f"{BASE_URL}/charge-orders/", data)
+
+    def test_bucket_refills_over_time(self):
+        self.assertEqual(RateLimitBucket.consume("test", 2, 4, now=100.0), 0)
+        self.assertEqual(RateLimitBucket.consume("test", 2, 4, now=100.0), 0)
+        self.assertEqual(RateLimitBucket.consume("test", 2, 4, now=100.0), 0.25)
+        self.assertEqual(RateLimitBucket.consume("test", 2, 4, now=100.25), 0)
+
+        # Refill Never Goes Above The Burst
+        self.assertEqual(RateLimitBucket.consume("test", 2, 4, now=1000.0), 0)
+        self.assertEqual(RateLimitBucket.consume("test", 2, 4, now=1000.0), 0)
+        self.assertGreater(RateLimitBucket.consume("test", 2, 4, now=1000.0), 0)
+
+    @override_settings(SELLER_RATE_LIMITS={"default": {"burst": 2, "rate": 0.1}})
+    def test_charge_orders_over_the_burst_get_429(self):
+        self.assertEqual(self.charge(self.seller).status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            self.charge(self.seller, "11.00").status_code, status.HTTP_201_CREATED
+        )
+
+        response = self.charge(self.seller, "12.00")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "10")
+        self.assertEqual(ChargeOrder.objects.filter(seller=self.seller).count(), 2)
+
+        # Other Sellers Have Their Own Bucket
+        self.assertEqual(
+            self.charge(self.other_seller).status_code, status.HTTP_201_CREATED
+        )
+
+    @override_settings(
+        SELLER_RATE_LIMITS={
+            "default": {"burst": 1, "rate": 0.1},
+            "charge_orders": {"burst": 3, "rate": 0.1},
+        }
+    )
+    def test_scoped_views_use_their_own_bucket(self):
+        for amount in ("10.00", "11.00", "12.00"):
+            self.assertEqual(
+                self.charge(self.seller, amount).status_code, status.HTTP_201_CREATED
+            )
+        self.assertTrue(
+            RateLimitBucket.objects.filter(
+                key=f"seller:{self.seller.id}:charge_orders"
+            ).exists()
+        )
+        self.assertFalse(
+            RateLimitBucket.objects.filter(key__endswith=":default").exists()
+        )
+
+
+class AsyncReadViewsTestCase(TestCase):
+    def setUp(self):
+        self.admin = UserFactory(is_staff=True)
+        self.seller = SellerFactory()
+        self.phone = PhoneNumberFactory()
+        for amount in ("10.00", "20.00", "30.00"):
+            charge_order = ChargeOrderFactory(
+                seller=self.seller, phone_number=self.phone, amount=Decimal(amount)
+            )
+            self.last = TransactionFactory(
+                seller=self.seller,
+                charge_order=charge_order,
+                phone_number=self.phone,
+                transaction_type=2,
+                amount=Decimal(amount),
+                status=Transaction.COMPLETESTATUS,
+            )
+        self.today = timezone.localdate().isoformat()
+
+    async def get_both(self, path, user):
+        await self.client.aforce_login(user)
+        sync_response = await sync_to_async(self.client.get)(f"{BASE_URL}/{path}")
+        await self.async_client.aforce_login(user)
+        async_response = await self.async_client.get(f"{BASE_URL}/async/{path}")
+        return sync_response, async_response
+
+    async def test_responses_match_sync_endpoints(self):
+        paths = [
+            ("transactions/?page_size=2", self.admin),
+            (f"transactions/?phone_number={self.phone.id}", self.admin),
+            (f"transactions/{self.last.id}/", self.admin),
+            ("transactions/summary/", self.admin),
+            (f"transactions/summary/?status=2&date_from={self.today}", self.admin),
+            ("charge-orders-list/?page_size=2", self.seller.user),
+            (f"sellers/{self.seller.id}/", self.admin),
+            ("transactions/999999/", self.admin),
+            ("transactions/?date_from=yesterday", self.admin),
+        ]
+        for path, user in paths:
+            with self.subTest(path=path):
+                sync_response, async_response = await self.get_both(path, user)
+                self.assertEqual(async_response.status_code, sync_response.status_code)
+                self.assertEqual(
+                    async_response.content.replace(b"/async/", b"/"),
+                    sync_response.content,
+                )
+
+    async def test_etags_match_sync_endpoints(self):
+        paths = [
+            (f"sellers/{self.seller.id}/", self.admin),
+            (f"transactions/?seller={self.seller.id}", self.admin),
+            ("charge-orders-list/", self.seller.user),
+        ]
+        for path, user in paths:
+            with self.subTest(path=path):
+                sync_response, async_response = await self.get_both(path, user)
+                self.assertEqual(async_response["ETag"], sync_response["ETag"])
+
+                response = await self.async_client.get(
+                    f"{BASE_URL}/async/{path}",
+                    headers={"If-None-Match": async_response["ETag"]},
+                )
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response["ETag"], async_response["ETag"])
+
+    async def test_queries_are_counted(self):
+        await self.async_client.aforce_login(self.admin)
+        response = await self.async_client.get(f"{BASE_URL}/async/transactions/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        queries = int(
+            re.search(r'desc="(\d+) queries"', response["Server-Timing"]).group(1)
+        )
+        self.assertGreater(queries, 0)
+
+    async def test_permissions_and_basic_auth(self):
+        response = await self.async_client.get(
+            f"{BASE_URL}/async/sellers/{self.seller.id}/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response["WWW-Authenticate"], 'Basic realm="api"')
+
+        await self.async_client.aforce_login(self.seller.user)
+        response = await self.async_client.get(
+            f"{BASE_URL}/async/sellers/{self.seller.id}/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        await self.async_client.alogout()
+
+        self.admin.set_password("secret")
+        await self.admin.asave()
+        credentials = base64.b64encode(
+            f"{self.admin.username}:secret".encode()
+        ).decode()
+        response = await self.async_client.get(
+            f"{BASE_URL}/async/sellers/{self.seller.id}/",
+            headers={"Authorization": f"Basic {credentials}"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["balance"], "1000.00")
+
+
+class LedgerETagTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = UserFactory(is_staff=True)
+        self.seller = SellerFactory(balance=Decimal("100.00"))
+        self.phone = PhoneNumberFactory()
+
+    def charge(self, amount="10.00"):
+        self.client.force_authenticate(user=self.seller.user)
+        return self.client.post(
+            f"{BASE_URL}/charge-orders/",
+            {
+                "seller": self.seller.id,
+                "phone_number": self.phone.id,
+                "amount": amount,
+            },
+        )
+
+    def test_unchanged_ledger_answers_not_modified(self):
+        self.client.force_authenticate(user=self.admin)
+        paths = [
+            f"{BASE_URL}/sellers/{self.seller.id}/",
+            f"{BASE_URL}/transactions/?seller={self.seller.id}",
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                etag = response["ETag"]
+
+                # Only The Version Is Read, Nothing Is Rendered
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                selects = [
+                    query["sql"]
+                    for query in queries.captured_queries
+                    if query["sql"].startswith("SELECT")
+                ]
+                self.assertEqual(len(selects), 1)
+                self.assertEqual(response["ETag"], etag)
+
+        response = self.client.get(f"{BASE_URL}/transactions/")
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_etag_is_per_representation(self):
+        self.client.force_authenticate(user=self.admin)
+        path = f"{BASE_URL}/sellers/{self.seller.id}/"
+        etag = self.client.get(path)["ETag"]
+
+        response = self.client.get(
+            path, HTTP_ACCEPT="text/html", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn("Accept", response["Vary"])
+
+    @override_settings(SELLER_BALANCE_STRIPES=4)
+    def test_charge_changes_etags(self):
+        self.client.force_authenticate(user=self.seller.user)
+        etag = self.client.get(f"{BASE_URL}/charge-orders-list/")["ETag"]
+        self.client.force_authenticate(user=self.admin)
+        listing = f"{BASE_URL}/transactions/?seller={self.seller.id}"
+        listing_etag = self.client.get(listing)["ETag"]
+
+        # Striped Debits Only Touch A Stripe Row
+        self.assertEqual(self.charge().status_code, status.HTTP_201_CREATED)
+        self.assertTrue(SellerBalanceStripe.objects.filter(seller=self.seller).exists())
+
+        response = self.client.get(f"{BASE_URL}/charge-orders-list/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(listing, HTTP_IF_NONE_MATCH=listing_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], listing_etag)
+
+    def test_duplicate_retry_changes_charge_order_etag(self):
+        self.assertEqual(self.charge().status_code, status.HTTP_201_CREATED)
+        etag = self.client.get(f"{BASE_URL}/charge-orders-list/")["ETag"]
+
+        self.assertEqual(self.charge().status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            f"{BASE_URL}/charge-orders-list/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["retry_count"], 1)
+
+
 def create_credit_request_worker(seller_data, amount, base_url):
     from django.test import Client
     from rest_framework.test import APIClient
@@ -278,9 +2141,16 @@ class ChargeOrderAPITestCase(TestCase):
                 seller=self.seller1, phone_number=self.phone1, amount=amount
             )
 
-        response = self.client.get(f"{BASE_URL}/charge-orders-list/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1000)
+        listed_ids = []
+        url = f"{BASE_URL}/charge-orders-list/?page_size=300"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            listed_ids.extend(order["id"] for order in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(len(listed_ids), 1000)
+        self.assertEqual(len(set(listed_ids)), 1000)
 
     def test_multiple_phones_1000_orders(self):
         self.client.force_authenticate(user=self.user1)
@@ -1,5 +1,6 @@
 from django.urls import path, include
 from .views import *
+from . import async_views
 from rest_framework.routers import DefaultRouter
 
 router = DefaultRouter()
@@ -13,7 +14,43 @@ router.register(r"transactions", TransactionReadOnlyViewSet, basename="transacti
 urlpatterns = [
     path("", include(router.urls)),
     path("charge-orders/", ChargeOrderCreateView.as_view(), name="charge-order-create"),
+    path(
+        "charge-orders/batch/",
+        ChargeOrderBatchCreateView.as_view(),
+        name="charge-order-batch-create",
+    ),
+    path(
+        "charge-orders/<int:pk>/status/",
+        ChargeOrderStatusView.as_view(),
+        name="charge-order-status",
+    ),
     path(
         "charge-orders-list/", ChargeOrderListView.as_view(), name="charge-order-list"
     ),
+    # Async Read Endpoints, For Dashboards Polling Under ASGI
+    path(
+        "async/transactions/",
+        async_views.transaction_list,
+        name="async-transaction-list",
+    ),
+    path(
+        "async/transactions/summary/",
+        async_views.transaction_summary,
+        name="async-transaction-summary",
+    ),
+    path(
+        "async/transactions/<int:pk>/",
+        async_views.transaction_detail,
+        name="async-transaction-detail",
+    ),
+    path(
+        "async/charge-orders-list/",
+        async_views.charge_order_list,
+        name="async-charge-order-list",
+    ),
+    path(
+        "async/sellers/<int:pk>/",
+        async_views.seller_detail,
+        name="async-seller-detail",
+    ),
 ]
@@ -1,22 +1,66 @@
 from django.shortcuts import render
 from rest_framework import viewsets, mixins
 from rest_framework.views import APIView
-from .models import Seller, CreditRequest, Transaction, PhoneNumber, ChargeOrder
+from .models import (
+    Seller,
+    CreditRequest,
+    Transaction,
+    PhoneNumber,
+    ChargeOrder,
+    ChargeIdempotencyKey,
+    ChargeJob,
+    TransactionDailySummary,
+    ArchivedTransaction,
+    LedgerEvent,
+    balance_stripe_count,
+)
 from .serializers import (
     SellerSerializer,
     CreditRequestSerializer,
     CreditRequestUpdateStatusSerializer,
+    CreditRequestBulkUpdateStatusSerializer,
     PhoneNumberSerializer,
     ChargeOrderSerializer,
+    ChargeOrderBatchSerializer,
+    ChargeOrderStatusSerializer,
     TransactionSerializer,
 )
 from django.db import transaction
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAdminUser
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from core.permission import IsSellerUser
-from django.db.models import F
+from .pagination import ChangeFeedPagination, KeysetPagination
+from .throttling import SellerTokenBucketThrottle
+from .db import atomic_with_retry
+from .caches import phone_numbers
+from .filters import (
+    DAILY_SUMMARY_AGGREGATES,
+    LEDGER_AGGREGATES,
+    filter_daily_summaries,
+    filter_transactions,
+    parse_id,
+    parse_moment,
+    merge_totals,
+)
+from .exports import EXPORT_FORMATS, export_rows
+from .archive import merge_by_id, needs_archive
+from .conditional import ledger_etag, not_modified, with_etag
+from .fast_serializers import (
+    charge_order_values,
+    credit_request_values,
+    ledger_event_values,
+    transaction_values,
+)
+from django.http import Http404, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.db.models import Sum
+from django.utils import timezone
+from decimal import Decimal
 import logging
 from drf_spectacular.utils import extend_schema
 
@@ -24,35 +68,107 @@ from drf_spectacular.utils import extend_schema
 logger = logging.getLogger(__name__)
 
 
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
 class SellerViewSet(viewsets.ModelViewSet):
 
     queryset = Seller.objects.all()
     serializer_class = SellerSerializer
     permission_classes = [IsAdminUser]
 
-    @transaction.atomic
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if balance_stripe_count() > 1:
+            queryset = queryset.annotate(
+                striped_balance=Sum("balance_stripes__balance")
+            )
+        return queryset
+
+    @atomic_with_retry
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
-    @transaction.atomic
+    @atomic_with_retry
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
+    @atomic_with_retry
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        Seller.bump_ledger_version([serializer.instance.id])
+
+    def retrieve(self, request, *args, **kwargs):
+        # The Version Is Read First, A Write In Between Only Costs A Refetch
+        etag = None
+        if str(kwargs["pk"]).isdigit():
+            _, etag = ledger_etag(request.accepted_renderer.media_type, id=kwargs["pk"])
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        return with_etag(super().retrieve(request, *args, **kwargs), etag)
+
+    @action(detail=True, methods=["get"], url_path="balance-at")
+    def balance_at(self, request, pk=None):
+        moment = parse_moment(request.query_params.get("at"), "at")
+        seller = self.get_object()
+        balance = Seller.balance_at(seller.id, moment)
+        if balance is None:
+            raise Http404("The seller did not exist at that time.")
+        return Response(
+            {"seller": seller.id, "at": moment.isoformat(), "balance": str(balance)}
+        )
+
 
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
 class CreditRequestViewSet(viewsets.ModelViewSet):
 
-    queryset = CreditRequest.objects.select_for_update().select_related("seller")
+    queryset = CreditRequest.objects.select_related("seller").prefetch_related(
+        "transactions"
+    )
     serializer_class = CreditRequestSerializer
     permission_classes = [IsSellerUser]
 
-    @transaction.atomic
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Reads Run Outside A Transaction, Only Writes Lock The Row
+        if self.action not in ("list", "retrieve"):
+            queryset = queryset.select_for_update()
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        # Approvers List The Queue With ?status=pending
+        status_param = request.query_params.get("status", None)
+        if status_param:
+            statuses = {
+                name: value
+                for value, name in CreditRequestSerializer.STATUS_MAP.items()
+            }
+            status_value = statuses.get(status_param, status_param)
+            if status_value not in CreditRequestSerializer.STATUS_MAP:
+                raise ValidationError(
+                    {"status": f"Choose one of: {', '.join(statuses)}."}
+                )
+            queryset = queryset.filter(status=status_value)
+
+        queryset = credit_request_values.values(queryset)
+        return Response(credit_request_values.render(queryset))
+
+    @atomic_with_retry
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
-    @transaction.atomic
+    @atomic_with_retry
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
+    @atomic_with_retry
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
+
     @action(
         detail=True,
         methods=["patch"],
@@ -60,150 +176,383 @@ class CreditRequestViewSet(viewsets.ModelViewSet):
         serializer_class=CreditRequestUpdateStatusSerializer,
         permission_classes=[IsAdminUser],
     )
+    @atomic_with_retry
     def update_status(self, request, pk=None):
-        with transaction.atomic():
-            credit_request = (
-                CreditRequest.objects.select_for_update().filter(pk=pk).first()
-            )
-
-            if not credit_request:
-                return Response(status=status.HTTP_404_NOT_FOUND)
+        credit_request = CreditRequest.objects.select_for_update().filter(pk=pk).first()
 
-            if credit_request.is_processed:
-                return Response(
-                    {"error": "This credit request has already been processed"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+        if not credit_request:
+            return Response(status=status.HTTP_404_NOT_FOUND)
 
-            serializer = self.get_serializer(
-                credit_request, data=request.data, partial=True
+        if credit_request.is_processed:
+            return Response(
+                {"error": "This credit request has already been processed"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            serializer.is_valid(raise_exception=True)
-
-            balance_before = credit_request.seller.balance
 
-            if request.data["status"] == CreditRequest.REJECCTEDSTATUS:
-                pass
-            elif request.data["status"] == CreditRequest.APPROVEDSTATUS:
-                Seller.objects.filter(id=credit_request.seller.id).update(
-                    balance=F("balance") + credit_request.amount
-                )
-
-            # If you Want Update Status Api Should Be Editable Use This Code
-            # if request.data["status"] != credit_request.status:
-            #     if (
-            #         request.data["status"] == CreditRequest.REJECCTEDSTATUS
-            #         and credit_request.status == CreditRequest.APPROVEDSTATUS
-            #     ):
-            #         Seller.objects.filter(id=credit_request.seller.id).update(
-            #             balance=F("balance") - credit_request.amount
-            #         )
-            #     elif request.data["status"] == CreditRequest.APPROVEDSTATUS:
-            #         Seller.objects.filter(id=credit_request.seller.id).update(
-            #             balance=F("balance") + credit_request.amount
-            #         )
-
-            credit_request.seller.refresh_from_db()
-            balance_after = credit_request.seller.balance
-
-            credit_request.is_processed = True
-            serializer.save()
-
-            Transaction.submit_transaction_for_credit_increase(
-                credit_request=credit_request,
-                user=request.user,
-                balance_after=balance_after,
-                balance_before=balance_before,
-            )
+        serializer = self.get_serializer(
+            credit_request, data=request.data, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(is_processed=True)
+
+        # If you Want Update Status Api Should Be Editable Use This Code
+        # if request.data["status"] != credit_request.status:
+        #     if (
+        #         request.data["status"] == CreditRequest.REJECCTEDSTATUS
+        #         and credit_request.status == CreditRequest.APPROVEDSTATUS
+        #     ):
+        #         Seller.debit(credit_request.seller.id, credit_request.amount)
+        #     elif request.data["status"] == CreditRequest.APPROVEDSTATUS:
+        #         Seller.credit(credit_request.seller.id, credit_request.amount)
+
+        # Credits The Seller In The Same Statement That Reads The New Balance
+        Transaction.submit_transaction_for_credit_increase(
+            credit_request=credit_request,
+            user=request.user,
+        )
 
         data = CreditRequestSerializer(credit_request).data
         return Response(data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-update-status",
+        serializer_class=CreditRequestBulkUpdateStatusSerializer,
+        permission_classes=[IsAdminUser],
+    )
+    @atomic_with_retry
+    def bulk_update_status(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        statuses = {
+            item["id"]: item["status"] for item in serializer.validated_data["items"]
+        }
+
+        # 1-Lock Requests In Id Order So Concurrent Bulk Calls Cannot Deadlock
+        credit_requests = {
+            credit_request.id: credit_request
+            for credit_request in CreditRequest.objects.select_for_update()
+            .filter(id__in=statuses)
+            .order_by("id")
+        }
+
+        # 2-Apply Statuses To Unprocessed Requests
+        results = []
+        to_process = []
+        now = timezone.now()
+        for credit_request_id, new_status in statuses.items():
+            credit_request = credit_requests.get(credit_request_id)
+            if credit_request is None:
+                result = "not_found"
+            elif credit_request.is_processed:
+                result = "already_processed"
+            else:
+                credit_request.status = new_status
+                credit_request.is_processed = True
+                credit_request.updated_at = now
+                to_process.append(credit_request)
+                result = CreditRequestSerializer.STATUS_MAP[str(new_status)]
+            results.append({"id": credit_request_id, "status": result})
+
+        # 3-Save Statuses, Credit Each Seller Once And Insert Transactions
+        CreditRequest.objects.bulk_update(
+            to_process, ["status", "is_processed", "updated_at"]
+        )
+        Transaction.submit_transactions_for_credit_requests(to_process, request.user)
+
+        return Response(
+            {"processed": len(to_process), "results": results},
+            status=status.HTTP_200_OK,
+        )
+
 
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
 class PhoneNumberViewset(viewsets.ModelViewSet):
 
     queryset = PhoneNumber.objects.all()
     serializer_class = PhoneNumberSerializer
     permission_classes = [IsSellerUser]
 
+    @atomic_with_retry
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
+    @atomic_with_retry
+    def update(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
+
+    @atomic_with_retry
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
+
+
+class WarmPhoneNumbersMixin:
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # Reload The Phone Cache Before The Write Transaction Takes The Lock
+        phone_numbers.warm()
+
 
-class ChargeOrderCreateView(APIView):
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class ChargeOrderCreateView(WarmPhoneNumbersMixin, APIView):
     permission_classes = [IsSellerUser]
+    throttle_classes = [SellerTokenBucketThrottle]
+    throttle_scope = "charge_orders"
 
     @extend_schema(request=ChargeOrderSerializer)
-    @transaction.atomic
+    @atomic_with_retry
     def post(self, request):
-        try:
-            serializer = ChargeOrderSerializer(data=request.data)
-            if not serializer.is_valid():
-                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            seller_id = serializer.validated_data["seller"].id
-            phone_number = serializer.validated_data["phone_number"]
-            amount = serializer.validated_data["amount"]
-
-            # 1-Check For Recent Duplicate Request
-            recent_order = ChargeOrder.get_recent_order(seller_id, phone_number, amount)
-
-            # 2-Increment Retry Count
+        serializer = ChargeOrderSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        seller_id = serializer.validated_data["seller"].id
+        phone_number = serializer.validated_data["phone_number"]
+        amount = serializer.validated_data["amount"]
+
+        # 1-Check For Recent Duplicate Request, Then Claim The Key
+        keys = ChargeIdempotencyKey.keys_for(
+            phone_number, amount, request.headers.get("Idempotency-Key")
+        )
+        recent_order_id = ChargeIdempotencyKey.find_recent(seller_id, keys)
+        idempotency_key = None
+        if recent_order_id is None:
+            idempotency_key = ChargeIdempotencyKey.claim(seller_id, keys[0])
+            if idempotency_key is None:
+                recent_order_id = ChargeIdempotencyKey.find_recent(seller_id, keys)
+
+        # 2-Increment Retry Count
+        if idempotency_key is None:
+            recent_order = ChargeOrder.objects.filter(id=recent_order_id).first()
             if recent_order:
                 recent_order.retry_count += 1
                 recent_order.error_message = f"Duplicate request attempt. Retry count: {recent_order.retry_count}"
                 recent_order.save(
                     update_fields=["retry_count", "error_message", "updated_at"]
                 )
+                Seller.bump_ledger_version([seller_id])
 
-                return Response(
-                    {
-                        "error": "Duplicate request found within 10 minutes",
-                        "recent_order_id": recent_order.id,
-                        "retry_count": recent_order.retry_count,
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
+            return Response(
+                {
+                    "error": "Duplicate request found within 10 minutes",
+                    "recent_order_id": recent_order_id,
+                    "retry_count": recent_order.retry_count if recent_order else 0,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 3-Create New Charge Order
+        charge_order = serializer.save()
+        idempotency_key.bind(charge_order)
+
+        # 4-Debit Seller Balance And Create Transaction, Async Only Reserves
+        accept_async = "respond-async" in request.headers.get("Prefer", "")
+        new_transaction = Transaction.submit_transaction_for_charge_order(
+            charge_order=charge_order,
+            seller=serializer.validated_data["seller"],
+            user=request.user,
+            status=(
+                Transaction.PENDINGSTATUS
+                if accept_async
+                else Transaction.COMPLETESTATUS
+            ),
+        )
+        if new_transaction is None:
+            transaction.set_rollback(True)
+            return Response(
+                {"non_field_errors": ["Insufficient seller balance"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 5-Queue Settlement For The Worker Pool
+        if accept_async:
+            ChargeJob.objects.create(charge_order=charge_order)
+            logger.info(f"Charge order accepted for settlement: {charge_order.id}")
+            return Response(
+                ChargeOrderStatusSerializer(charge_order).data,
+                status=status.HTTP_202_ACCEPTED,
+                headers={
+                    "Preference-Applied": "respond-async",
+                    "Location": reverse("charge-order-status", args=[charge_order.id]),
+                },
+            )
+
+        logger.info(f"Charge order created successfully: {charge_order.id}")
+
+        return Response(
+            ChargeOrderSerializer(charge_order).data, status=status.HTTP_201_CREATED
+        )
+
+
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class ChargeOrderBatchCreateView(WarmPhoneNumbersMixin, APIView):
+    permission_classes = [IsSellerUser]
+    throttle_classes = [SellerTokenBucketThrottle]
+    throttle_scope = "charge_orders"
+
+    @extend_schema(request=ChargeOrderBatchSerializer)
+    @atomic_with_retry
+    def post(self, request):
+        serializer = ChargeOrderBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        items = serializer.validated_data["items"]
+        if serializer.validated_data["seller"].user_id != request.user.id:
+            raise PermissionDenied("Batches can only charge your own balance.")
+
+        # 1-Lock The Seller Once For The Whole Batch
+        seller = Seller.objects.select_for_update().get(
+            id=serializer.validated_data["seller"].id
+        )
+
+        # 2-Check Duplicates Against Recent Keys And Earlier Batch Items
+        now = timezone.now()
+        item_keys = [
+            ChargeIdempotencyKey.keys_for(item["phone_number"], item["amount"], now=now)
+            for item in items
+        ]
+        recent_keys = ChargeIdempotencyKey.find_recent_many(
+            seller.id, {key for keys in item_keys for key in keys}
+        )
+        recent_orders = ChargeOrder.objects.in_bulk(set(recent_keys.values()))
+
+        orders_by_key = {}
+        retried_orders = {}
+        new_orders = []
+        results = []
+        for index, (item, (key, previous_key)) in enumerate(zip(items, item_keys)):
+            duplicate_of = orders_by_key.get(key)
+            if duplicate_of is None:
+                order_id = recent_keys.get(key) or recent_keys.get(previous_key)
+                duplicate_of = recent_orders.get(order_id)
+            if duplicate_of is None:
+                charge_order = ChargeOrder(
+                    seller=seller,
+                    phone_number=item["phone_number"],
+                    amount=item["amount"],
                 )
+                orders_by_key[key] = charge_order
+                new_orders.append(charge_order)
+                results.append({"index": index, "charge_order": charge_order})
+                continue
+
+            duplicate_of.retry_count += 1
+            duplicate_of.updated_at = now
+            duplicate_of.error_message = (
+                f"Duplicate request attempt. Retry count: {duplicate_of.retry_count}"
+            )
+            if duplicate_of.pk:
+                retried_orders[duplicate_of.pk] = duplicate_of
+            results.append(
+                {
+                    "index": index,
+                    "charge_order": duplicate_of,
+                    "retry_count": duplicate_of.retry_count,
+                }
+            )
 
-            # 3-Create New Charge Order
-            charge_order = serializer.save()
-            # 2-Update Seller Balance And Create Transaction
-            try:
-                seller = Seller.objects.select_for_update().get(id=seller_id)
-                balance_before = seller.balance
-                seller.balance = F("balance") - amount
-                seller.save(update_fields=["balance"])
-                seller.refresh_from_db()
-                balance_after = seller.balance
-
-            except Seller.DoesNotExist:
+        # 3-Validate The Batch Total Against The Balance
+        total = sum((order.amount for order in new_orders), Decimal("0.00"))
+        if total > seller.balance:
+            return Response(
+                {"non_field_errors": ["Insufficient seller balance"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 4-Create Charge Orders, Debit Once And Create Transactions
+        if new_orders:
+            ChargeOrder.objects.bulk_create(new_orders)
+            ChargeIdempotencyKey.bind_many(seller.id, orders_by_key)
+            created = Transaction.submit_transactions_for_charge_orders(
+                new_orders, seller, request.user
+            )
+            if created is None:
+                transaction.set_rollback(True)
                 return Response(
-                    {"error": "Seller not found"}, status=status.HTTP_404_NOT_FOUND
+                    {"non_field_errors": ["Insufficient seller balance"]},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
-            Transaction.submit_transaction_for_charge_order(
-                charge_order=charge_order,
-                seller=seller,
-                user=request.user,
-                balance_after=balance_after,
-                balance_before=balance_before,
+        if retried_orders:
+            ChargeOrder.objects.bulk_update(
+                retried_orders.values(), ["retry_count", "error_message", "updated_at"]
             )
+            Seller.bump_ledger_version([seller.id])
 
-            logger.info(f"Charge order created successfully: {charge_order.id}")
+        logger.info(
+            f"Charge order batch for seller {seller.id}: "
+            f"{len(new_orders)} created, {len(items) - len(new_orders)} duplicates"
+        )
 
-            return Response(
-                ChargeOrderSerializer(charge_order).data, status=status.HTTP_201_CREATED
+        return Response(
+            {
+                "seller": seller.id,
+                "created": len(new_orders),
+                "duplicates": len(items) - len(new_orders),
+                "total_amount": str(total),
+                "results": [self._result(result) for result in results],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    @staticmethod
+    def _result(result):
+        charge_order = result["charge_order"]
+        item = {
+            "index": result["index"],
+            "phone_number": charge_order.phone_number_id,
+            "amount": str(charge_order.amount),
+        }
+        if "retry_count" in result:
+            item.update(
+                status="duplicate",
+                recent_order_id=charge_order.id,
+                retry_count=result["retry_count"],
             )
+        else:
+            item.update(status="created", charge_order_id=charge_order.id)
+        return item
 
-        except Exception as e:
-            logger.error(f"Error creating charge order: {str(e)}")
+
+class ChargeOrderStatusView(APIView):
+    permission_classes = [IsSellerUser]
+
+    @extend_schema(responses=ChargeOrderStatusSerializer)
+    def get(self, request, pk):
+        charge_order = (
+            ChargeOrder.objects.select_related("job", "transaction")
+            .filter(seller=request.user.seller, pk=pk)
+            .first()
+        )
+        if charge_order is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        return Response(
+            ChargeOrderStatusSerializer(charge_order).data, status=status.HTTP_200_OK
+        )
 
 
 class ChargeOrderListView(APIView):
     permission_classes = [IsSellerUser]
 
     def get(self, request):
-        queryset = ChargeOrder.objects.select_related("seller", "phone_number").filter(
-            seller=request.user.seller
+        seller_id, etag = ledger_etag(
+            request.accepted_renderer.media_type, user=request.user
+        )
+        if seller_id is None:
+            raise PermissionDenied()
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        queryset = ChargeOrder.objects.filter(seller_id=seller_id)
+
+        # Render Straight From Row Tuples, The Cursor Also Needs created_at
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(
+            charge_order_values.values(queryset, "created_at"), request, view=self
+        )
+        return with_etag(
+            paginator.get_paginated_response(charge_order_values.render(page)), etag
         )
-
-        serializer = ChargeOrderSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 class TransactionReadOnlyViewSet(
@@ -214,38 +563,133 @@ class TransactionReadOnlyViewSet(
         "seller", "phone_number", "credit_request", "charge_order"
     ).all()
     serializer_class = TransactionSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        transaction_type = self.request.query_params.get("type", None)
-        seller = self.request.query_params.get("seller", None)
-        phone_number = self.request.query_params.get("phone_number", None)
-
-        if transaction_type:
-            queryset = queryset.filter(transaction_type=transaction_type)
+        return filter_transactions(queryset, self.request.query_params)
+
+    def get_archive_queryset(self):
+        """Archived rows matching the filters, or None when the range stays live."""
+        if not needs_archive(self.request.query_params):
+            return None
+        return filter_transactions(
+            ArchivedTransaction.objects.all(), self.request.query_params
+        )
 
-        if seller:
-            queryset = queryset.filter(seller=seller)
+    def list(self, request, *args, **kwargs):
+        # Only A Single Seller's Listing Has A Version To Key An ETag On
+        etag = None
+        seller = request.query_params.get("seller", "")
+        if seller.isdigit():
+            _, etag = ledger_etag(request.accepted_renderer.media_type, id=seller)
+            response = not_modified(request, etag)
+            if response is not None:
+                return response
+
+        querysets = [self.get_queryset(), self.get_archive_queryset()]
+        page = self.paginator.paginate_querysets(
+            [
+                transaction_values.values(queryset)
+                for queryset in querysets
+                if queryset is not None
+            ],
+            request,
+            view=self,
+        )
+        return with_etag(
+            self.get_paginated_response(transaction_values.render(page)), etag
+        )
 
-        if phone_number:
-            queryset = queryset.filter(phone_number=phone_number)
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            archived = transaction_values.values(
+                ArchivedTransaction.objects.filter(pk=kwargs["pk"])
+            )
+            data = transaction_values.render(archived)
+            if not data:
+                raise
+            return Response(data[0])
 
-        return queryset
+    @action(
+        detail=False,
+        methods=["get"],
+        # Basic First, So Scripts Without Credentials Get A 401 Challenge
+        authentication_classes=[BasicAuthentication, SessionAuthentication],
+        permission_classes=[IsAuthenticated],
+    )
+    def export(self, request):
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {"output": f"Choose one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        encode, content_type = EXPORT_FORMATS[output]
+
+        queryset = self.get_queryset()
+        archive_queryset = self.get_archive_queryset()
+        # Admins Export Every Ledger, Sellers Only Their Own
+        if not request.user.is_staff:
+            seller_id = (
+                Seller.objects.filter(user=request.user)
+                .values_list("id", flat=True)
+                .first()
+            )
+            if seller_id is None:
+                raise PermissionDenied()
+            queryset = queryset.filter(seller_id=seller_id)
+            if archive_queryset is not None:
+                archive_queryset = archive_queryset.filter(seller_id=seller_id)
+
+        rows = export_rows(queryset)
+        if archive_queryset is not None:
+            rows = merge_by_id(export_rows(archive_queryset), rows)
+        response = StreamingHttpResponse(encode(rows), content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="transactions.{output}"'
+        )
+        return response
 
     @action(detail=False, methods=["get"])
     def summary(self, request):
-        from django.db.models import Count, Sum
-
-        summary = (
-            self.get_queryset()
-            .values("transaction_type")
-            .annotate(
-                count=Count("id"),
-                total_amount=Sum("amount"),  # Assuming you have an amount field
+        summaries = filter_daily_summaries(
+            TransactionDailySummary.objects.all(), request.query_params
+        )
+        if summaries is not None:
+            row = summaries.order_by().aggregate(**DAILY_SUMMARY_AGGREGATES)
+            return Response(merge_totals([row]))
+
+        # Phone Number And Status Filters Need The Ledger Itself
+        querysets = [self.get_queryset(), self.get_archive_queryset()]
+        return Response(
+            merge_totals(
+                queryset.order_by().aggregate(**LEDGER_AGGREGATES)
+                for queryset in querysets
+                if queryset is not None
             )
         )
 
-        return Response(summary)
+    @action(
+        detail=False,
+        methods=["get"],
+        authentication_classes=[BasicAuthentication, SessionAuthentication],
+        permission_classes=[IsAdminUser],
+    )
+    def changes(self, request):
+        # New Events After ?since=, Read Off The Outbox In Commit Order
+        queryset = LedgerEvent.objects.all()
+        seller = request.query_params.get("seller", None)
+        if seller:
+            queryset = queryset.filter(seller=parse_id(seller, "seller"))
+
+        paginator = ChangeFeedPagination()
+        page = paginator.paginate_queryset(
+            ledger_event_values.values(queryset), request, view=self
+        )
+        return paginator.get_paginated_response(ledger_event_values.render(page))
 
 
 # TODO:
@@ -253,5 +697,4 @@ class TransactionReadOnlyViewSet(
 # - Implement permissions for requests
 # - Implement race conditions for requests
 # - Implement spending double for requests with reddis
-# - Implement multiprocessing for requests with reddis
 # - Implement tests for requests
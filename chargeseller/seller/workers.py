@@ -0,0 +1,42 @@
+import logging
+import os
+import socket
+import time
+
+from django.db import close_old_connections
+
+from .models import ChargeJob
+
+logger = logging.getLogger(__name__)
+
+
+def worker_name(index):
+    return f"{socket.gethostname()}-{os.getpid()}-{index}"
+
+
+def run_charge_worker(index, batch_size, poll_interval, stop_when_idle=False):
+    """Claim and settle charge jobs until stopped.
+
+    Returns the number of jobs settled. With ``stop_when_idle`` the worker
+    exits as soon as the queue is empty instead of polling.
+    """
+    name = worker_name(index)
+    settled = 0
+    while True:
+        close_old_connections()
+        job_ids = ChargeJob.claim_batch(name, batch_size)
+        if not job_ids:
+            if stop_when_idle:
+                return settled
+            time.sleep(poll_interval)
+            continue
+
+        try:
+            ChargeJob.settle_batch(job_ids)
+        except Exception as e:
+            logger.error(f"Error settling charge jobs {job_ids}: {str(e)}")
+            ChargeJob.release_batch(job_ids, str(e))
+            continue
+
+        settled += len(job_ids)
+        logger.info(f"Worker {name} settled {len(job_ids)} charge jobs")